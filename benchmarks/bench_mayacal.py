@@ -0,0 +1,427 @@
+"""Benchmarks for the mayacal hot paths
+
+Times each workload, records its peak traced memory and writes the results as
+JSON. Run from the repository root with:
+
+    python -m benchmarks.bench_mayacal --output bench.json
+
+Pass --compare with a previous results file to flag workloads that became
+slower than the allowed threshold (exits with status 1 if any did). The time
+taken to import the package is also measured in fresh interpreters, and the
+run exits with status 1 if it is above IMPORT_BUDGETS_MS.
+"""
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+try:
+    import numpy
+except ImportError:  # numpy is an optional dependency
+    numpy = None
+
+import mayacal as mc
+from mayacal.utils.utils import _convert_julian_day
+
+# Number of kin in 14 Bak'tuns, the range searched by the inference routines
+MAX_KIN = 14 * 144000
+
+# Maximum time in milliseconds for each import statement, on top of the
+# interpreter start up. Short-lived scripts and CLI calls pay this on every run.
+IMPORT_BUDGETS_MS = {
+    "import mayacal": 20.0,
+    "from mayacal import Mayadate": 45.0,
+}
+
+
+def _random_kin(n, seed=0):
+    rng = random.Random(seed)
+    return [rng.randrange(0, MAX_KIN) for _ in range(n)]
+
+
+def _partial_dates(num_missing, n, seed=0):
+    """Builds n dates with a full Calendar Round and num_missing unknown positions"""
+
+    rng = random.Random(seed)
+    dates = []
+    for k in _random_kin(n, seed):
+        lc = mc.kin_to_long_count(k)
+        digits = lc.to_list()
+        for idx in rng.sample(range(5), num_missing):
+            digits[idx] = None
+        dates.append(mc.Mayadate(mc.LongCount(*digits), lc.get_calendar_round()))
+
+    return dates
+
+
+def _add_days_loop(start, n):
+    """Builds n consecutive dates one day apart with add_days"""
+
+    dates = [start]
+    for _ in range(n - 1):
+        dates.append(dates[-1].add_days(1))
+
+    return [(d.calendar_round, d.glyph_g) for d in dates]
+
+
+def _workloads(scale):
+    """Returns a list of (name, setup, run, n_items) benchmark definitions
+
+    setup() builds the inputs outside of the timed region and run(inputs)
+    executes the workload once. Workloads that require numpy are left out if
+    it is not installed.
+    """
+    n = max(1, int(10000 * scale))
+    n_small = max(1, int(200 * scale))
+
+    workloads = [
+        (
+            "kin_to_long_count",
+            lambda: _random_kin(n),
+            lambda kins: [mc.kin_to_long_count(k) for k in kins],
+            n,
+        ),
+        (
+            "LongCount.get_calendar_round",
+            lambda: [mc.kin_to_long_count(k) for k in _random_kin(n)],
+            lambda lcs: [lc.get_calendar_round() for lc in lcs],
+            n,
+        ),
+        (
+            "Mayadate.__init__",
+            lambda: [mc.kin_to_long_count(k) for k in _random_kin(n)],
+            lambda lcs: [mc.Mayadate(lc) for lc in lcs],
+            n,
+        ),
+        (
+            "sorted[LongCount]",
+            lambda: [mc.LongCount(*mc.kin_to_long_count(k)) for k in _random_kin(n)],
+            sorted,
+            n,
+        ),
+        (
+            "set[Mayadate]",
+            lambda: [mc.kin_to_long_count(k).get_mayadate() for k in _random_kin(n)],
+            set,
+            n,
+        ),
+        (
+            "CalendarRound.get_long_count_possibilities",
+            lambda: [
+                mc.kin_to_long_count(k).get_calendar_round()
+                for k in _random_kin(n_small)
+            ],
+            lambda crs: [
+                cr.get_long_count_possibilities(
+                    mc.LongCount(0, 0, 0, 0, 0), mc.LongCount(13, 19, 19, 17, 19)
+                )
+                for cr in crs
+            ],
+            n_small,
+        ),
+    ]
+
+    for num_missing in (1, 2, 3, 4):
+        workloads.append(
+            (
+                f"Mayadate.infer_long_count_dates[{num_missing}_missing]",
+                lambda num_missing=num_missing: _partial_dates(num_missing, n_small),
+                lambda dates: [d.infer_long_count_dates() for d in dates],
+                n_small,
+            )
+        )
+
+    workloads += [
+        (
+            "Mayadate.add_days[loop]",
+            lambda: mc.LongCount(9, 12, 0, 0, 0).get_mayadate(),
+            lambda start: _add_days_loop(start, n),
+            n,
+        ),
+        (
+            "date_range[mayadate]",
+            lambda: mc.LongCount(9, 12, 0, 0, 0).get_mayadate(),
+            lambda start: list(mc.date_range(start, start.add_days(n))),
+            n,
+        ),
+        (
+            "date_range[long_count]",
+            lambda: mc.LongCount(9, 12, 0, 0, 0),
+            lambda start: list(mc.date_range(start, start.add_days(n))),
+            n,
+        ),
+        (
+            "date_range[tuples]",
+            lambda: mc.LongCount(9, 12, 0, 0, 0).get_mayadate(),
+            lambda start: list(mc.date_range(start, start.add_days(n), as_tuples=True)),
+            n,
+        ),
+        (
+            "_convert_julian_day[gregorian]",
+            lambda: [k + 584283 for k in _random_kin(n)],
+            lambda jds: [_convert_julian_day(jd, "gregorian") for jd in jds],
+            n,
+        ),
+        (
+            "_convert_julian_day[julian]",
+            lambda: [k + 584283 for k in _random_kin(n)],
+            lambda jds: [_convert_julian_day(jd, "julian") for jd in jds],
+            n,
+        ),
+        (
+            "LongCount.supplementary_series",
+            lambda: [mc.kin_to_long_count(k) for k in _random_kin(n)],
+            lambda lcs: [
+                (
+                    lc.get_lord_of_the_night(),
+                    lc.get_819_station(),
+                    lc.get_819_direction(),
+                    lc.get_moon_age(),
+                )
+                for lc in lcs
+            ],
+            n,
+        ),
+        (
+            "GregorianDate.to_mayadate",
+            lambda: [mc.kin_to_long_count(k).to_gregorian() for k in _random_kin(n)],
+            lambda dates: [d.to_mayadate() for d in dates],
+            n,
+        ),
+        (
+            "MayadateIndex.match",
+            lambda: (
+                mc.MayadateIndex(_partial_dates(2, n)),
+                _partial_dates(3, n_small, seed=1),
+            ),
+            lambda inputs: [inputs[0].match(q) for q in inputs[1]],
+            n_small,
+        ),
+        (
+            "parse_mayadates",
+            lambda: [repr(d) for d in _partial_dates(1, n)],
+            lambda lines: mc.parse_mayadates(lines),
+            n,
+        ),
+        (
+            "from_dict",
+            lambda: [
+                mc.kin_to_long_count(k).get_mayadate().to_dict() for k in _random_kin(n)
+            ],
+            lambda dicts: [mc.from_dict(d) for d in dicts],
+            n,
+        ),
+    ]
+
+    # workloads of the array based features, which require numpy
+    if numpy is not None:
+        workloads += [
+            (
+                "correlation_sweep[8_correlations]",
+                lambda: [mc.kin_to_long_count(k) for k in _random_kin(n)],
+                lambda lcs: mc.correlation_sweep(lcs, range(584280, 584288)),
+                n * 8,
+            ),
+            (
+                "parse_mayadates[columnar]",
+                lambda: [repr(d) for d in _partial_dates(1, n)],
+                lambda lines: mc.parse_mayadates(lines, columnar=True),
+                n,
+            ),
+        ]
+
+    return workloads
+
+
+def run_benchmarks(scale=1.0, repeat=5, select=None):
+    """Runs the benchmark workloads
+
+    Args:
+        scale (float): Multiplier for the number of items in each workload.
+            Defaults to 1.0.
+        repeat (int): Number of timed runs per workload. Defaults to 5.
+        select (str or NoneType): If given, only runs workloads whose name
+            contains this string
+
+    Returns:
+        (dict): Machine readable results, including the best and median wall
+            time and the peak traced memory of each workload
+
+    """
+    results = []
+    for name, setup, run, n_items in _workloads(scale):
+        if select is not None and select not in name:
+            continue
+
+        inputs = setup()
+
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            run(inputs)
+            timings.append(time.perf_counter() - start)
+
+        tracemalloc.start()
+        run(inputs)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        best = min(timings)
+        results.append(
+            {
+                "name": name,
+                "n_items": n_items,
+                "repeat": repeat,
+                "best_s": best,
+                "median_s": statistics.median(timings),
+                "per_item_us": best / n_items * 1e6,
+                "peak_memory_bytes": peak,
+            }
+        )
+
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "scale": scale,
+        "results": results,
+    }
+
+
+def measure_import_time(statement, repeat=5):
+    """Measures the time taken by an import statement in a fresh interpreter
+
+    Args:
+        statement (str): The import statement, e.g. "import mayacal"
+        repeat (int): Number of interpreters started. Defaults to 5.
+
+    Returns:
+        (float): The best time in milliseconds, minus the best time taken to
+            start an interpreter that runs nothing
+
+    """
+
+    def best_run(code):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            subprocess.run([sys.executable, "-c", code], check=True)
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    return max(0.0, best_run(statement) - best_run("pass")) * 1e3
+
+
+def run_import_benchmarks(repeat=5):
+    """Measures the import time of the statements in IMPORT_BUDGETS_MS
+
+    Args:
+        repeat (int): Number of interpreters started per statement. Defaults
+            to 5.
+
+    Returns:
+        (list): A dictionary per statement with the best time, the budget and
+            whether the time is within the budget
+
+    """
+    results = []
+    for statement, budget in IMPORT_BUDGETS_MS.items():
+        best = measure_import_time(statement, repeat)
+        results.append(
+            {
+                "statement": statement,
+                "best_ms": best,
+                "budget_ms": budget,
+                "within_budget": best <= budget,
+            }
+        )
+
+    return results
+
+
+def compare_results(current, baseline, threshold=1.25):
+    """Finds workloads that are slower than in a baseline run
+
+    Args:
+        current (dict): Results from run_benchmarks
+        baseline (dict): Earlier results from run_benchmarks
+        threshold (float): Maximum allowed ratio of current to baseline time
+            per item. Defaults to 1.25.
+
+    Returns:
+        (list): (name, ratio) tuples for the workloads above the threshold
+
+    """
+    baseline_times = {r["name"]: r["per_item_us"] for r in baseline["results"]}
+
+    regressions = []
+    for r in current["results"]:
+        base = baseline_times.get(r["name"])
+        if base:
+            ratio = r["per_item_us"] / base
+            if ratio > threshold:
+                regressions.append((r["name"], ratio))
+
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-o", "--output", help="Write JSON results to this file")
+    parser.add_argument("--scale", type=float, default=1.0)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("-k", "--select", help="Only run matching workloads")
+    parser.add_argument("--compare", help="Baseline JSON results to compare with")
+    parser.add_argument("--threshold", type=float, default=1.25)
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.scale, args.repeat, args.select)
+    results["imports"] = run_import_benchmarks(args.repeat)
+
+    for r in results["results"]:
+        print(
+            f"{r['name']:<55} {r['per_item_us']:>10.2f} us/item "
+            f"{r['peak_memory_bytes'] / 1024:>10.1f} KiB peak",
+            file=sys.stderr,
+        )
+    for r in results["imports"]:
+        print(
+            f"{r['statement']:<55} {r['best_ms']:>10.2f} ms "
+            f"(budget {r['budget_ms']:.0f} ms)",
+            file=sys.stderr,
+        )
+
+    over_budget = [r for r in results["imports"] if not r["within_budget"]]
+    for r in over_budget:
+        print(f"IMPORT OVER BUDGET {r['statement']}", file=sys.stderr)
+
+    if args.output:
+        with open(args.output, "w") as fh:
+            json.dump(results, fh, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+
+    if args.compare:
+        with open(args.compare) as fh:
+            baseline = json.load(fh)
+
+        regressions = compare_results(results, baseline, args.threshold)
+        for name, ratio in regressions:
+            print(f"REGRESSION {name}: {ratio:.2f}x slower", file=sys.stderr)
+
+        if regressions:
+            return 1
+
+    return 1 if over_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,16 +1,57 @@
-from .utils.haab import Haab, HAAB_MONTHS
-from .utils.tzolkin import Tzolkin, TZOLKIN_DAYS
-from .utils.calendar_round import CalendarRound
-from .utils.long_count import LongCount, DistanceNumber, kin_to_long_count
-from .utils.mayadate import Mayadate, from_dict
+import os as _os
+from importlib import import_module as _import_module
 
+# Public names and the module defining them. Modules are only imported when
+# one of their names is first used, so that importing mayacal is cheap for
+# short-lived processes that only need part of the package.
+_LAZY_NAMES = {
+    "Haab": "haab",
+    "HAAB_MONTHS": "haab",
+    "Tzolkin": "tzolkin",
+    "TZOLKIN_DAYS": "tzolkin",
+    "CalendarRound": "calendar_round",
+    "LongCount": "long_count",
+    "DistanceNumber": "long_count",
+    "kin_to_long_count": "long_count",
+    "LongCountArray": "long_count_array",
+    "correlation_sweep": "long_count_array",
+    "Mayadate": "mayadate",
+    "from_dict": "mayadate",
+    "batch_infer": "batch",
+    "InferenceResult": "batch",
+    "date_range": "ranges",
+    "MayadateStore": "store",
+    "write_store": "store",
+    "MayadateIndex": "date_index",
+    "parse_mayadate": "parsing",
+    "parse_mayadates": "parsing",
+}
 
-from .utils import *
+# Submodules of mayacal.utils that are also available as attributes of mayacal
+_LAZY_SUBMODULES = (
+    "batch",
+    "calendar_round",
+    "date_index",
+    "haab",
+    "inference",
+    "long_count",
+    "long_count_array",
+    "mayadate",
+    "parsing",
+    "ranges",
+    "records",
+    "store",
+    "stream",
+    "supplementary",
+    "tzolkin",
+)
 
 __all__ = [
     "Mayadate",
     "LongCount",
     "DistanceNumber",
+    "LongCountArray",
+    "correlation_sweep",
     "CalendarRound",
     "Haab",
     "Tzolkin",
@@ -19,4 +60,47 @@ __all__ = [
     "HAAB_MONTHS",
     "TZOLKIN_DAYS",
     "from_dict",
+    "batch_infer",
+    "InferenceResult",
+    "date_range",
+    "MayadateStore",
+    "write_store",
+    "MayadateIndex",
+    "parse_mayadate",
+    "parse_mayadates",
 ]
+
+
+# mayacal.utils is the mayacal.utils.utils module (GregorianDate, JulianDate,
+# ...), as in earlier versions. The first import of the mayacal.utils package
+# sets it as the utils attribute, so the package is imported up front and the
+# attribute removed, leaving the name to __getattr__.
+_import_module(".utils", __name__)
+del utils
+
+
+def __getattr__(name):
+    if name in _LAZY_NAMES:
+        module = _import_module(f".utils.{_LAZY_NAMES[name]}", __name__)
+        value = getattr(module, name)
+    elif name in _LAZY_SUBMODULES:
+        value = _import_module(f".utils.{name}", __name__)
+    elif name == "utils":
+        value = _import_module(".utils.utils", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # cache the value so that later lookups do not go through __getattr__
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | set(_LAZY_SUBMODULES))
+
+
+if _os.environ.get("MAYACAL_INSTRUMENT", "0") not in ("", "0"):
+    from .utils.instrumentation import enable as _enable_instrumentation
+
+    _enable_instrumentation()
@@ -0,0 +1,104 @@
+"""Command line interface, run with python -m mayacal"""
+
+import argparse
+import logging
+import sys
+
+from .utils.stream import convert_jsonl, STREAM_MODES
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m mayacal",
+        description="Calendar functions for the classical Maya calendar",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    convert = subparsers.add_parser(
+        "convert",
+        help="Stream JSON Lines records in the Mayadate.to_dict format",
+        description="Reads JSON Lines records in the Mayadate.to_dict format "
+        "lazily and infers, converts or normalizes each one.",
+    )
+    convert.add_argument("input", help="Input JSON Lines file, or - for stdin")
+    convert.add_argument(
+        "-o", "--output", default="-", help="Output file, defaults to stdout"
+    )
+    convert.add_argument(
+        "-m", "--mode", choices=STREAM_MODES, default="infer", help="Defaults to infer"
+    )
+    convert.add_argument(
+        "-e",
+        "--errors",
+        default=None,
+        help="File for rejected records, which are otherwise logged to stderr",
+    )
+    convert.add_argument(
+        "--chunk-size",
+        type=int,
+        default=1000,
+        help="Number of records buffered per write, defaults to 1000",
+    )
+    convert.add_argument(
+        "--correlation",
+        type=int,
+        default=584283,
+        help="Correlation constant for convert mode, defaults to 584283",
+    )
+
+    serve = subparsers.add_parser(
+        "serve",
+        help="Run a local HTTP conversion and inference service",
+        description="Serves the /convert, /calendar-round, /infer and /stats "
+        "endpoints, batching concurrent requests.",
+    )
+    serve.add_argument(
+        "--host",
+        default="127.0.0.1",
+        help="Address to listen on, defaults to 127.0.0.1",
+    )
+    serve.add_argument(
+        "--port", type=int, default=8000, help="Port to listen on, defaults to 8000"
+    )
+    serve.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for inference, defaults to the number of CPUs",
+    )
+    serve.add_argument(
+        "--max-batch-size",
+        type=int,
+        default=64,
+        help="Maximum number of requests per batch, defaults to 64",
+    )
+
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        # imported here so that the other commands do not load asyncio
+        from .utils.server import serve as run_server
+
+        logging.basicConfig(level=logging.INFO)
+        run_server(args.host, args.port, args.workers, args.max_batch_size)
+
+        return 0
+
+    if args.command == "convert":
+        source = sys.stdin if args.input == "-" else args.input
+        destination = sys.stdout if args.output == "-" else args.output
+
+        _, num_failed = convert_jsonl(
+            source,
+            destination,
+            mode=args.mode,
+            errors=args.errors,
+            chunk_size=args.chunk_size,
+            correlation=args.correlation,
+        )
+
+        return 1 if num_failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
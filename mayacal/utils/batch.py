@@ -0,0 +1,108 @@
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from .long_count import kin_to_long_count
+from .mayadate import from_dict, _iter_kin_candidates
+from .records import _mayadate_to_row, _row_to_mayadate
+
+__all__ = ["batch_infer", "InferenceResult"]
+
+InferenceResult = namedtuple("InferenceResult", ["long_counts", "error"])
+InferenceResult.__doc__ = """Result of inferring the Long Count dates of one input date
+
+Attributes:
+    long_counts (list or NoneType): The matching LongCount objects, or None if
+        inference failed for this date
+    error (str or NoneType): Description of the failure, or None on success
+"""
+
+
+def batch_infer(dates, workers=None, chunksize=64):
+    """Infers the possible Long Count dates of many partial dates in parallel
+
+    Runs the equivalent of Mayadate.infer_long_count_dates for every input date
+    on a pool of worker processes. Dates are sent to the workers as small tuples
+    of integers and the results come back as total kin counts, keeping pickling
+    overhead low. A failure for one date is reported in its result instead of
+    stopping the batch.
+
+    Args:
+        dates (iterable): Mayadate objects, or dictionaries in the format
+            produced by Mayadate.to_dict
+        workers (int or NoneType): Number of worker processes. Defaults to the
+            number of CPUs. With 0 or 1 the dates are processed in the current
+            process.
+        chunksize (int): Number of dates sent to a worker at a time. Defaults
+            to 64.
+
+    Returns:
+        (list): One InferenceResult per input date, in input order
+
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    encoded = []
+    for date in dates:
+        try:
+            if isinstance(date, dict):
+                date = from_dict(date)
+            encoded.append(_encode_date(date))
+        except Exception as e:
+            encoded.append(_format_error(e))
+
+    if workers <= 1:
+        raw_results = map(_infer_encoded, encoded)
+        return [_decode_result(r) for r in raw_results]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        raw_results = executor.map(_infer_encoded, encoded, chunksize=chunksize)
+        return [_decode_result(r) for r in raw_results]
+
+
+def _encode_date(date):
+    """Packs a Mayadate into a tuple of small integers (or None) for pickling
+
+    The values are those of MAYADATE_COLUMNS, followed by the Supplementary
+    Series constraints of the date.
+    """
+    return (*_mayadate_to_row(date), date._supplementary)
+
+
+def _infer_encoded(encoded):
+    """Worker function, returns a tuple of total kin or an error message"""
+
+    if isinstance(encoded, str):
+        return encoded
+
+    try:
+        *row, supplementary = encoded
+        date = _row_to_mayadate(*row, override_coef_check=True)
+
+        long_count = date.long_count
+        if not long_count.has_missing():
+            return (long_count.get_total_kin(),)
+
+        return tuple(
+            _iter_kin_candidates(
+                long_count, date.calendar_round, date.glyph_g, supplementary
+            )
+        )
+    except Exception as e:
+        return _format_error(e)
+
+
+def _decode_result(raw_result):
+    """Converts a worker result into an InferenceResult"""
+
+    if isinstance(raw_result, str):
+        return InferenceResult(None, raw_result)
+
+    return InferenceResult([kin_to_long_count(k) for k in raw_result], None)
+
+
+def _format_error(error):
+    """Helper function to describe an exception as a string"""
+
+    return f"{type(error).__name__}: {error}"
@@ -1,7 +1,39 @@
-from .haab import Haab
+from array import array
+
+from .haab import Haab, HAAB_MONTH_TO_IDX
 from .tzolkin import Tzolkin, TZOLKIN_DAY_TO_NUM
+from .utils import _solve_congruences
+
+__all__ = [
+    "CalendarRound",
+    "CALENDAR_ROUND_LENGTH",
+    "CALENDAR_ROUND_TZOLKIN_NUMS",
+    "CALENDAR_ROUND_HAAB_NUMS",
+]
+
+# Module level constants
+CALENDAR_ROUND_LENGTH = 18980  # LCM of the 260 day Tzolkin and 365 day Haab
+
+# Tzolkin and Haab positions of the Long Count zero date 4 Ajaw 8 Kumk'u
+EPOCH_TZOLKIN_NUM = TZOLKIN_DAY_TO_NUM[(4, "Ajaw")]
+EPOCH_HAAB_NUM = 20 * HAAB_MONTH_TO_IDX["Kumku"] + 8
+
+
+def _cycle_table(start, length):
+    """Helper function giving (start + i) % length for each Calendar Round position
+
+    Built by rotating and repeating one cycle, which is much faster at import
+    time than computing every entry.
+    """
+    cycle = array("H", range(length))
+
+    return (cycle[start:] + cycle[:start]) * (CALENDAR_ROUND_LENGTH // length)
 
-__all__ = ["CalendarRound"]
+
+# Tzolkin (0-259, from 1 Imix) and Haab (0-364, from 0 Pop) numbers of each
+# position in the Calendar Round, indexed by total kin % 18,980
+CALENDAR_ROUND_TZOLKIN_NUMS = _cycle_table(EPOCH_TZOLKIN_NUM, 260)
+CALENDAR_ROUND_HAAB_NUMS = _cycle_table(EPOCH_HAAB_NUM, 365)
 
 
 class CalendarRound:
@@ -16,6 +48,8 @@ class CalendarRound:
 
     """
 
+    __slots__ = ("tzolkin", "haab", "valid")
+
     def __init__(self, tzolkin=None, haab=None, override_coef_check=False):
         """Creates a new CalendarRound object
 
@@ -51,6 +85,58 @@ class CalendarRound:
         if not override_coef_check and not self.valid:
             raise ValueError("Invalid Haab month coefficient, Tzolkin day name combo")
 
+    @classmethod
+    def from_index(cls, index):
+        """Creates a CalendarRound object from its position in the Calendar Round
+
+        Args:
+            index (int): Integer from 0-18979 representing days since 4 Ajaw
+                8 Kumk'u, i.e. the number of kin since 0.0.0.0.0 modulo 18,980
+
+        Returns:
+            (CalendarRound): The Calendar Round date at the given position
+
+        """
+        if not 0 <= index < CALENDAR_ROUND_LENGTH:
+            raise ValueError(
+                f"Invalid Calendar Round index, must be between 0 and {CALENDAR_ROUND_LENGTH - 1}"
+            )
+
+        return cls(
+            Tzolkin.of(CALENDAR_ROUND_TZOLKIN_NUMS[index]),
+            Haab.of(CALENDAR_ROUND_HAAB_NUMS[index]),
+        )
+
+    @property
+    def index(self):
+        """The position of the date in the Calendar Round, counting from 4 Ajaw 8 Kumk'u
+
+        Equal to the number of kin since 0.0.0.0.0 modulo 18,980 for every Long
+        Count date with this Calendar Round position. None if the Tzolkin and
+        Haab positions can never coincide.
+
+        """
+        if self.has_missing():
+            raise ValueError(
+                "Operation not valid for incomplete Calendar Round dates, try inferring the missing portions"
+            )
+
+        tzolkin_num = TZOLKIN_DAY_TO_NUM[
+            (self.tzolkin.day_number, self.tzolkin.day_name)
+        ]
+        haab_num = 20 * HAAB_MONTH_TO_IDX[self.haab.month_name] + self.haab.month_number
+
+        solution = _solve_congruences(
+            (tzolkin_num - EPOCH_TZOLKIN_NUM) % 260,
+            260,
+            (haab_num - EPOCH_HAAB_NUM) % 365,
+            365,
+        )
+        if solution is None:
+            return None
+
+        return solution[0]
+
     def has_missing(self):
         """Checks whether the Calendar Round has any missing components
 
@@ -76,8 +162,8 @@ class CalendarRound:
 
         """
         if in_place:
-            self.haab.add_days(num_days, True)
-            self.tzolkin.add_days(num_days, True)
+            self.haab = self.haab.add_days(num_days)
+            self.tzolkin = self.tzolkin.add_days(num_days)
 
             return self
 
@@ -144,33 +230,37 @@ class CalendarRound:
             (list): A list of LongCount objects representing the possible dates
 
         """
-        from .long_count import LongCount, kin_to_long_count
+        from .long_count import kin_to_long_count
 
-        min_cal_round = min_date.get_calendar_round()
-        init_num = TZOLKIN_DAY_TO_NUM[
-            (min_cal_round.tzolkin.day_number, min_cal_round.tzolkin.day_name)
-        ]
-        day_num = TZOLKIN_DAY_TO_NUM[(self.tzolkin.day_number, self.tzolkin.day_name)]
+        kin_range = self.get_kin_possibilities(
+            min_date.get_total_kin(), max_date.get_total_kin()
+        )
+
+        return [kin_to_long_count(k) for k in kin_range]
 
-        cycle_num = (day_num - init_num) % 260
+    def get_kin_possibilities(self, min_kin, max_kin):
+        """Finds day counts since 0.0.0.0.0 that correspond to the Calendar Round date
 
-        lc = min_date.add_days(cycle_num)
+        Solves the Tzolkin and Haab congruences directly with the Chinese
+        Remainder Theorem, rather than stepping through candidate dates.
 
-        count = 0
-        while True:
-            if lc.get_calendar_round().haab == self.haab:
-                break
-            count += 1
-            lc = lc.add_days(260)
+        Args:
+            min_kin (int): The earliest number of kin since 0.0.0.0.0 to check
+            max_kin (int): The latest number of kin since 0.0.0.0.0 to check
+
+        Returns:
+            (range): The arithmetic progression of matching kin counts between
+                min_kin and max_kin (inclusive), with step 18,980. Empty if the
+                Calendar Round position can never occur.
 
-        poss_dates = []
+        """
+        index = self.index
+        if index is None:
+            return range(0)
 
-        while True:
-            if lc > max_date:
-                return poss_dates
+        first = min_kin + (index - min_kin) % CALENDAR_ROUND_LENGTH
 
-            poss_dates.append(lc)
-            lc = lc.add_days(18980)  # LCM of 260 and 365
+        return range(first, max_kin + 1, CALENDAR_ROUND_LENGTH)
 
     def to_dict(self):
         """Returns a JSON style dictionary representation
@@ -0,0 +1,135 @@
+import json
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow is an optional dependency
+    pa = None
+    pq = None
+
+from .haab import HAAB_MONTHS
+from .records import MAYADATE_COLUMNS, _mayadate_to_row, _row_to_mayadate
+from .tzolkin import TZOLKIN_DAYS
+
+__all__ = [
+    "to_arrow",
+    "from_arrow",
+    "write_parquet",
+    "read_parquet",
+    "MAYADATE_COLUMNS",
+]
+
+# Names are stored as their index in these lists, which are saved in the
+# schema metadata so that files can be read without mayacal
+SCHEMA_METADATA = {
+    "mayacal.schema_version": "1",
+    "mayacal.day_names": json.dumps(TZOLKIN_DAYS),
+    "mayacal.month_names": json.dumps(HAAB_MONTHS),
+}
+
+
+def to_arrow(dates):
+    """Converts Maya dates to an Apache Arrow table
+
+    The table has one nullable int8 column per Long Count position, the
+    Tzolkin day number and day name, the Haab month number and month name, and
+    the Glyph G number. Day and month names are stored as their index in
+    TZOLKIN_DAYS and HAAB_MONTHS, and missing values as nulls. Requires pyarrow.
+
+    Args:
+        dates (iterable): Mayadate objects to convert, may be partial dates
+
+    Returns:
+        (pyarrow.Table): Table with the columns in MAYADATE_COLUMNS
+
+    """
+    _require_pyarrow("Arrow conversion")
+
+    columns = [[] for _ in MAYADATE_COLUMNS]
+    for date in dates:
+        for column, value in zip(columns, _mayadate_to_row(date)):
+            column.append(value)
+
+    return pa.table(
+        [pa.array(column, type=pa.int8()) for column in columns],
+        schema=_get_schema(),
+    )
+
+
+def from_arrow(table):
+    """Converts an Apache Arrow table created by to_arrow back to Maya dates
+
+    Requires pyarrow.
+
+    Args:
+        table (pyarrow.Table or pyarrow.RecordBatch): Table with the columns in
+            MAYADATE_COLUMNS
+
+    Returns:
+        (list): A list of Mayadate objects, one per row
+
+    """
+    _require_pyarrow("Arrow conversion")
+
+    missing = [name for name in MAYADATE_COLUMNS if name not in table.schema.names]
+    if missing:
+        raise ValueError(f"Table is missing the columns {', '.join(missing)}")
+
+    columns = [table.column(name).to_pylist() for name in MAYADATE_COLUMNS]
+
+    return [_row_to_mayadate(*row, override_coef_check=True) for row in zip(*columns)]
+
+
+def write_parquet(dates, path, **kwargs):
+    """Writes Maya dates to a Parquet file
+
+    Requires pyarrow.
+
+    Args:
+        dates (iterable): Mayadate objects to write, may be partial dates
+        path (str): Path of the Parquet file to write
+        **kwargs: Passed on to pyarrow.parquet.write_table, e.g. compression
+
+    """
+    _require_pyarrow("Parquet export")
+
+    pq.write_table(to_arrow(dates), path, **kwargs)
+
+
+def read_parquet(path):
+    """Reads Maya dates from a Parquet file written by write_parquet
+
+    Requires pyarrow.
+
+    Args:
+        path (str): Path of the Parquet file to read
+
+    Returns:
+        (list): A list of Mayadate objects, one per row
+
+    """
+    _require_pyarrow("Parquet import")
+
+    return from_arrow(pq.read_table(path, columns=list(MAYADATE_COLUMNS)))
+
+
+def _get_schema():
+    """Helper function to build the Arrow schema of a Maya date table"""
+
+    return pa.schema(
+        [pa.field(name, pa.int8()) for name in MAYADATE_COLUMNS],
+        metadata=SCHEMA_METADATA,
+    )
+
+
+def _require_pyarrow(feature):
+    """Raises an informative ImportError if pyarrow is not installed
+
+    Args:
+        feature (str): Name of the feature requiring pyarrow, used in the message
+
+    """
+    if pa is None:
+        raise ImportError(
+            f"{feature} requires pyarrow - install it with 'pip install mayacal[arrow]'"
+        )
@@ -0,0 +1,237 @@
+from bisect import bisect_left, bisect_right
+
+from .records import MAYADATE_COLUMNS
+
+__all__ = ["MayadateIndex"]
+
+# Composite keys indexed in addition to the individual fields, to find a small
+# starting set of candidates when a query has complete parts
+COMPOSITE_FIELDS = ("total_kin", "tzolkin", "haab", "calendar_round")
+
+INDEX_FIELDS = MAYADATE_COLUMNS + COMPOSITE_FIELDS
+
+_EMPTY = frozenset()
+
+
+class MayadateIndex:
+    """Inverted index over a corpus of (possibly partial) Maya dates
+
+    Each date is indexed by its Long Count positions, Tzolkin and Haab
+    components, Glyph G, and, where complete, its total kin count, Tzolkin,
+    Haab and Calendar Round positions. Queries follow the semantics of
+    Mayadate.match, with None in either the query or an indexed date matching
+    any value, but are answered by intersecting posting lists rather than
+    checking every date.
+
+    Dates should not be modified after they have been added to the index.
+    """
+
+    def __init__(self, dates=()):
+        """Creates a new MayadateIndex object
+
+        Args:
+            dates (iterable): Mayadate objects to add to the index. Defaults to
+                an empty index.
+
+        """
+        self._dates = []
+        self._postings = {field: {} for field in INDEX_FIELDS}
+        self._missing = {field: set() for field in INDEX_FIELDS}
+
+        # (total kin, id) pairs of the dates with complete Long Counts, sorted
+        # on demand for range queries
+        self._kin_order = []
+        self._kin_order_sorted = True
+
+        for date in dates:
+            self.add(date)
+
+    def add(self, date):
+        """Adds a date to the index
+
+        Args:
+            date (Mayadate): The date to add, may be a partial date
+
+        Returns:
+            (int): The id of the date, i.e. its position in the index
+
+        """
+        date_id = len(self._dates)
+        self._dates.append(date)
+
+        for field, value in _index_values(date).items():
+            if value is None:
+                self._missing[field].add(date_id)
+            else:
+                self._postings[field].setdefault(value, set()).add(date_id)
+
+            if field == "total_kin" and value is not None:
+                self._kin_order.append((value, date_id))
+                self._kin_order_sorted = False
+
+        return date_id
+
+    def match_ids(self, date, min_date=None, max_date=None):
+        """Finds the ids of the indexed dates matching a (partial) query date
+
+        Args:
+            date (Mayadate): The query date. None values match any value.
+            min_date (LongCount or Mayadate): If given, only dates with a
+                complete Long Count on or after this date are returned
+            max_date (LongCount or Mayadate): If given, only dates with a
+                complete Long Count on or before this date are returned
+
+        Returns:
+            (list): The ids of the matching dates in increasing order
+
+        """
+        constraints = [
+            (field, value)
+            for field, value in _index_values(date).items()
+            if value is not None
+        ]
+
+        candidate_sets = [
+            (self._postings[field].get(value, _EMPTY), self._missing[field])
+            for field, value in constraints
+        ]
+
+        if min_date is not None or max_date is not None:
+            candidates = self._ids_in_range(min_date, max_date)
+        else:
+            candidates = None
+
+        if candidate_sets:
+            smallest = min(candidate_sets, key=lambda s: len(s[0]) + len(s[1]))
+            if candidates is None or len(smallest[0]) + len(smallest[1]) < len(
+                candidates
+            ):
+                in_range = candidates
+                candidates = smallest[0] | smallest[1]
+                if in_range is not None:
+                    candidates &= in_range
+
+        if candidates is None:
+            return list(range(len(self._dates)))
+
+        return sorted(
+            date_id
+            for date_id in candidates
+            if all(
+                date_id in postings or date_id in missing
+                for postings, missing in candidate_sets
+            )
+        )
+
+    def match(self, date, min_date=None, max_date=None):
+        """Finds the indexed dates matching a (partial) query date
+
+        Gives the same results as checking Mayadate.match against every
+        indexed date.
+
+        Args:
+            date (Mayadate): The query date. None values match any value.
+            min_date (LongCount or Mayadate): If given, only dates with a
+                complete Long Count on or after this date are returned
+            max_date (LongCount or Mayadate): If given, only dates with a
+                complete Long Count on or before this date are returned
+
+        Returns:
+            (list): The matching Mayadate objects, in the order they were added
+
+        """
+        return [self._dates[i] for i in self.match_ids(date, min_date, max_date)]
+
+    def between(self, min_date=None, max_date=None):
+        """Finds the indexed dates with a complete Long Count in a range
+
+        Args:
+            min_date (LongCount or Mayadate): If given, the earliest date to
+                return
+            max_date (LongCount or Mayadate): If given, the latest date to
+                return
+
+        Returns:
+            (list): The Mayadate objects in the range, in chronological order
+
+        """
+        lo, hi = self._kin_range(min_date, max_date)
+
+        return [self._dates[date_id] for _, date_id in self._kin_order[lo:hi]]
+
+    def _ids_in_range(self, min_date, max_date):
+        """Helper function returning the set of ids with total kin in a range"""
+
+        lo, hi = self._kin_range(min_date, max_date)
+
+        return {date_id for _, date_id in self._kin_order[lo:hi]}
+
+    def _kin_range(self, min_date, max_date):
+        """Helper function to find the slice of _kin_order within a range"""
+
+        if not self._kin_order_sorted:
+            self._kin_order.sort()
+            self._kin_order_sorted = True
+
+        lo = 0
+        if min_date is not None:
+            lo = bisect_left(self._kin_order, (min_date.get_total_kin(), -1))
+
+        hi = len(self._kin_order)
+        if max_date is not None:
+            hi = bisect_right(self._kin_order, (max_date.get_total_kin(), float("inf")))
+
+        return lo, hi
+
+    def __len__(self):
+        return len(self._dates)
+
+    def __iter__(self):
+        return iter(self._dates)
+
+    def __getitem__(self, date_id):
+        return self._dates[date_id]
+
+    def __repr__(self):
+        return f"MayadateIndex({len(self._dates)} dates)"
+
+
+def _index_values(date):
+    """Helper function to get the indexed values of a date, None if missing"""
+
+    long_count = date.long_count
+    tzolkin = date.calendar_round.tzolkin
+    haab = date.calendar_round.haab
+
+    values = dict(
+        zip(
+            MAYADATE_COLUMNS,
+            long_count.to_list()
+            + [
+                tzolkin.day_number,
+                tzolkin.day_name,
+                haab.month_number,
+                haab.month_name,
+                date.glyph_g,
+            ],
+        )
+    )
+
+    tzolkin_key = None
+    if tzolkin.day_number is not None and tzolkin.day_name is not None:
+        tzolkin_key = (tzolkin.day_number, tzolkin.day_name)
+
+    haab_key = None
+    if haab.month_number is not None and haab.month_name is not None:
+        haab_key = (haab.month_number, haab.month_name)
+
+    values["total_kin"] = (
+        None if long_count.has_missing() else long_count.get_total_kin()
+    )
+    values["tzolkin"] = tzolkin_key
+    values["haab"] = haab_key
+    values["calendar_round"] = (
+        None if tzolkin_key is None or haab_key is None else (tzolkin_key, haab_key)
+    )
+
+    return values
@@ -25,6 +25,9 @@ HAAB_MONTHS = [
 HAAB_IDX_TO_MONTH = {idx: month for idx, month in enumerate(HAAB_MONTHS)}
 HAAB_MONTH_TO_IDX = {month: idx for idx, month in HAAB_IDX_TO_MONTH.items()}
 
+HAAB_MONTH_NUMBERS = range(20)
+WAYEB_NUMBERS = range(5)
+
 
 class Haab:
     """Represents a month number, month name combination in the 365 day count
@@ -35,6 +38,8 @@ class Haab:
 
     """
 
+    __slots__ = ("month_number", "month_name", "haab_num")
+
     def __init__(self, month_number=None, month_name=None):
         """Creates a new Haab object
 
@@ -54,11 +59,11 @@ class Haab:
         self.month_name = month_name
 
         if month_name == "Wayeb":
-            if month_number not in list(range(5)):
+            if month_number not in WAYEB_NUMBERS:
                 raise ValueError(
                     "Invalid Haab month number, Wayeb number must be between 0 and 4"
                 )
-        elif month_number not in list(range(20)) and month_number is not None:
+        elif month_number not in HAAB_MONTH_NUMBERS and month_number is not None:
             raise ValueError(
                 "Invalid Haab month number, must be an integer between 0 and 19 or NoneType"
             )
@@ -70,6 +75,34 @@ class Haab:
         else:
             self.haab_num = None
 
+    @classmethod
+    def of(cls, haab_num):
+        """Returns the shared, immutable Haab object for a position in the 365 day count
+
+        Each of the 365 possible Haab dates is created on first use and
+        reused, so repeated calls with the same number return the identical
+        object. The returned object cannot be modified: setting an attribute,
+        reset_by_haab_num and add_days with in_place=True raise AttributeError.
+        Calendar Rounds computed from Long Count dates, e.g. by
+        CalendarRound.from_index, are made of these objects.
+
+        Args:
+            haab_num (int): Integer from 0-364 representing days since 0 Pop.
+
+        Returns:
+            (Haab): The interned Haab object
+
+        """
+        if not 0 <= haab_num < 365:
+            raise ValueError("Invalid Haab number, must be between 0 and 364")
+
+        haab = _INTERNED_HAABS[haab_num]
+        if haab is None:
+            haab = _make_interned_haab(haab_num)
+            _INTERNED_HAABS[haab_num] = haab
+
+        return haab
+
     def has_missing(self):
         """Checks whether the month number or name is missing
 
@@ -87,7 +120,8 @@ class Haab:
         """Set the Haab object to a new position by its 365 day count number
 
         Note:
-            0 Pop is used as the reference 'Day 0' of the cycle
+            0 Pop is used as the reference 'Day 0' of the cycle. Interned
+            objects from Haab.of cannot be modified and raise AttributeError.
 
         Args:
             new_num (int): Integer from 0-365 representing new position in the
@@ -95,6 +129,7 @@ class Haab:
         """
         self.month_name = HAAB_IDX_TO_MONTH[new_num // 20]
         self.month_number = new_num % 20
+        self.haab_num = new_num
 
         return self
 
@@ -104,7 +139,9 @@ class Haab:
         Args:
             num_days (int): Number of days to add to the Haab object
             in_place (bool): Whether to modify the existing object or return a
-                new object. Defaults to False.
+                new object. Defaults to False. Interned objects from Haab.of,
+                including those in Calendar Rounds computed from Long Count
+                dates, cannot be modified and raise AttributeError.
 
         Returns:
             A new Haab object num_days ahead of the previous object
@@ -117,7 +154,7 @@ class Haab:
 
             return self
         else:
-            return Haab().reset_by_haab_num(new_num)
+            return Haab.of(new_num)
 
     def match(self, date):
         """Checks for a potential match with another Haab object
@@ -161,6 +198,9 @@ class Haab:
         return False
 
     def __eq__(self, date):
+        if self is date:
+            return True
+
         name_same = self.month_name == date.month_name
         num_same = self.month_number == date.month_number
 
@@ -174,3 +214,33 @@ class Haab:
 
     def __repr__(self):
         return f"{self.month_number} {self.month_name}"
+
+
+class _InternedHaab(Haab):
+    """Immutable Haab object shared through Haab.of"""
+
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        raise AttributeError(
+            "Interned Haab objects, e.g. from Haab.of or CalendarRound.from_index, "
+            "are immutable, use add_days without in_place and assign the result"
+        )
+
+    def __reduce__(self):
+        return (Haab.of, (self.haab_num,))
+
+
+def _make_interned_haab(haab_num):
+    """Helper function to build the interned Haab object for a position"""
+
+    haab = object.__new__(_InternedHaab)
+    object.__setattr__(haab, "month_name", HAAB_IDX_TO_MONTH[haab_num // 20])
+    object.__setattr__(haab, "month_number", haab_num % 20)
+    object.__setattr__(haab, "haab_num", haab_num)
+
+    return haab
+
+
+# Interned objects by Haab number, created on first use by Haab.of
+_INTERNED_HAABS = [None] * 365
@@ -0,0 +1,217 @@
+import heapq
+import itertools
+
+from .calendar_round import EPOCH_TZOLKIN_NUM, EPOCH_HAAB_NUM
+from .haab import HAAB_MONTH_TO_IDX
+from .supplementary import (
+    STATION_819_DIRECTIONS,
+    STATION_819_LENGTH,
+    STATION_819_OFFSET,
+)
+from .tzolkin import TZOLKIN_DAY_TO_IDX
+from .utils import _solve_congruences
+
+__all__ = ["iter_kin_solutions"]
+
+# Number of kin in one unit of each Long Count position (baktun ... kin)
+POSITION_KIN = (144000, 7200, 360, 20, 1)
+
+# Number of values searched for each missing Long Count position. Missing
+# Bak'tun numbers are searched from 0 to 13.
+POSITION_RANGES = (14, 20, 20, 18, 20)
+
+
+def iter_kin_solutions(
+    long_count,
+    calendar_round=None,
+    glyph_g=None,
+    min_kin=None,
+    max_kin=None,
+    station_819=None,
+    direction_819=None,
+):
+    """Finds day counts since 0.0.0.0.0 that match a partially known Maya date
+
+    Rather than enumerating every combination of the missing Long Count
+    positions, the known Tzolkin, Haab, Glyph G and 819 day count values are
+    turned into congruences on the total number of kin (modulo 13, 20, 365, 9
+    and 819, or 4 * 819 with a known station direction), which are
+    combined with the Chinese Remainder Theorem. The lowest run of missing Long
+    Count positions is then solved directly as an arithmetic progression, so
+    only the missing positions above it need to be enumerated.
+
+    Args:
+        long_count (LongCount): The (partial) Long Count date. Missing positions
+            are marked with None. Missing Bak'tun numbers are searched from 0
+            to 13.
+        calendar_round (CalendarRound or NoneType): The (partial) Calendar Round
+            position of the date, with None marking missing values.
+        glyph_g (str or NoneType): The Glyph G associated with the date, e.g. "G3"
+        min_kin (int or NoneType): If given, the smallest total kin to return
+        max_kin (int or NoneType): If given, the largest total kin to return
+        station_819 (int or NoneType): The number of days since the last station
+            of the 819 day count, from 0 to 818
+        direction_819 (str or NoneType): The direction of the last station of
+            the 819 day count, e.g. "east"
+
+    Yields:
+        (int): The matching numbers of kin since 0.0.0.0.0, in increasing order
+
+    """
+    constraints = _get_cycle_constraints(calendar_round, glyph_g)
+    constraints += _get_819_constraints(station_819, direction_819)
+
+    digits = long_count.to_list()
+    free = [idx for idx, d in enumerate(digits) if d is None]
+
+    if not free:
+        total_kin = sum(d * w for d, w in zip(digits, POSITION_KIN))
+        residues, modulus = _combine_constraints(constraints)
+        if total_kin % modulus in residues and _in_bounds(total_kin, min_kin, max_kin):
+            yield total_kin
+        return
+
+    # lowest contiguous run of missing positions, solved directly
+    run_end = free[-1]
+    run_start = run_end
+    while run_start - 1 in free:
+        run_start -= 1
+
+    run_kin = POSITION_KIN[run_end]
+    run_span = run_kin
+    for idx in range(run_start, run_end + 1):
+        run_span *= POSITION_RANGES[idx]
+
+    low_kin = sum(digits[idx] * POSITION_KIN[idx] for idx in range(run_end + 1, 5))
+    constraints.append(([low_kin], run_kin))
+    residues, modulus = _combine_constraints(constraints)
+    if not residues:
+        return
+
+    # missing positions above the run are enumerated, in increasing order
+    upper_free = [idx for idx in free if idx < run_start]
+    base_kin = low_kin + sum(
+        digits[idx] * POSITION_KIN[idx]
+        for idx in range(run_start)
+        if digits[idx] is not None
+    )
+
+    for combo in itertools.product(*(range(POSITION_RANGES[i]) for i in upper_free)):
+        start = base_kin + sum(d * POSITION_KIN[i] for d, i in zip(combo, upper_free))
+        lo, hi = start, start + run_span - run_kin
+
+        if min_kin is not None:
+            lo = max(lo, min_kin)
+        if max_kin is not None:
+            if start > max_kin:
+                return
+            hi = min(hi, max_kin)
+        if lo > hi:
+            continue
+
+        progressions = [
+            range(lo + (r - lo) % modulus, hi + 1, modulus) for r in residues
+        ]
+        if len(progressions) == 1:
+            yield from progressions[0]
+        else:
+            yield from heapq.merge(*progressions)
+
+
+def _get_cycle_constraints(calendar_round, glyph_g):
+    """Converts the known cycle positions of a date into congruences on total kin
+
+    Returns:
+        (list): A list of (residues, modulus) tuples. A total kin value matches
+            if it is congruent to one of the residues for every modulus.
+
+    """
+    constraints = []
+
+    if calendar_round is not None:
+        tzolkin = calendar_round.tzolkin
+        if tzolkin.day_number is not None:
+            constraints.append(
+                ([(tzolkin.day_number - 1 - EPOCH_TZOLKIN_NUM) % 13], 13)
+            )
+
+        if tzolkin.day_name is not None:
+            day_idx = TZOLKIN_DAY_TO_IDX[tzolkin.day_name]
+            constraints.append(([(day_idx - EPOCH_TZOLKIN_NUM) % 20], 20))
+
+        haab = calendar_round.haab
+        if haab.month_name is not None or haab.month_number is not None:
+            if haab.month_name is None:
+                haab_nums = range(haab.month_number, 365, 20)
+            else:
+                month_start = 20 * HAAB_MONTH_TO_IDX[haab.month_name]
+                if haab.month_number is None:
+                    haab_nums = range(month_start, min(month_start + 20, 365))
+                else:
+                    haab_nums = [month_start + haab.month_number]
+
+            constraints.append(([(h - EPOCH_HAAB_NUM) % 365 for h in haab_nums], 365))
+
+    if glyph_g is not None:
+        constraints.append(([int(glyph_g[1:]) % 9], 9))
+
+    return constraints
+
+
+def _get_819_constraints(station_819, direction_819):
+    """Converts the known 819 day count values into congruences on total kin
+
+    Returns:
+        (list): A list of (residues, modulus) tuples, as in _get_cycle_constraints
+
+    """
+    if direction_819 is None:
+        if station_819 is None:
+            return []
+        return [([(station_819 - STATION_819_OFFSET) % STATION_819_LENGTH], 819)]
+
+    # stations cycle through the four directions every 4 * 819 days
+    modulus = 4 * STATION_819_LENGTH
+    cycle_start = STATION_819_LENGTH * STATION_819_DIRECTIONS.index(direction_819)
+    days = range(STATION_819_LENGTH) if station_819 is None else [station_819]
+
+    return [([(cycle_start + d - STATION_819_OFFSET) % modulus for d in days], modulus)]
+
+
+def _combine_constraints(constraints):
+    """Combines a list of (residues, modulus) congruences into a single one
+
+    Returns:
+        A (residues, modulus) tuple, with residues a sorted list of the values
+            modulo the combined modulus that satisfy every congruence.
+
+    """
+    residues, modulus = [0], 1
+
+    for con_residues, con_modulus in constraints:
+        combined = []
+        new_modulus = None
+        for a in residues:
+            for b in con_residues:
+                solution = _solve_congruences(a, modulus, b, con_modulus)
+                if solution is not None:
+                    combined.append(solution[0])
+                    new_modulus = solution[1]
+
+        if new_modulus is None:
+            return [], 1
+
+        residues, modulus = sorted(set(combined)), new_modulus
+
+    return residues, modulus
+
+
+def _in_bounds(total_kin, min_kin, max_kin):
+    """Helper function to check optional lower and upper bounds"""
+
+    if min_kin is not None and total_kin < min_kin:
+        return False
+    if max_kin is not None and total_kin > max_kin:
+        return False
+
+    return True
@@ -0,0 +1,212 @@
+import functools
+import importlib
+import inspect
+import sys
+import time
+from contextlib import contextmanager
+
+__all__ = [
+    "enable",
+    "disable",
+    "is_enabled",
+    "instrumented",
+    "snapshot",
+    "reset",
+    "INSTRUMENTED_FUNCTIONS",
+]
+
+# (module, class or None, attribute) of the instrumented functions, keyed by
+# the name used in snapshots
+INSTRUMENTED_FUNCTIONS = {
+    "kin_to_long_count": ("mayacal.utils.long_count", None, "kin_to_long_count"),
+    "LongCount.get_calendar_round": (
+        "mayacal.utils.long_count",
+        "LongCount",
+        "get_calendar_round",
+    ),
+    "CalendarRound.add_days": (
+        "mayacal.utils.calendar_round",
+        "CalendarRound",
+        "add_days",
+    ),
+    "_convert_julian_day": ("mayacal.utils.utils", None, "_convert_julian_day"),
+    "iter_kin_solutions": ("mayacal.utils.inference", None, "iter_kin_solutions"),
+    "Mayadate.infer_long_count_dates": (
+        "mayacal.utils.mayadate",
+        "Mayadate",
+        "infer_long_count_dates",
+    ),
+    "Mayadate.infer_mayadates": (
+        "mayacal.utils.mayadate",
+        "Mayadate",
+        "infer_mayadates",
+    ),
+    "from_dict": ("mayacal.utils.mayadate", None, "from_dict"),
+}
+
+# name -> [number of calls, total seconds], kept across enable/disable
+_stats = {name: [0, 0.0] for name in INSTRUMENTED_FUNCTIONS}
+
+# name -> (original, wrapper) while instrumentation is enabled
+_patched = {}
+
+
+def enable():
+    """Starts counting calls and wall time of the functions in INSTRUMENTED_FUNCTIONS
+
+    The functions are replaced by timing wrappers in their defining module or
+    class and in every loaded mayacal module that imported them by name, so
+    the original functions run at full speed whenever instrumentation is
+    disabled. Times are inclusive of nested calls, e.g. the time of
+    iter_kin_solutions is also part of the time of Mayadate.infer_mayadates.
+    Calls made in worker processes, e.g. by batch_infer, are not counted.
+
+    Instrumentation can also be enabled for a whole run by setting the
+    MAYACAL_INSTRUMENT environment variable to 1 before importing mayacal.
+
+    """
+    if _patched:
+        return
+
+    for name, (module_name, class_name, attr) in INSTRUMENTED_FUNCTIONS.items():
+        owner = importlib.import_module(module_name)
+        if class_name is not None:
+            owner = getattr(owner, class_name)
+
+        original = owner.__dict__[attr]
+        wrapper = _wrap(original, _stats[name])
+        setattr(owner, attr, wrapper)
+        _patched[name] = (original, wrapper)
+
+    _replace_aliases({id(orig): wrap for orig, wrap in _patched.values()})
+
+
+def disable():
+    """Stops instrumentation and restores the original functions
+
+    The counters are kept until reset is called.
+
+    """
+    if not _patched:
+        return
+
+    for name, (original, _) in _patched.items():
+        module_name, class_name, attr = INSTRUMENTED_FUNCTIONS[name]
+        owner = importlib.import_module(module_name)
+        if class_name is not None:
+            owner = getattr(owner, class_name)
+        setattr(owner, attr, original)
+
+    _replace_aliases({id(wrap): orig for orig, wrap in _patched.values()})
+    _patched.clear()
+
+
+def is_enabled():
+    """Checks whether instrumentation is enabled
+
+    Returns:
+        (bool): True if the instrumented functions are currently wrapped
+
+    """
+    return bool(_patched)
+
+
+@contextmanager
+def instrumented(reset_stats=True):
+    """Context manager enabling instrumentation for the duration of a block
+
+    Args:
+        reset_stats (bool): Whether to reset the counters on entry. Defaults to
+            True.
+
+    Yields:
+        The snapshot function, to read the counters inside or after the block
+
+    """
+    was_enabled = is_enabled()
+    if reset_stats:
+        reset()
+    enable()
+    try:
+        yield snapshot
+    finally:
+        if not was_enabled:
+            disable()
+
+
+def snapshot():
+    """Returns the counters of the instrumented functions
+
+    Returns:
+        (dict): For each function called at least once, a dictionary with the
+            number of "calls", the "total_seconds" of wall time and the
+            "mean_us" per call in microseconds
+
+    """
+    return {
+        name: {
+            "calls": calls,
+            "total_seconds": seconds,
+            "mean_us": 1e6 * seconds / calls,
+        }
+        for name, (calls, seconds) in _stats.items()
+        if calls
+    }
+
+
+def reset():
+    """Sets all counters back to zero"""
+
+    for counters in _stats.values():
+        counters[0] = 0
+        counters[1] = 0.0
+
+
+def _wrap(func, counters):
+    """Helper function building a wrapper that updates counters on each call"""
+
+    perf_counter = time.perf_counter
+
+    if inspect.isgeneratorfunction(func):
+        # time spent producing each value, excluding the consumer's time
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            counters[0] += 1
+            iterator = func(*args, **kwargs)
+            while True:
+                start = perf_counter()
+                try:
+                    value = next(iterator)
+                except StopIteration:
+                    counters[1] += perf_counter() - start
+                    return
+                counters[1] += perf_counter() - start
+                yield value
+
+    else:
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                counters[0] += 1
+                counters[1] += perf_counter() - start
+
+    return wrapper
+
+
+def _replace_aliases(replacements):
+    """Helper function to swap functions imported by name into mayacal modules"""
+
+    for module_name, module in list(sys.modules.items()):
+        if module is None or not (
+            module_name == "mayacal" or module_name.startswith("mayacal.")
+        ):
+            continue
+
+        for attr, value in list(vars(module).items()):
+            replacement = replacements.get(id(value))
+            if replacement is not None:
+                setattr(module, attr, replacement)
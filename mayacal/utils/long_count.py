@@ -1,17 +1,43 @@
-from .calendar_round import CalendarRound
-from .tzolkin import Tzolkin
-from .haab import Haab
-from .utils import julian_day_to_julian, julian_day_to_gregorian
+from operator import attrgetter
+
+from .calendar_round import CalendarRound, CALENDAR_ROUND_LENGTH
+from .supplementary import (
+    STATION_819_COLORS,
+    STATION_819_DIRECTIONS,
+    days_since_819_station,
+    direction_819_index,
+    lord_of_the_night,
+    moon_age,
+)
+from .utils import JulianDate, GregorianDate
 
 __all__ = ["LongCount", "DistanceNumber", "kin_to_long_count"]
 
 
+def _position_property(attr):
+    """Helper function to create a Long Count position property
+
+    Setting the position clears the cached total kin count.
+    """
+
+    def setter(self, value):
+        setattr(self, attr, value)
+        self._total_kin = None
+
+    return property(attrgetter(attr), setter)
+
+
 class LongCount:
     """Represents a position in the Maya Long Count
 
     Valid for dates from 0.0.0.0.0 to 19.19.19.17.19. Use NoneType to mark
     missing positions in the date for later inference.
 
+    Complete dates cache their total kin count, which is used for hashing and
+    comparisons. Partial dates are hashed and compared for equality by their
+    positions, so they only equal dates with the same known and missing
+    positions. Dates used in sets or as dictionary keys should not be modified.
+
     Attributes:
         baktun (int or NoneType): The Bak'tun number of the Long Count date.
             Integer between 0 and 19 or None.
@@ -26,6 +52,8 @@ class LongCount:
 
     """
 
+    __slots__ = ("_baktun", "_katun", "_tun", "_winal", "_kin", "_total_kin")
+
     def __init__(self, baktun=None, katun=None, tun=None, winal=None, kin=None):
         """Creates a new LongCount object
 
@@ -44,48 +72,59 @@ class LongCount:
                 Integer between 0 and 19 or None.
 
         """
+        self._total_kin = None
+
         if baktun is not None and baktun >= 20:
             raise ValueError("Baktun must be between 0 and 19 or NoneType")
-        self.baktun = baktun
+        self._baktun = baktun
         if katun is not None and katun >= 20:
             raise ValueError("Katun must be between 0 and 19 or NoneType")
-        self.katun = katun
+        self._katun = katun
 
         if tun is not None and tun >= 20:
             raise ValueError("Tun must be between 0 and 19")
-        self.tun = tun
+        self._tun = tun
 
         if winal is not None and winal >= 18:
             raise ValueError("Winal must be between 0 and 17")
-        self.winal = winal
+        self._winal = winal
 
         if kin is not None and kin >= 20:
             raise ValueError("Kin must be between 0 and 19")
-        self.kin = kin
+        self._kin = kin
+
+    baktun = _position_property("_baktun")
+    katun = _position_property("_katun")
+    tun = _position_property("_tun")
+    winal = _position_property("_winal")
+    kin = _position_property("_kin")
 
     def get_total_kin(self):
         """Returns the total number of kin since the initial date 0.0.0.0.0
 
+        The result is cached until one of the positions is changed.
+
         Returns:
             (int): The number of kin since the initial date of the Mayan calendar.
 
         """
+        if self._total_kin is not None:
+            return self._total_kin
 
         if self.has_missing():
             raise ValueError(
                 "Operation not valid for incomplete Long Count dates, try inferring the missing portions"
             )
 
-        else:
-            total_kin = (
-                self.kin
-                + (self.winal * 20)
-                + (self.tun * 20 * 18)
-                + (self.katun * 18 * (20 ** 2))
-                + (self.baktun * 18 * (20 ** 3))
-            )
+        self._total_kin = (
+            self._kin
+            + (self._winal * 20)
+            + (self._tun * 20 * 18)
+            + (self._katun * 18 * (20**2))
+            + (self._baktun * 18 * (20**3))
+        )
 
-            return total_kin
+        return self._total_kin
 
     def get_calendar_round(self):
         """Returns the calendar round associated with the current LongCount object
@@ -96,11 +135,7 @@ class LongCount:
 
         """
 
-        # Mythological start date
-        initial_date = CalendarRound(Tzolkin(4, "Ajaw"), Haab(8, "Kumku"))
-        initial_date.add_days(self.get_total_kin(), True)
-
-        return initial_date
+        return CalendarRound.from_index(self.get_total_kin() % CALENDAR_ROUND_LENGTH)
 
     def get_mayadate(self):
         """Returns a Mayadate object from the current LongCount object
@@ -111,10 +146,7 @@ class LongCount:
         """
         from .mayadate import Mayadate
 
-        if self.has_missing():
-            return Mayadate(self, None, None)
-
-        return Mayadate(self, self.get_calendar_round(), None)
+        return Mayadate(self)
 
     def add_days(self, num_days, in_place=False):
         """Adds num_days days (kin) to the current LongCount object
@@ -156,6 +188,66 @@ class LongCount:
 
         return f"G{g_num}"
 
+    def get_lord_of_the_night(self):
+        """Calculates the number of the Lord of the Night of the Long Count date
+
+        The nine Lords of the Night are recorded by Glyph G, so this is the
+        number in get_glyph_g.
+
+        Returns:
+            (int): The number of the Lord of the Night, from 1 to 9
+
+        """
+        if self.winal is None or self.kin is None:
+            raise ValueError(
+                "Both the Winal and Kin numbers must be provided to infer the Lord of the Night"
+            )
+
+        return lord_of_the_night(self.winal * 20 + self.kin)
+
+    def get_819_station(self):
+        """Calculates the number of days since the last station of the 819 day count
+
+        Returns:
+            (int): The number of days since the station, from 0 to 818
+
+        """
+        return days_since_819_station(self.get_total_kin())
+
+    def get_819_direction(self):
+        """Calculates the direction of the last station of the 819 day count
+
+        Returns:
+            (str): The direction of the station, one of "east", "south", "west"
+                or "north"
+
+        """
+        return STATION_819_DIRECTIONS[direction_819_index(self.get_total_kin())]
+
+    def get_819_color(self):
+        """Calculates the color of the last station of the 819 day count
+
+        Returns:
+            (str): The color of the station's direction, e.g. "red" for east
+
+        """
+        return STATION_819_COLORS[self.get_819_direction()]
+
+    def get_moon_age(self, correlation=584283):
+        """Approximates the age of the moon on the Long Count date
+
+        By default uses the correlation constant 584,283 proposed by Thompson.
+
+        Args:
+            correlation (int): The correlation constant to use in the conversion.
+                Defaults to 584283.
+
+        Returns:
+            (float): The number of days since the last new moon
+
+        """
+        return moon_age(self.get_total_kin(), correlation)
+
     def to_list(self):
         """Returns a list representation of the LongCount object
 
@@ -196,9 +288,7 @@ class LongCount:
 
         """
 
-        julian_day = self.to_julian_day(correlation)
-
-        return julian_day_to_julian(julian_day)
+        return JulianDate.from_jdn(self.to_julian_day(correlation))
 
     def to_gregorian(self, correlation=584283):
         """Converts the Long Count date to its corresponding Gregorian calendar date
@@ -215,9 +305,7 @@ class LongCount:
 
         """
 
-        julian_day = self.to_julian_day(correlation)
-
-        return julian_day_to_gregorian(julian_day)
+        return GregorianDate.from_jdn(self.to_julian_day(correlation))
 
     def has_missing(self):
         """Checks whether the Long Count object has missing values in any position
@@ -321,35 +409,37 @@ class LongCount:
         else:
             return DistanceNumber(kin_to_long_count(kin_diff * -1), sign=-1)
 
+    def _hash_key(self):
+        """Returns the value that defines equality and hashing of the date
+
+        The total kin count for complete dates, or the tuple of positions for
+        partial dates.
+        """
+        if self._total_kin is not None or not self.has_missing():
+            return self.get_total_kin()
+
+        return tuple(self.to_list())
+
+    def __hash__(self):
+        return hash(self._hash_key())
+
     def __eq__(self, date):
-        if self.get_total_kin() == date.get_total_kin():
-            return True
-        else:
-            return False
+        if not hasattr(date, "_hash_key"):
+            return NotImplemented
+
+        return self._hash_key() == date._hash_key()
 
     def __gt__(self, date):
-        if self.get_total_kin() > date.get_total_kin():
-            return True
-        else:
-            return False
+        return self.get_total_kin() > date.get_total_kin()
 
     def __ge__(self, date):
-        if self.get_total_kin() >= date.get_total_kin():
-            return True
-        else:
-            return False
+        return self.get_total_kin() >= date.get_total_kin()
 
     def __lt__(self, date):
-        if self.get_total_kin() < date.get_total_kin():
-            return True
-        else:
-            return False
+        return self.get_total_kin() < date.get_total_kin()
 
     def __le__(self, date):
-        if self.get_total_kin() <= date.get_total_kin():
-            return True
-        else:
-            return False
+        return self.get_total_kin() <= date.get_total_kin()
 
     def __iter__(self):
         return iter(self.to_list())
@@ -371,6 +461,8 @@ class DistanceNumber(LongCount):
 
     """
 
+    __slots__ = ("long_count", "sign")
+
     def __init__(self, long_count=LongCount(), sign=1):
         """Creates a new DistanceNumber object
 
@@ -406,6 +498,13 @@ class DistanceNumber(LongCount):
         """
         return self.sign * super().get_total_kin()
 
+    def _hash_key(self):
+        key = super()._hash_key()
+        if type(key) is tuple:
+            return (self.sign,) + key
+
+        return key
+
     def to_approx_years(self, pretty_print=False):
         total_kin = abs(self.get_total_kin())
 
@@ -451,20 +550,19 @@ def kin_to_long_count(num_kin):
     if type(num_kin) is not int:
         num_kin = int(num_kin)
 
-    long_count = LongCount()
-
-    long_count.baktun = num_kin // (18 * (20 ** 3))
-    num_kin = num_kin - (long_count.baktun * 18 * (20 ** 3))
-
-    long_count.katun = num_kin // (18 * (20 ** 2))
-    num_kin = num_kin - (long_count.katun * 18 * (20 ** 2))
-
-    long_count.tun = num_kin // (18 * 20)
-    num_kin = num_kin - (long_count.tun * 18 * 20)
+    # positions are known to be valid, so skip the checks in __init__
+    long_count = LongCount.__new__(LongCount)
 
-    long_count.winal = num_kin // 20
-    num_kin = num_kin - (long_count.winal * 20)
+    baktun, remainder = divmod(num_kin, 18 * (20**3))
+    katun, remainder = divmod(remainder, 18 * (20**2))
+    tun, remainder = divmod(remainder, 18 * 20)
+    winal, kin = divmod(remainder, 20)
 
-    long_count.kin = num_kin
+    long_count._baktun = baktun
+    long_count._katun = katun
+    long_count._tun = tun
+    long_count._winal = winal
+    long_count._kin = kin
+    long_count._total_kin = num_kin
 
     return long_count
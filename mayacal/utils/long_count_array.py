@@ -0,0 +1,433 @@
+try:
+    import numpy as np
+except ImportError:  # numpy is an optional dependency
+    np = None
+
+from .long_count import DistanceNumber, kin_to_long_count
+from .supplementary import (
+    STATION_819_COLORS,
+    STATION_819_DIRECTIONS,
+    days_since_819_station,
+    direction_819_index,
+    lord_of_the_night,
+    moon_age,
+)
+from .utils import _require_numpy, julian_days_to_julian, julian_days_to_gregorian
+
+__all__ = ["LongCountArray", "correlation_sweep"]
+
+# Number of kin in one unit of each Long Count position
+KIN_PER_BAKTUN = 18 * (20**3)
+KIN_PER_KATUN = 18 * (20**2)
+KIN_PER_TUN = 18 * 20
+KIN_PER_WINAL = 20
+
+
+class LongCountArray:
+    """Represents a batch of complete Long Count dates backed by a numpy array
+
+    Dates are stored as an int64 array of total kin since 0.0.0.0.0, so that
+    conversions and arithmetic run as array operations rather than building one
+    LongCount object per date. LongCount objects are only created when a single
+    element is accessed. Requires numpy.
+
+    Attributes:
+        baktun (numpy.ndarray): The Bak'tun numbers of the Long Count dates
+        katun (numpy.ndarray): The K'atun numbers of the Long Count dates
+        tun (numpy.ndarray): The Tun numbers of the Long Count dates
+        winal (numpy.ndarray): The Winal numbers of the Long Count dates
+        kin (numpy.ndarray): The Kin numbers of the Long Count dates
+
+    """
+
+    # defer numpy binary operations to the LongCountArray operators
+    __array_ufunc__ = None
+
+    def __init__(self, total_kin):
+        """Creates a new LongCountArray object
+
+        Args:
+            total_kin (array_like): The number of kin since the Maya zero date
+                0.0.0.0.0 for each date. Values must be non-negative integers.
+
+        """
+        _require_numpy("LongCountArray")
+
+        total_kin = np.asarray(total_kin)
+        if total_kin.dtype.kind not in "iu":
+            if total_kin.size and not np.all(np.mod(total_kin, 1) == 0):
+                raise ValueError("Total kin values must be whole numbers")
+        total_kin = total_kin.astype(np.int64).reshape(-1)
+
+        if total_kin.size and total_kin.min() < 0:
+            raise ValueError("Total kin values must be greater than or equal to zero")
+
+        self._total_kin = total_kin
+        self._positions = None
+
+    @classmethod
+    def from_kin(cls, total_kin):
+        """Creates a LongCountArray from day counts since 0.0.0.0.0
+
+        Args:
+            total_kin (array_like): The number of kin since the Maya zero date
+                0.0.0.0.0 for each date
+
+        Returns:
+            (LongCountArray): The corresponding Long Count dates
+
+        """
+        return cls(total_kin)
+
+    @classmethod
+    def from_long_counts(cls, long_counts):
+        """Creates a LongCountArray from an iterable of LongCount objects
+
+        Args:
+            long_counts (iterable): Complete LongCount (or Mayadate) objects
+
+        Returns:
+            (LongCountArray): The corresponding Long Count dates
+
+        """
+        _require_numpy("LongCountArray")
+
+        return cls(np.fromiter((lc.get_total_kin() for lc in long_counts), np.int64))
+
+    @classmethod
+    def from_positions(cls, baktun, katun, tun, winal, kin):
+        """Creates a LongCountArray from arrays of Long Count positions
+
+        Args:
+            baktun (array_like): The Bak'tun numbers, between 0 and 19
+            katun (array_like): The K'atun numbers, between 0 and 19
+            tun (array_like): The Tun numbers, between 0 and 19
+            winal (array_like): The Winal numbers, between 0 and 17
+            kin (array_like): The Kin numbers, between 0 and 19
+
+        Returns:
+            (LongCountArray): The corresponding Long Count dates
+
+        """
+        _require_numpy("LongCountArray")
+
+        positions = [
+            np.asarray(p, dtype=np.int64) for p in (baktun, katun, tun, winal, kin)
+        ]
+        names = ("Baktun", "Katun", "Tun", "Winal", "Kin")
+        limits = (20, 20, 20, 18, 20)
+
+        for name, limit, values in zip(names, limits, positions):
+            if values.size and (values.min() < 0 or values.max() >= limit):
+                raise ValueError(f"{name} must be between 0 and {limit - 1}")
+
+        baktun, katun, tun, winal, kin = positions
+
+        return cls(
+            baktun * KIN_PER_BAKTUN
+            + katun * KIN_PER_KATUN
+            + tun * KIN_PER_TUN
+            + winal * KIN_PER_WINAL
+            + kin
+        )
+
+    def to_kin(self):
+        """Returns a copy of the total kin array
+
+        Returns:
+            (numpy.ndarray): int64 array of the number of kin since 0.0.0.0.0
+
+        """
+        return self._total_kin.copy()
+
+    def get_total_kin(self):
+        """Returns the total number of kin since the initial date 0.0.0.0.0
+
+        Mirrors LongCount.get_total_kin. The returned array is read-only and
+        shares memory with the LongCountArray.
+
+        Returns:
+            (numpy.ndarray): int64 array of the number of kin since 0.0.0.0.0
+
+        """
+        view = self._total_kin.view()
+        view.flags.writeable = False
+
+        return view
+
+    def to_positions(self):
+        """Returns the Long Count positions as a two dimensional array
+
+        Returns:
+            (numpy.ndarray): Array of shape (n, 5) with columns baktun, katun,
+                tun, winal, kin
+
+        """
+        return np.stack(self.__get_positions(), axis=1)
+
+    def to_julian_day(self, correlation=584283):
+        """Converts the Long Count dates to their corresponding Julian Day numbers
+
+        By default uses the correlation constant 584,283 proposed by Thompson.
+        If several correlation constants are given, every date is converted
+        with each of them in a single array operation.
+
+        Args:
+            correlation (int or array_like): The correlation constant to use in
+                the conversion, or a one dimensional sequence of correlation
+                constants. Defaults to 584283.
+
+        Returns:
+            (numpy.ndarray): int64 array of the Julian Day numbers associated with
+                the Long Count dates. Has shape (n_dates, n_correlations) if a
+                sequence of correlation constants was given.
+
+        """
+        if np.ndim(correlation) == 0:
+            return self._total_kin + correlation
+
+        return self._total_kin[:, np.newaxis] + _as_correlations(correlation)
+
+    def to_julian(self, correlation=584283):
+        """Converts the Long Count dates to their corresponding Julian calendar dates
+
+        By default uses the correlation constant 584,283 proposed by Thompson.
+
+        Args:
+            correlation (int or array_like): The correlation constant to use in
+                the conversion, or a one dimensional sequence of correlation
+                constants. Defaults to 584283.
+
+        Returns:
+            A (day, month, year) tuple of int64 numpy arrays in the Julian calendar,
+                each of shape (n_dates, n_correlations) if a sequence of
+                correlation constants was given
+
+        """
+        return julian_days_to_julian(self.to_julian_day(correlation))
+
+    def to_gregorian(self, correlation=584283):
+        """Converts the Long Count dates to their corresponding Gregorian calendar dates
+
+        By default uses the correlation constant 584,283 proposed by Thompson.
+
+        Args:
+            correlation (int or array_like): The correlation constant to use in
+                the conversion, or a one dimensional sequence of correlation
+                constants. Defaults to 584283.
+
+        Returns:
+            A (day, month, year) tuple of int64 numpy arrays in the Gregorian
+                calendar, each of shape (n_dates, n_correlations) if a sequence
+                of correlation constants was given
+
+        """
+        return julian_days_to_gregorian(self.to_julian_day(correlation))
+
+    def to_list(self):
+        """Returns a list of LongCount objects
+
+        Returns:
+            (list): A list with one LongCount object per date
+
+        """
+        return [kin_to_long_count(k) for k in self._total_kin.tolist()]
+
+    def get_lords_of_the_night(self):
+        """Calculates the Lord of the Night (Glyph G) number of each date
+
+        Returns:
+            (numpy.ndarray): int64 array of numbers from 1 to 9
+
+        """
+        return lord_of_the_night(self._total_kin)
+
+    def get_819_stations(self):
+        """Calculates the number of days since the last 819 day count station
+
+        Returns:
+            (numpy.ndarray): int64 array of numbers from 0 to 818
+
+        """
+        return days_since_819_station(self._total_kin)
+
+    def get_819_directions(self):
+        """Calculates the direction of the last 819 day count station
+
+        Returns:
+            (numpy.ndarray): Array of direction names, e.g. "east"
+
+        """
+        return np.array(STATION_819_DIRECTIONS)[direction_819_index(self._total_kin)]
+
+    def get_819_colors(self):
+        """Calculates the color of the last 819 day count station
+
+        Returns:
+            (numpy.ndarray): Array of color names, e.g. "red"
+
+        """
+        colors = np.array([STATION_819_COLORS[d] for d in STATION_819_DIRECTIONS])
+
+        return colors[direction_819_index(self._total_kin)]
+
+    def get_moon_ages(self, correlation=584283):
+        """Approximates the age of the moon on each date
+
+        By default uses the correlation constant 584,283 proposed by Thompson.
+
+        Args:
+            correlation (int): The correlation constant to use in the conversion.
+                Defaults to 584283.
+
+        Returns:
+            (numpy.ndarray): float64 array of the days since the last new moon
+
+        """
+        return moon_age(self._total_kin, correlation)
+
+    @property
+    def baktun(self):
+        return self.__get_positions()[0]
+
+    @property
+    def katun(self):
+        return self.__get_positions()[1]
+
+    @property
+    def tun(self):
+        return self.__get_positions()[2]
+
+    @property
+    def winal(self):
+        return self.__get_positions()[3]
+
+    @property
+    def kin(self):
+        return self.__get_positions()[4]
+
+    def __get_positions(self):
+        """Helper function to compute (and cache) the Long Count positions"""
+
+        if self._positions is None:
+            baktun, rem = np.divmod(self._total_kin, KIN_PER_BAKTUN)
+            katun, rem = np.divmod(rem, KIN_PER_KATUN)
+            tun, rem = np.divmod(rem, KIN_PER_TUN)
+            winal, kin = np.divmod(rem, KIN_PER_WINAL)
+
+            positions = (baktun, katun, tun, winal, kin)
+            for p in positions:
+                p.flags.writeable = False
+
+            self._positions = positions
+
+        return self._positions
+
+    def __other_kin(self, other):
+        """Helper function to get the kin value(s) of the other operand"""
+
+        if isinstance(other, LongCountArray):
+            return other._total_kin
+
+        if hasattr(other, "get_total_kin"):
+            return other.get_total_kin()
+
+        return np.asarray(other, dtype=np.int64)
+
+    def __add__(self, dist):
+        return LongCountArray(self._total_kin + self.__other_kin(dist))
+
+    def __radd__(self, dist):
+        return self.__add__(dist)
+
+    def __sub__(self, dist):
+        if hasattr(dist, "get_total_kin") and not isinstance(dist, DistanceNumber):
+            # difference between two dates, returned as signed day counts
+            return self._total_kin - self.__other_kin(dist)
+
+        return LongCountArray(self._total_kin - self.__other_kin(dist))
+
+    def __eq__(self, date):
+        return self._total_kin == self.__other_kin(date)
+
+    def __ne__(self, date):
+        return self._total_kin != self.__other_kin(date)
+
+    def __gt__(self, date):
+        return self._total_kin > self.__other_kin(date)
+
+    def __ge__(self, date):
+        return self._total_kin >= self.__other_kin(date)
+
+    def __lt__(self, date):
+        return self._total_kin < self.__other_kin(date)
+
+    def __le__(self, date):
+        return self._total_kin <= self.__other_kin(date)
+
+    def __len__(self):
+        return self._total_kin.shape[0]
+
+    def __iter__(self):
+        return iter(self.to_list())
+
+    def __getitem__(self, key):
+        if isinstance(key, (int, np.integer)):
+            return kin_to_long_count(int(self._total_kin[key]))
+
+        return LongCountArray(self._total_kin[key])
+
+    def __repr__(self):
+        if len(self) > 6:
+            dates = [str(lc) for lc in self[:3]] + ["..."]
+            dates += [str(lc) for lc in self[-3:]]
+        else:
+            dates = [str(lc) for lc in self]
+
+        return f"LongCountArray([{', '.join(dates)}])"
+
+
+def correlation_sweep(dates, correlations, calendar="gregorian"):
+    """Converts a batch of dates under several correlation constants at once
+
+    Computes every date, correlation pair in one vectorized pass. Row i, column
+    j of each result array holds the conversion of dates[i] using
+    correlations[j]. Requires numpy.
+
+    Args:
+        dates (LongCountArray or iterable): The dates to convert, either a
+            LongCountArray or complete LongCount (or Mayadate) objects
+        correlations (array_like): One dimensional sequence of correlation
+            constants, e.g. [584283, 584285, 584286]
+        calendar (str): The target calendar, either 'gregorian' or 'julian'.
+            Defaults to 'gregorian'.
+
+    Returns:
+        A (day, month, year) tuple of int64 numpy arrays of shape
+            (n_dates, n_correlations)
+
+    """
+    if calendar not in ("gregorian", "julian"):
+        raise ValueError("Unrecognized calendar - supports 'gregorian' or 'julian'")
+
+    if not isinstance(dates, LongCountArray):
+        dates = LongCountArray.from_long_counts(dates)
+
+    correlations = _as_correlations(correlations)
+
+    if calendar == "gregorian":
+        return dates.to_gregorian(correlations)
+
+    return dates.to_julian(correlations)
+
+
+def _as_correlations(correlations):
+    """Helper function to validate a sequence of correlation constants"""
+
+    correlations = np.asarray(correlations)
+    if correlations.ndim != 1:
+        raise ValueError("Correlation constants must be a one dimensional sequence")
+    if correlations.size and correlations.dtype.kind not in "iu":
+        raise ValueError("Correlation constants must be integers")
+
+    return correlations.astype(np.int64)
@@ -1,9 +1,16 @@
 from .calendar_round import CalendarRound
-from .long_count import LongCount
+from .long_count import LongCount, kin_to_long_count
+from .inference import iter_kin_solutions
 from .tzolkin import Tzolkin
 from .haab import Haab
+from .supplementary import (
+    LORDS_OF_THE_NIGHT,
+    STATION_819_DIRECTIONS,
+    STATION_819_LENGTH,
+    moon_age_matches,
+)
 from .utils import *
-import logging
+import itertools
 
 __all__ = ["Mayadate", "from_dict"]
 
@@ -11,14 +18,41 @@ __all__ = ["Mayadate", "from_dict"]
 class Mayadate:
     """Umbrella class to handle Maya calendar dates, conversions, and inference
 
+    The Calendar Round and Glyph G are computed from the Long Count on first
+    access if they were not passed to the constructor.
+
+    Dates with a complete Long Count are hashed and compared by their total kin
+    count, so they equal LongCount objects for the same day. Dates with a
+    partial Long Count are hashed and compared for equality by all of their
+    known and missing values.
+
+    The Lord of the Night, 819 day count station and direction, and moon age
+    recorded in a Supplementary Series can be given as extra constraints for
+    the inference of missing Long Count positions.
+
     Attributes:
         long_count (LongCount): The Long Count representation of the date
         calendar_round (CalendarRound): The Calendar Round position of the date
         glyph_g (str): The Glyph G associated with the date
+        station_819 (int): The number of days since the last 819 day count
+            station
+        direction_819 (str): The direction of the last 819 day count station
+        moon_age (float): The recorded age of the moon in days
 
     """
 
-    def __init__(self, long_count=None, calendar_round=None, glyph_g=None):
+    __slots__ = ("long_count", "_calendar_round", "_glyph_g", "_supplementary")
+
+    def __init__(
+        self,
+        long_count=None,
+        calendar_round=None,
+        glyph_g=None,
+        lord_of_the_night=None,
+        station_819=None,
+        direction_819=None,
+        moon_age=None,
+    ):
         """Creates a new Mayadate object
 
         Args:
@@ -26,32 +60,110 @@ class Mayadate:
             calendar_round (CalendarRound): The Calendar Round position of the
                 date
             glyph_g (str): The Glyph G associated with the date, e.g. "G3"
+            lord_of_the_night (int): The number of the Lord of the Night, from 1
+                to 9. An alternative to glyph_g.
+            station_819 (int): The number of days since the last station of the
+                819 day count, from 0 to 818
+            direction_819 (str): The direction of the last station of the 819
+                day count, one of "east", "south", "west" or "north"
+            moon_age (float): The age of the moon in days, e.g. from Glyphs D
+                and E. Checked against the mean lunation under the 584,283
+                correlation, within MOON_AGE_TOLERANCE days.
 
         """
+        if lord_of_the_night is not None:
+            if lord_of_the_night not in range(1, 10):
+                raise ValueError("Lord of the Night must be between 1 and 9")
+            lord_glyph_g = LORDS_OF_THE_NIGHT[lord_of_the_night - 1]
+            if glyph_g is not None and glyph_g != lord_glyph_g:
+                raise ValueError(
+                    "Provided Glyph G does not match the Lord of the Night"
+                )
+            glyph_g = lord_glyph_g
+
+        if station_819 is not None and station_819 not in range(STATION_819_LENGTH):
+            raise ValueError("819 day count station must be between 0 and 818")
+        if direction_819 is not None and direction_819 not in STATION_819_DIRECTIONS:
+            raise ValueError(
+                f"819 day count direction must be one of {STATION_819_DIRECTIONS}"
+            )
+
         if long_count is None:
             self.long_count = LongCount(None, None, None, None, None)
-            self.glyph_g = glyph_g
         else:
             self.long_count = long_count
-            if long_count.winal is not None and long_count.kin is not None:
-                g = self.long_count.get_glyph_g()
-                if g != glyph_g and glyph_g is not None:
-                    raise ValueError(
-                        "Provided Glyph G does not match the Long Count date"
-                    )
-                self.glyph_g = g
-
-            else:
-                self.glyph_g = glyph_g
-
-        if calendar_round is None:
-            if long_count is not None:
-                if not self.long_count.has_missing():
-                    self.calendar_round = self.long_count.get_calendar_round()
-                else:
-                    self.calendar_round = CalendarRound(None, None)
+            if (
+                glyph_g is not None
+                and long_count.winal is not None
+                and long_count.kin is not None
+                and long_count.get_glyph_g() != glyph_g
+            ):
+                raise ValueError("Provided Glyph G does not match the Long Count date")
+
+        self._glyph_g = glyph_g
+        self._calendar_round = calendar_round
+
+        if station_819 is None and direction_819 is None and moon_age is None:
+            self._supplementary = None
         else:
-            self.calendar_round = calendar_round
+            self._supplementary = (station_819, direction_819, moon_age)
+            if not self.long_count.has_missing():
+                self.__check_supplementary()
+
+    @property
+    def calendar_round(self):
+        if self._calendar_round is None:
+            if self.long_count.has_missing():
+                self._calendar_round = CalendarRound(None, None)
+            else:
+                self._calendar_round = self.long_count.get_calendar_round()
+
+        return self._calendar_round
+
+    @calendar_round.setter
+    def calendar_round(self, calendar_round):
+        self._calendar_round = calendar_round
+
+    @property
+    def glyph_g(self):
+        if (
+            self._glyph_g is None
+            and self.long_count.winal is not None
+            and self.long_count.kin is not None
+        ):
+            self._glyph_g = self.long_count.get_glyph_g()
+
+        return self._glyph_g
+
+    @glyph_g.setter
+    def glyph_g(self, glyph_g):
+        self._glyph_g = glyph_g
+
+    @property
+    def station_819(self):
+        if self._supplementary is not None and self._supplementary[0] is not None:
+            return self._supplementary[0]
+        if self.long_count.has_missing():
+            return None
+
+        return self.long_count.get_819_station()
+
+    @property
+    def direction_819(self):
+        if self._supplementary is not None and self._supplementary[1] is not None:
+            return self._supplementary[1]
+        if self.long_count.has_missing():
+            return None
+
+        return self.long_count.get_819_direction()
+
+    @property
+    def moon_age(self):
+        # only the recorded age, as the computed age depends on the correlation
+        if self._supplementary is None:
+            return None
+
+        return self._supplementary[2]
 
     def has_missing(self):
         """Checks whether the Mayadate object has missing values in any position
@@ -79,10 +191,17 @@ class Mayadate:
 
         if in_place:
             self.long_count = self.long_count.add_days(num_days)
-            self.calendar_round = self.calendar_round.add_days(num_days)
+            if self._calendar_round is not None:
+                self._calendar_round = self._calendar_round.add_days(num_days)
+            self._glyph_g = None
+            self._supplementary = None
 
             return self
         else:
+            if self._calendar_round is None:
+                # calendar round not computed yet, leave it to the new object
+                return Mayadate(self.long_count.add_days(num_days))
+
             return Mayadate(
                 self.long_count.add_days(num_days),
                 self.calendar_round.add_days(num_days),
@@ -96,20 +215,10 @@ class Mayadate:
                 portions of the Long Count and Calendar Round Dates
 
         """
-
-        if not self.long_count.has_missing():
-            return [self.long_count]
-
-        if not self.calendar_round.has_missing():
-            min_lc, max_lc = LongCount(0, 0, 0, 0, 0), LongCount(13, 19, 19, 17, 19)
-            poss_lc = self.calendar_round.get_long_count_possibilities(min_lc, max_lc)
-            poss_lc = [lc for lc in poss_lc if self.match(lc.get_mayadate())]
-
-        else:
-            poss_lc = self.__infer_lc_recursive(self.long_count.to_list(), [])
+        poss_lc = list(self.iter_long_count_dates())
 
         if poss_lc == []:
-            logging.info("No matching dates found - check the inputted values")
+            _log_no_matches()
 
         return poss_lc
 
@@ -121,43 +230,78 @@ class Mayadate:
                 portions of the Long Count and Calendar Round Dates
 
         """
-        if not self.long_count.has_missing():
-            return [self.long_count.get_mayadate()]
+        dates = list(self.iter_mayadates())
 
-        lcs = self.infer_long_count_dates()
-        if lcs == []:
-            logging.info("No matching dates found - check the inputted values")
-        return [lc.get_mayadate() for lc in lcs]
+        if dates == []:
+            _log_no_matches()
 
-    def __infer_lc_recursive(self, lc, poss_dates):
-        """Helper function to recursively check for possible dates"""
+        return dates
 
-        if None not in lc:
-            lc_obj = LongCount(*lc)
-            if self.calendar_round.match(lc_obj.get_calendar_round()):
-                if self.glyph_g is not None:
-                    if lc_obj.get_glyph_g() == self.glyph_g:
-                        return lc_obj
-                else:
-                    return lc_obj
-            return
+    def iter_long_count_dates(self, limit=None, min_date=None, max_date=None):
+        """Lazily finds Long Count dates that match the supplied information
 
-        max_vals = [14, 20, 20, 18, 20]
+        Candidates are produced in increasing order and the search stops as
+        soon as limit dates have been found, e.g. use limit=2 to check whether
+        the supplied information identifies a unique date.
 
-        for idx, v in enumerate(zip(lc, max_vals)):
-            val, max = v
-            if val is None:
-                for i in range(max):
+        Args:
+            limit (int or NoneType): Maximum number of dates to produce.
+                Defaults to None, i.e. no limit.
+            min_date (LongCount or Mayadate): If given, the earliest date to
+                produce
+            max_date (LongCount or Mayadate): If given, the latest date to
+                produce
 
-                    lc_test = lc[:]
-                    lc_test[idx] = i
+        Returns:
+            (iterator) An iterator of potential Long Count dates that match the
+                supplied portions of the Long Count and Calendar Round Dates
 
-                    res = self.__infer_lc_recursive(lc_test, poss_dates)
-                    if type(res) is LongCount:
-                        poss_dates.append(res)
-                break
+        """
+        min_kin = None if min_date is None else min_date.get_total_kin()
+        max_kin = None if max_date is None else max_date.get_total_kin()
 
-        return poss_dates
+        if not self.long_count.has_missing():
+            total_kin = self.long_count.get_total_kin()
+            in_bounds = (min_kin is None or total_kin >= min_kin) and (
+                max_kin is None or total_kin <= max_kin
+            )
+            candidates = iter([self.long_count] if in_bounds else [])
+
+        else:
+            solutions = _iter_kin_candidates(
+                self.long_count,
+                self.calendar_round,
+                self.glyph_g,
+                self._supplementary,
+                min_kin,
+                max_kin,
+            )
+            candidates = (kin_to_long_count(k) for k in solutions)
+
+        return itertools.islice(candidates, limit)
+
+    def iter_mayadates(self, limit=None, min_date=None, max_date=None):
+        """Lazily finds Maya calendar dates that match the supplied information
+
+        See iter_long_count_dates for details on the search.
+
+        Args:
+            limit (int or NoneType): Maximum number of dates to produce.
+                Defaults to None, i.e. no limit.
+            min_date (LongCount or Mayadate): If given, the earliest date to
+                produce
+            max_date (LongCount or Mayadate): If given, the latest date to
+                produce
+
+        Returns:
+            (iterator) An iterator of potential Mayadate objects that match the
+                supplied portions of the Long Count and Calendar Round Dates
+
+        """
+        return (
+            lc.get_mayadate()
+            for lc in self.iter_long_count_dates(limit, min_date, max_date)
+        )
 
     def to_julian_day(self, correlation=584283):
         """Converts the Mayan calendar date to its corresponding Julian Day number
@@ -225,6 +369,57 @@ class Mayadate:
 
         return self.long_count.get_glyph_g()
 
+    def get_lord_of_the_night(self):
+        """Calculates the number of the Lord of the Night of the Long Count date
+
+        Returns:
+            (int): The number of the Lord of the Night, from 1 to 9
+
+        """
+        return self.long_count.get_lord_of_the_night()
+
+    def get_819_station(self):
+        """Calculates the number of days since the last station of the 819 day count
+
+        Returns:
+            (int): The number of days since the station, from 0 to 818
+
+        """
+        return self.long_count.get_819_station()
+
+    def get_819_direction(self):
+        """Calculates the direction of the last station of the 819 day count
+
+        Returns:
+            (str): The direction of the station, e.g. "east"
+
+        """
+        return self.long_count.get_819_direction()
+
+    def get_819_color(self):
+        """Calculates the color of the last station of the 819 day count
+
+        Returns:
+            (str): The color of the station's direction, e.g. "red"
+
+        """
+        return self.long_count.get_819_color()
+
+    def get_moon_age(self, correlation=584283):
+        """Approximates the age of the moon on the Long Count date
+
+        By default uses the correlation constant 584,283 proposed by Thompson.
+
+        Args:
+            correlation (int): The correlation constant to use in the conversion.
+                Defaults to 584283.
+
+        Returns:
+            (float): The number of days since the last new moon
+
+        """
+        return self.long_count.get_moon_age(correlation)
+
     def to_dict(self):
         """Returns a JSON style dictionary representation
 
@@ -286,6 +481,23 @@ class Mayadate:
             return True
         return False
 
+    def __check_supplementary(self):
+        """Helper function to check the Supplementary Series against the Long Count"""
+
+        station_819, direction_819, moon_age = self._supplementary
+        total_kin = self.long_count.get_total_kin()
+
+        if station_819 is not None and station_819 != self.get_819_station():
+            raise ValueError(
+                "Provided 819 day count station does not match the Long Count date"
+            )
+        if direction_819 is not None and direction_819 != self.get_819_direction():
+            raise ValueError(
+                "Provided 819 day count direction does not match the Long Count date"
+            )
+        if moon_age is not None and not moon_age_matches(total_kin, moon_age):
+            raise ValueError("Provided moon age does not match the Long Count date")
+
     def __fuzzy_eq(self, v1, v2):
         """Helper function for NoneType matching"""
 
@@ -304,35 +516,49 @@ class Mayadate:
 
         return dist
 
+    def _hash_key(self):
+        """Returns the value that defines equality and hashing of the date
+
+        The total kin count if the Long Count is complete, consistent with
+        LongCount objects. Otherwise a tuple of all the known and missing
+        Long Count, Calendar Round and Glyph G values.
+        """
+        lc_key = self.long_count._hash_key()
+        if type(lc_key) is int:
+            return lc_key
+
+        tzolkin, haab = self.calendar_round.tzolkin, self.calendar_round.haab
+
+        return (
+            lc_key,
+            tzolkin.day_number,
+            tzolkin.day_name,
+            haab.month_number,
+            haab.month_name,
+            self.glyph_g,
+            self._supplementary,
+        )
+
+    def __hash__(self):
+        return hash(self._hash_key())
+
     def __eq__(self, date):
-        if self.get_total_kin() == date.get_total_kin():
-            return True
-        else:
-            return False
+        if not hasattr(date, "_hash_key"):
+            return NotImplemented
+
+        return self._hash_key() == date._hash_key()
 
     def __gt__(self, date):
-        if self.get_total_kin() > date.get_total_kin():
-            return True
-        else:
-            return False
+        return self.get_total_kin() > date.get_total_kin()
 
     def __ge__(self, date):
-        if self.get_total_kin() >= date.get_total_kin():
-            return True
-        else:
-            return False
+        return self.get_total_kin() >= date.get_total_kin()
 
     def __lt__(self, date):
-        if self.get_total_kin() < date.get_total_kin():
-            return True
-        else:
-            return False
+        return self.get_total_kin() < date.get_total_kin()
 
     def __le__(self, date):
-        if self.get_total_kin() <= date.get_total_kin():
-            return True
-        else:
-            return False
+        return self.get_total_kin() <= date.get_total_kin()
 
     def __repr__(self):
         return f"{self.long_count.__repr__()}  {self.calendar_round.__repr__()}"
@@ -381,13 +607,68 @@ def from_dict(dict_obj):
 
     glyph_g = dict_obj.get("glyph_g")
 
+    calendar_round = CalendarRound(Tzolkin(**tz_dict), Haab(**hb_dict))
+    if _all_missing(calendar_round):
+        # let Mayadate compute the Calendar Round from a complete Long Count
+        calendar_round = None
+
     return Mayadate(
         long_count=LongCount(**lc_dict),
-        calendar_round=CalendarRound(Tzolkin(**tz_dict), Haab(**hb_dict)),
+        calendar_round=calendar_round,
         glyph_g=glyph_g,
     )
 
 
+def _iter_kin_candidates(
+    long_count, calendar_round, glyph_g, supplementary, min_kin=None, max_kin=None
+):
+    """Helper function to find the total kin of the dates matching a partial date
+
+    Shared by Mayadate.iter_long_count_dates and batch_infer, so that both apply
+    the same constraints. supplementary is None or the (station_819,
+    direction_819, moon_age) tuple kept by Mayadate.
+    """
+    station_819, direction_819, moon_age = supplementary or (None, None, None)
+
+    solutions = iter_kin_solutions(
+        long_count,
+        calendar_round,
+        glyph_g,
+        min_kin,
+        max_kin,
+        station_819,
+        direction_819,
+    )
+    if moon_age is not None:
+        solutions = (k for k in solutions if moon_age_matches(k, moon_age))
+
+    return solutions
+
+
+def _all_missing(calendar_round):
+    """Helper function to check whether every Calendar Round component is None"""
+
+    tzolkin, haab = calendar_round.tzolkin, calendar_round.haab
+
+    return (
+        tzolkin.day_number is None
+        and tzolkin.day_name is None
+        and haab.month_number is None
+        and haab.month_name is None
+    )
+
+
+def _log_no_matches():
+    """Helper function to log that no dates matched
+
+    logging is imported here rather than at the top of the module, as it is
+    only needed for failed searches and makes up much of the import time.
+    """
+    import logging
+
+    logging.info("No matching dates found - check the inputted values")
+
+
 def _none_to_dict(obj):
     if type(obj) is dict:
         return obj
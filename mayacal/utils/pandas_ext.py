@@ -0,0 +1,446 @@
+import operator
+
+try:
+    import pandas as pd
+except ImportError as e:  # pandas is an optional dependency
+    raise ImportError(
+        "The pandas extension type requires pandas - install it with 'pip install mayacal[pandas]'"
+    ) from e
+
+import numpy as np
+from pandas.api.extensions import (
+    ExtensionArray,
+    ExtensionDtype,
+    register_extension_dtype,
+    register_series_accessor,
+    take,
+)
+from pandas.api.types import is_integer, is_list_like
+
+from .calendar_round import EPOCH_TZOLKIN_NUM, EPOCH_HAAB_NUM
+from .haab import HAAB_MONTHS
+from .long_count import LongCount, kin_to_long_count
+from .long_count_array import (
+    KIN_PER_BAKTUN,
+    KIN_PER_KATUN,
+    KIN_PER_TUN,
+    KIN_PER_WINAL,
+)
+from .mayadate import Mayadate
+from .tzolkin import Tzolkin, TZOLKIN_DAYS
+from .utils import _convert_julian_days
+
+__all__ = ["MayaDateDtype", "MayaDateArray", "MayaAccessor"]
+
+GLYPH_G_NAMES = [f"G{i}" for i in range(1, 10)]
+
+# Day number and day name index of each Tzolkin number (0-259, from 1 Imix)
+_TZOLKIN_DAY_NUMBERS = np.array([Tzolkin.of(i).day_number for i in range(260)])
+_TZOLKIN_DAY_CODES = np.array(
+    [TZOLKIN_DAYS.index(Tzolkin.of(i).day_name) for i in range(260)]
+)
+
+
+@register_extension_dtype
+class MayaDateDtype(ExtensionDtype):
+    """pandas dtype for columns of complete Maya calendar dates
+
+    Registered with pandas under the name 'mayadate' when mayacal.utils.pandas_ext
+    is imported, e.g. pd.Series(dates, dtype="mayadate"). Missing values are
+    represented by pd.NA.
+    """
+
+    name = "mayadate"
+    type = Mayadate
+    kind = "O"
+    na_value = pd.NA
+
+    @classmethod
+    def construct_array_type(cls):
+        return MayaDateArray
+
+
+class MayaDateArray(ExtensionArray):
+    """pandas ExtensionArray of complete Maya calendar dates
+
+    Dates are stored as an int64 array of total kin since 0.0.0.0.0 along with
+    a boolean mask of missing values, so sorting, grouping and comparisons run
+    as array operations. Mayadate objects are only created when a single
+    element is accessed.
+    """
+
+    def __init__(self, total_kin, mask=None, copy=False):
+        """Creates a new MayaDateArray object
+
+        Args:
+            total_kin (array_like): The number of kin since the Maya zero date
+                0.0.0.0.0 for each date. Values must be non-negative integers.
+                Values at missing positions are ignored.
+            mask (array_like): Boolean array, True where the date is missing.
+                Defaults to None, i.e. no missing dates.
+            copy (bool): Whether to copy the input arrays. Defaults to False.
+
+        """
+        total_kin = np.asarray(total_kin, dtype=np.int64).reshape(-1)
+        if mask is None:
+            mask = np.zeros(len(total_kin), dtype=bool)
+        else:
+            mask = np.asarray(mask, dtype=bool).reshape(-1)
+
+        if copy:
+            total_kin, mask = total_kin.copy(), mask.copy()
+
+        if mask.shape != total_kin.shape:
+            raise ValueError("total_kin and mask must have the same length")
+        if (total_kin[~mask] < 0).any():
+            raise ValueError("Total kin values must be greater than or equal to zero")
+
+        self._data = total_kin
+        self._mask = mask
+
+    @classmethod
+    def _from_sequence(cls, scalars, *, dtype=None, copy=False):
+        if isinstance(scalars, cls):
+            return scalars.copy() if copy else scalars
+
+        scalars = list(scalars)
+        total_kin = np.zeros(len(scalars), dtype=np.int64)
+        mask = np.zeros(len(scalars), dtype=bool)
+
+        for i, scalar in enumerate(scalars):
+            kin = _scalar_to_kin(scalar)
+            if kin is None:
+                mask[i] = True
+            else:
+                total_kin[i] = kin
+
+        return cls(total_kin, mask)
+
+    @classmethod
+    def _from_factorized(cls, values, original):
+        return cls(values, values == -1)
+
+    @property
+    def dtype(self):
+        return MayaDateDtype()
+
+    @property
+    def nbytes(self):
+        return self._data.nbytes + self._mask.nbytes
+
+    def get_total_kin(self):
+        """Returns the total number of kin since 0.0.0.0.0 of each date
+
+        Returns:
+            (numpy.ndarray): int64 array of the number of kin since 0.0.0.0.0.
+                Values at missing positions are undefined, see isna.
+
+        """
+        return self._data.copy()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __getitem__(self, item):
+        if is_integer(item):
+            if self._mask[item]:
+                return pd.NA
+            return kin_to_long_count(int(self._data[item])).get_mayadate()
+
+        item = pd.api.indexers.check_array_indexer(self, item)
+
+        return type(self)(self._data[item], self._mask[item])
+
+    def __setitem__(self, key, value):
+        if is_list_like(value) and not isinstance(value, (LongCount, Mayadate)):
+            value = self._from_sequence(value)
+            total_kin, mask = value._data, value._mask
+        else:
+            kin = _scalar_to_kin(value)
+            total_kin, mask = (0, True) if kin is None else (kin, False)
+
+        key = pd.api.indexers.check_array_indexer(self, key)
+        self._data[key] = total_kin
+        self._mask[key] = mask
+
+    def isna(self):
+        return self._mask.copy()
+
+    def copy(self):
+        return type(self)(self._data, self._mask, copy=True)
+
+    def take(self, indices, *, allow_fill=False, fill_value=None):
+        total_kin = take(self._data, indices, allow_fill=allow_fill, fill_value=0)
+        mask = take(self._mask, indices, allow_fill=allow_fill, fill_value=True)
+
+        if allow_fill:
+            fill_kin = _scalar_to_kin(fill_value)
+            if fill_kin is not None:
+                filled = np.asarray(indices) == -1
+                total_kin[filled] = fill_kin
+                mask[filled] = False
+
+        return type(self)(total_kin, mask)
+
+    @classmethod
+    def _concat_same_type(cls, to_concat):
+        return cls(
+            np.concatenate([a._data for a in to_concat]),
+            np.concatenate([a._mask for a in to_concat]),
+        )
+
+    def _values_for_argsort(self):
+        return self._data
+
+    def _values_for_factorize(self):
+        return np.where(self._mask, -1, self._data), -1
+
+    def unique(self):
+        total_kin = pd.unique(np.where(self._mask, -1, self._data))
+
+        return type(self)(total_kin, total_kin == -1)
+
+    def value_counts(self, dropna=True):
+        total_kin, counts = np.unique(self._data[~self._mask], return_counts=True)
+        mask = np.zeros(len(total_kin), dtype=bool)
+
+        num_missing = self._mask.sum()
+        if not dropna and num_missing:
+            total_kin = np.append(total_kin, 0)
+            counts = np.append(counts, num_missing)
+            mask = np.append(mask, True)
+
+        index = pd.Index(type(self)(total_kin, mask))
+
+        return pd.Series(pd.array(counts, dtype="Int64"), index=index, name="count")
+
+    def _reduce(self, name, *, skipna=True, keepdims=False, **kwargs):
+        if name not in ("min", "max"):
+            raise TypeError(
+                f"'{type(self).__name__}' does not support reduction '{name}'"
+            )
+
+        valid = self._data[~self._mask]
+        if valid.size == 0 or (self._mask.any() and not skipna):
+            result = pd.NA
+        else:
+            result = kin_to_long_count(int(getattr(valid, name)())).get_mayadate()
+
+        if keepdims:
+            return self._from_sequence([result])
+
+        return result
+
+    def _cmp_method(self, other, op):
+        if isinstance(other, MayaDateArray):
+            other_kin, other_mask = other._data, other._mask
+        elif is_list_like(other) and not isinstance(other, (LongCount, Mayadate)):
+            other = self._from_sequence(other)
+            other_kin, other_mask = other._data, other._mask
+        else:
+            kin = _scalar_to_kin(other)
+            other_kin, other_mask = (0, True) if kin is None else (kin, False)
+
+        mask = self._mask | other_mask
+
+        return pd.arrays.BooleanArray(op(self._data, other_kin) & ~mask, mask)
+
+    def __eq__(self, other):
+        return self._cmp_method(other, operator.eq)
+
+    def __ne__(self, other):
+        return self._cmp_method(other, operator.ne)
+
+    def __lt__(self, other):
+        return self._cmp_method(other, operator.lt)
+
+    def __le__(self, other):
+        return self._cmp_method(other, operator.le)
+
+    def __gt__(self, other):
+        return self._cmp_method(other, operator.gt)
+
+    def __ge__(self, other):
+        return self._cmp_method(other, operator.ge)
+
+
+@register_series_accessor("maya")
+class MayaAccessor:
+    """Vectorized access to the calendar positions of a 'mayadate' Series
+
+    Available as Series.maya once this module has been imported. Every
+    property returns a Series (or DataFrame) aligned with the original index,
+    with missing values wherever the date is missing.
+    """
+
+    def __init__(self, series):
+        if not isinstance(series.dtype, MayaDateDtype):
+            raise AttributeError("Can only use .maya accessor with 'mayadate' values")
+
+        self._series = series
+        self._array = series.array
+
+    @property
+    def total_kin(self):
+        """(Series): The number of kin since 0.0.0.0.0 of each date"""
+
+        return self._to_series(self._integers(self._array._data), "total_kin")
+
+    @property
+    def long_count(self):
+        """(DataFrame): The baktun, katun, tun, winal and kin of each date"""
+
+        positions = {}
+        remainder = self._array._data
+        for name, kin_per_unit in (
+            ("baktun", KIN_PER_BAKTUN),
+            ("katun", KIN_PER_KATUN),
+            ("tun", KIN_PER_TUN),
+            ("winal", KIN_PER_WINAL),
+            ("kin", 1),
+        ):
+            positions[name], remainder = np.divmod(remainder, kin_per_unit)
+
+        return self._to_frame(positions)
+
+    @property
+    def tzolkin(self):
+        """(DataFrame): The Tzolkin day number and day name of each date"""
+
+        tzolkin_num = (self._array._data + EPOCH_TZOLKIN_NUM) % 260
+
+        return self._to_frame(
+            {
+                "day_number": _TZOLKIN_DAY_NUMBERS[tzolkin_num],
+                "day_name": self._categorical(
+                    _TZOLKIN_DAY_CODES[tzolkin_num], TZOLKIN_DAYS
+                ),
+            }
+        )
+
+    @property
+    def haab(self):
+        """(DataFrame): The Haab month number and month name of each date"""
+
+        month_idx, month_number = np.divmod(
+            (self._array._data + EPOCH_HAAB_NUM) % 365, 20
+        )
+
+        return self._to_frame(
+            {
+                "month_number": month_number,
+                "month_name": self._categorical(month_idx, HAAB_MONTHS),
+            }
+        )
+
+    @property
+    def glyph_g(self):
+        """(Series): The Glyph G of each date, e.g. "G3" """
+
+        codes = (self._array._data + 8) % 9
+
+        return self._to_series(self._categorical(codes, GLYPH_G_NAMES), "glyph_g")
+
+    def to_julian_day(self, correlation=584283):
+        """Converts the dates to their corresponding Julian Day numbers
+
+        Args:
+            correlation (int): The correlation constant to use in the conversion.
+                Defaults to 584283.
+
+        Returns:
+            (Series): The Julian Day number of each date
+
+        """
+        julian_days = self._array._data + correlation
+
+        return self._to_series(self._integers(julian_days), "julian_day")
+
+    def to_julian(self, correlation=584283):
+        """Converts the dates to their corresponding Julian calendar dates
+
+        Args:
+            correlation (int): The correlation constant to use in the conversion.
+                Defaults to 584283.
+
+        Returns:
+            (DataFrame): The day, month and year of each date in the Julian
+                calendar
+
+        """
+        return self._convert(correlation, gregorian=False)
+
+    def to_gregorian(self, correlation=584283):
+        """Converts the dates to their corresponding Gregorian calendar dates
+
+        Args:
+            correlation (int): The correlation constant to use in the conversion.
+                Defaults to 584283.
+
+        Returns:
+            (DataFrame): The day, month and year of each date in the Gregorian
+                calendar
+
+        """
+        return self._convert(correlation, gregorian=True)
+
+    def _convert(self, correlation, gregorian):
+        """Helper function to convert the dates to Julian or Gregorian dates"""
+
+        # missing dates are converted as the zero date and masked afterwards
+        julian_days = np.where(self._array._mask, 0, self._array._data) + correlation
+        day, month, year = _convert_julian_days(julian_days, gregorian=gregorian)
+
+        return self._to_frame({"day": day, "month": month, "year": year})
+
+    def _integers(self, values):
+        """Helper function to build a nullable Int64 array from masked values"""
+
+        return pd.arrays.IntegerArray(
+            np.asarray(values, dtype=np.int64), self._array._mask.copy()
+        )
+
+    def _categorical(self, codes, categories):
+        """Helper function to build a Categorical with missing dates as NaN"""
+
+        codes = np.where(self._array._mask, -1, codes)
+
+        return pd.Categorical.from_codes(codes, categories=categories)
+
+    def _to_series(self, values, name):
+        """Helper function to build a Series aligned with the original one"""
+
+        return pd.Series(values, index=self._series.index, name=name)
+
+    def _to_frame(self, columns):
+        """Helper function to build a DataFrame aligned with the original Series"""
+
+        return pd.DataFrame(
+            {
+                name: (
+                    values
+                    if isinstance(values, pd.Categorical)
+                    else self._integers(values)
+                )
+                for name, values in columns.items()
+            },
+            index=self._series.index,
+        )
+
+
+def _scalar_to_kin(scalar):
+    """Helper function to get the total kin of a scalar, or None if missing"""
+
+    if (
+        scalar is None
+        or scalar is pd.NA
+        or (isinstance(scalar, float) and np.isnan(scalar))
+    ):
+        return None
+
+    if isinstance(scalar, (LongCount, Mayadate)):
+        return scalar.get_total_kin()
+
+    raise TypeError(
+        f"Expected a LongCount or Mayadate object, got {type(scalar).__name__}"
+    )
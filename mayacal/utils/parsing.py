@@ -0,0 +1,289 @@
+import re
+
+from .haab import HAAB_MONTHS, HAAB_MONTH_NUMBERS, WAYEB_NUMBERS
+from .records import MAYADATE_COLUMNS, _row_to_mayadate
+from .stream import _iter_lines, _report_error
+from .tzolkin import TZOLKIN_DAYS, TZOLKIN_DAY_NUMBERS
+from .utils import _require_numpy
+
+__all__ = ["parse_mayadate", "iter_parse", "parse_mayadates", "MISSING_MARKERS"]
+
+# Tokens marking an unknown number, name or Glyph G, compared in lower case
+MISSING_MARKERS = frozenset(["?", "*", "x", "none"])
+
+# Older (colonial) spellings of the day and month names, which are common in
+# published catalogs, keyed by their normalized form
+DAY_NAME_ALIASES = {
+    "chicchan": "Chikchan",
+    "cimi": "Kimi",
+    "muluc": "Muluk",
+    "oc": "Ok",
+    "chuen": "Chuwen",
+    "cib": "Kib",
+    "caban": "Kaban",
+    "cauac": "Kawak",
+    "ahau": "Ajaw",
+}
+
+MONTH_NAME_ALIASES = {
+    "uo": "Wo",
+    "zip": "Sip",
+    "zotz": "Sotz",
+    "tzec": "Sek",
+    "ceh": "Keh",
+    "mac": "Mak",
+    "muan": "Muwan",
+    "cumku": "Kumku",
+    "uayeb": "Wayeb",
+}
+
+_NUMBER = r"\d+|[?*xX]|(?i:none)"
+
+_LONG_COUNT_PATTERN = re.compile(r"\.".join([f"({_NUMBER})"] * 5))
+_GLYPH_G_PATTERN = re.compile(r"[Gg]([1-9]|[?*xX]|(?i:none))")
+
+# Values of the most common number tokens, so that they are parsed with a lookup
+_NUMBER_VALUES = {str(i): i for i in range(20)}
+_NUMBER_VALUES.update({marker: None for marker in ("?", "*", "x", "X", "None")})
+
+_WAYEB_IDX = HAAB_MONTHS.index("Wayeb")
+
+# Apostrophes (glottal stops) are dropped, so that K'an, K’an and Kan all match
+_STRIP_APOSTROPHES = str.maketrans("", "", "'’`")
+
+# Bounds of the Long Count positions, checked here so that the columnar output
+# is validated like the Mayadate objects
+_LONG_COUNT_LIMITS = (20, 20, 20, 18, 20)
+
+
+def _build_name_lookup(names, aliases):
+    """Helper function mapping name spellings to the position of the name"""
+
+    lookup = {}
+    for idx, name in enumerate(names):
+        lookup[name] = idx
+        lookup[name.lower()] = idx
+    for alias, name in aliases.items():
+        lookup[alias] = names.index(name)
+
+    return lookup
+
+
+_DAY_LOOKUP = _build_name_lookup(TZOLKIN_DAYS, DAY_NAME_ALIASES)
+_MONTH_LOOKUP = _build_name_lookup(HAAB_MONTHS, MONTH_NAME_ALIASES)
+
+
+def parse_mayadate(text):
+    """Parses a Maya date string such as "9.12.11.5.18 6 Etznab 11 Yax"
+
+    Accepts the format produced by printing a Mayadate object. The Long Count,
+    Tzolkin, Haab and Glyph G (e.g. "G9") are each optional, and ?, x, * or
+    None mark a missing number, name or Glyph G, e.g. "9.?.?.5.18 6 ? G1 11 Yax".
+    Names are matched ignoring case and apostrophes, and the older spellings in
+    DAY_NAME_ALIASES and MONTH_NAME_ALIASES are also accepted. A single day or
+    month is read as a Haab date if its name is a month name, and as a Tzolkin
+    date otherwise.
+
+    Args:
+        text (str): The date string to parse
+
+    Returns:
+        (Mayadate): The parsed, possibly partial, date
+
+    """
+    return _row_to_mayadate(*_parse_row(text))
+
+
+def iter_parse(source, on_error=None):
+    """Lazily parses Maya date strings, one per line
+
+    Blank lines are skipped. Strings that cannot be parsed do not stop the
+    parse. They are passed to on_error, or logged and skipped if no on_error
+    function is given.
+
+    Args:
+        source (str or iterable): Path to a text file, or an iterable of strings
+            such as an open file object
+        on_error (callable): Function called as on_error(line_number, line, error)
+            for every string that cannot be parsed. Defaults to None.
+
+    Yields:
+        A (line_number, Mayadate) tuple for every valid string
+
+    """
+    for line_number, line in _iter_lines(source):
+        try:
+            yield line_number, _row_to_mayadate(*_parse_row(line))
+        except ValueError as e:
+            _report_error(on_error, line_number, line, e)
+
+
+def parse_mayadates(source, columnar=False, on_error=None):
+    """Parses many Maya date strings, one per line
+
+    With columnar=True, Mayadate objects are not created. The dates are
+    instead returned as one numpy masked array per field, in the encoding used
+    by MAYADATE_COLUMNS, with day and month names as their index in
+    TZOLKIN_DAYS and HAAB_MONTHS and missing values masked. The arrays hold the
+    values as written, so the Calendar Round and Glyph G are not computed from
+    the Long Count or checked against it. Requires numpy.
+
+    Args:
+        source (str or iterable): Path to a text file, or an iterable of strings
+            such as an open file object
+        columnar (bool): Whether to return arrays rather than Mayadate objects.
+            Defaults to False.
+        on_error (callable): Function called as on_error(line_number, line, error)
+            for every string that cannot be parsed, which are otherwise logged
+            and skipped. Defaults to None.
+
+    Returns:
+        (list or dict): A list of Mayadate objects, or with columnar=True a
+            dictionary from each name in MAYADATE_COLUMNS to an int8 masked
+            array, plus "line_number" to an int64 array of the source lines
+
+    """
+    if not columnar:
+        return [date for _, date in iter_parse(source, on_error)]
+
+    np = _require_numpy("Columnar parsing")
+
+    line_numbers = []
+    rows = []
+    for line_number, line in _iter_lines(source):
+        try:
+            row = _parse_row(line)
+        except ValueError as e:
+            _report_error(on_error, line_number, line, e)
+            continue
+
+        line_numbers.append(line_number)
+        rows.append(row)
+
+    # None becomes NaN in a float array, which gives the mask in one pass
+    values = np.array(rows, dtype=np.float64).reshape(-1, len(MAYADATE_COLUMNS))
+    mask = np.isnan(values)
+    values[mask] = 0
+    values = values.astype(np.int8)
+
+    result = {
+        name: np.ma.MaskedArray(values[:, i], mask=mask[:, i])
+        for i, name in enumerate(MAYADATE_COLUMNS)
+    }
+    result["line_number"] = np.array(line_numbers, dtype=np.int64)
+
+    return result
+
+
+def _parse_row(text):
+    """Helper function to parse a date string to a row in MAYADATE_COLUMNS order"""
+
+    tokens = text.split()
+
+    long_count = [None] * 5
+    if tokens and "." in tokens[0]:
+        match = _LONG_COUNT_PATTERN.fullmatch(tokens.pop(0))
+        if match is None:
+            raise ValueError(f"Invalid Long Count in {text!r}")
+
+        long_count = [_parse_number(group) for group in match.groups()]
+        for value, limit in zip(long_count, _LONG_COUNT_LIMITS):
+            if value is not None and value >= limit:
+                raise ValueError(f"Long Count position out of range in {text!r}")
+
+    glyph_g = None
+    pairs = []
+    idx = 0
+    while idx < len(tokens):
+        token = tokens[idx]
+        # no day or month name starts with G, so other tokens skip the regex
+        match = _GLYPH_G_PATTERN.fullmatch(token) if token[0] in "Gg" else None
+        if match is not None:
+            glyph_g = _parse_number(match.group(1))
+            idx += 1
+        elif idx + 1 < len(tokens):
+            pairs.append((token, tokens[idx + 1]))
+            idx += 2
+        else:
+            raise ValueError(f"Unexpected token {token!r} in {text!r}")
+
+    if len(pairs) > 2:
+        raise ValueError(f"Too many day and month names in {text!r}")
+
+    tzolkin = (None, None)
+    haab = (None, None)
+    if len(pairs) == 2:
+        tzolkin = _parse_tzolkin(*pairs[0])
+        haab = _parse_haab(*pairs[1])
+    elif len(pairs) == 1:
+        number, name = pairs[0]
+        if _lookup_name(name, _MONTH_LOOKUP) is not None:
+            haab = _parse_haab(number, name)
+        else:
+            tzolkin = _parse_tzolkin(number, name)
+
+    return long_count + [*tzolkin, *haab, glyph_g]
+
+
+def _parse_tzolkin(number, name):
+    """Helper function to parse a Tzolkin day number and name"""
+
+    day_number = _parse_number(number)
+    if day_number is not None and day_number not in TZOLKIN_DAY_NUMBERS:
+        raise ValueError(f"Invalid Tzolkin day number {number}")
+
+    return day_number, _parse_name(name, _DAY_LOOKUP, "Tzolkin day")
+
+
+def _parse_haab(number, name):
+    """Helper function to parse a Haab month number and name"""
+
+    month_number = _parse_number(number)
+    month_idx = _parse_name(name, _MONTH_LOOKUP, "Haab month")
+
+    numbers = WAYEB_NUMBERS if month_idx == _WAYEB_IDX else HAAB_MONTH_NUMBERS
+    if month_number is not None and month_number not in numbers:
+        raise ValueError(f"Invalid Haab month number {number} {name}")
+
+    return month_number, month_idx
+
+
+def _parse_number(token):
+    """Helper function to parse a number token, None for a missing marker"""
+
+    try:
+        return _NUMBER_VALUES[token]
+    except KeyError:
+        pass
+
+    if token.isdigit():
+        return int(token)
+    if token.lower() in MISSING_MARKERS:
+        return None
+
+    raise ValueError(f"Invalid number {token!r}")
+
+
+def _parse_name(token, lookup, kind):
+    """Helper function to parse a name token to its index, None if missing"""
+
+    idx = _lookup_name(token, lookup)
+    if idx is not None:
+        return idx
+    if token.lower() in MISSING_MARKERS:
+        return None
+
+    raise ValueError(f"Invalid {kind} name {token!r}")
+
+
+def _lookup_name(token, lookup):
+    """Helper function to find the index of a name, normalizing if needed"""
+
+    idx = lookup.get(token)
+    if idx is None:
+        idx = lookup.get(token.translate(_STRIP_APOSTROPHES).lower())
+        if idx is not None:
+            # remember the spelling so that later occurrences hit the fast path
+            lookup[token] = idx
+
+    return idx
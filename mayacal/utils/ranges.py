@@ -0,0 +1,141 @@
+from .calendar_round import (
+    CalendarRound,
+    CALENDAR_ROUND_LENGTH,
+    CALENDAR_ROUND_TZOLKIN_NUMS,
+    CALENDAR_ROUND_HAAB_NUMS,
+)
+from .haab import Haab
+from .long_count import LongCount
+from .mayadate import Mayadate
+from .tzolkin import Tzolkin
+
+__all__ = ["date_range"]
+
+# Number of values each Long Count position can take, from Bak'tun to Kin
+LONG_COUNT_RADICES = (20, 20, 20, 18, 20)
+
+# Glyph G name indexed by total kin % 9
+GLYPH_G_BY_RESIDUE = ("G9",) + tuple(f"G{i}" for i in range(1, 9))
+
+
+def date_range(start, stop, step=1, as_tuples=False):
+    """Iterates over evenly spaced Maya dates, like the built-in range
+
+    Each date is computed from the previous one by advancing the Long Count
+    positions with carries and stepping the Tzolkin, Haab and Glyph G cycle
+    positions, rather than converting every date from its total kin count.
+
+    Produces LongCount objects if start is a LongCount and Mayadate objects if
+    start is a Mayadate.
+
+    Args:
+        start (LongCount or Mayadate): The first date in the range
+        stop (LongCount or Mayadate): The end of the range. As with range, the
+            range stops before reaching this date.
+        step (int): Number of days between consecutive dates, can be negative.
+            Defaults to 1.
+        as_tuples (bool): If True, produce plain tuples instead of objects.
+            Long Counts are produced as (baktun, katun, tun, winal, kin) and
+            Mayadates as (baktun, katun, tun, winal, kin, day_number, day_name,
+            month_number, month_name, glyph_g). Defaults to False.
+
+    Returns:
+        (iterator): An iterator over the dates in the range
+
+    """
+    if type(step) is not int:
+        raise TypeError("step must be an integer")
+    if step == 0:
+        raise ValueError("step must not be zero")
+
+    start_kin = start.get_total_kin()
+    num_dates = len(range(start_kin, stop.get_total_kin(), step))
+
+    if isinstance(start, Mayadate):
+        return _iter_mayadates(start, start_kin, num_dates, step, as_tuples)
+
+    return _iter_long_counts(start, start_kin, num_dates, step, as_tuples)
+
+
+def _iter_long_counts(start, start_kin, num_dates, step, as_tuples):
+    """Generator implementing date_range for LongCount objects"""
+
+    digits = start.to_list()
+    total_kin = start_kin
+    for _ in range(num_dates):
+        if as_tuples:
+            yield tuple(digits)
+        else:
+            yield _make_long_count(digits, total_kin)
+
+        _advance(digits, step)
+        total_kin += step
+
+
+def _iter_mayadates(start, start_kin, num_dates, step, as_tuples):
+    """Generator implementing date_range for Mayadate objects"""
+
+    digits = start.long_count.to_list()
+    cr_index = start_kin % CALENDAR_ROUND_LENGTH
+    cr_step = step % CALENDAR_ROUND_LENGTH
+    glyph_g_residue = start_kin % 9
+    glyph_g_step = step % 9
+    total_kin = start_kin
+
+    for _ in range(num_dates):
+        tzolkin = Tzolkin.of(CALENDAR_ROUND_TZOLKIN_NUMS[cr_index])
+        haab = Haab.of(CALENDAR_ROUND_HAAB_NUMS[cr_index])
+        glyph_g = GLYPH_G_BY_RESIDUE[glyph_g_residue]
+
+        if as_tuples:
+            yield (
+                *digits,
+                tzolkin.day_number,
+                tzolkin.day_name,
+                haab.month_number,
+                haab.month_name,
+                glyph_g,
+            )
+        else:
+            yield Mayadate(
+                _make_long_count(digits, total_kin),
+                CalendarRound(tzolkin, haab),
+                glyph_g,
+            )
+
+        _advance(digits, step)
+        total_kin += step
+        cr_index = (cr_index + cr_step) % CALENDAR_ROUND_LENGTH
+        glyph_g_residue = (glyph_g_residue + glyph_g_step) % 9
+
+
+def _make_long_count(digits, total_kin):
+    """Helper function to build a LongCount from known valid positions
+
+    Like kin_to_long_count, skips the checks in LongCount.__init__, which also
+    allows dates from 20.0.0.0.0 on, and caches the total kin count.
+    """
+    long_count = LongCount.__new__(LongCount)
+
+    (
+        long_count._baktun,
+        long_count._katun,
+        long_count._tun,
+        long_count._winal,
+        long_count._kin,
+    ) = digits
+    long_count._total_kin = total_kin
+
+    return long_count
+
+
+def _advance(digits, num_days):
+    """Helper function to add num_days to a list of Long Count positions in place"""
+
+    carry = num_days
+    for idx in range(4, 0, -1):
+        carry, digits[idx] = divmod(digits[idx] + carry, LONG_COUNT_RADICES[idx])
+        if carry == 0:
+            return
+
+    digits[0] += carry
@@ -0,0 +1,77 @@
+from .calendar_round import CalendarRound
+from .haab import Haab, HAAB_MONTHS, HAAB_MONTH_TO_IDX
+from .long_count import LongCount
+from .mayadate import Mayadate, _all_missing
+from .tzolkin import Tzolkin, TZOLKIN_DAYS, TZOLKIN_DAY_TO_IDX
+
+__all__ = ["MAYADATE_COLUMNS"]
+
+# Fields of the flat encoding of a Mayadate used by the columnar and binary
+# formats, matching the keys used by Mayadate.to_dict. Day and month names are
+# encoded as their index in TZOLKIN_DAYS and HAAB_MONTHS and the Glyph G as
+# its number.
+MAYADATE_COLUMNS = (
+    "baktun",
+    "katun",
+    "tun",
+    "winal",
+    "kin",
+    "day_number",
+    "day_name",
+    "month_number",
+    "month_name",
+    "glyph_g",
+)
+
+
+def _mayadate_to_row(date):
+    """Helper function to encode a Mayadate as a list of small integers or None
+
+    Values are in the order of MAYADATE_COLUMNS.
+    """
+    tzolkin = date.calendar_round.tzolkin
+    haab = date.calendar_round.haab
+    glyph_g = date.glyph_g
+
+    return date.long_count.to_list() + [
+        tzolkin.day_number,
+        None if tzolkin.day_name is None else TZOLKIN_DAY_TO_IDX[tzolkin.day_name],
+        haab.month_number,
+        None if haab.month_name is None else HAAB_MONTH_TO_IDX[haab.month_name],
+        None if glyph_g is None else int(glyph_g[1:]),
+    ]
+
+
+def _row_to_mayadate(
+    baktun,
+    katun,
+    tun,
+    winal,
+    kin,
+    day_number,
+    day_idx,
+    month_number,
+    month_idx,
+    glyph_g_num,
+    override_coef_check=False,
+):
+    """Helper function to build a Mayadate from one row of a Maya date table
+
+    Readers of stored dates pass override_coef_check=True, so that Calendar
+    Rounds written with the check overridden can be read back.
+    """
+
+    calendar_round = CalendarRound(
+        Tzolkin(day_number, None if day_idx is None else TZOLKIN_DAYS[day_idx]),
+        Haab(month_number, None if month_idx is None else HAAB_MONTHS[month_idx]),
+        override_coef_check,
+    )
+    if _all_missing(calendar_round):
+        # let Mayadate compute the Calendar Round from a complete Long Count
+        calendar_round = None
+
+    return Mayadate(
+        LongCount(baktun, katun, tun, winal, kin),
+        calendar_round,
+        None if glyph_g_num is None else f"G{glyph_g_num}",
+    )
@@ -0,0 +1,519 @@
+"""Small HTTP service for Maya date conversion and inference
+
+Uses only the standard library. Each endpoint accepts a POST with a JSON body
+of the form {"date": <date>}, where <date> is a dictionary in the format
+produced by Mayadate.to_dict or a string such as "9.12.11.5.18 6 Etznab 11 Yax":
+
+    POST /convert          Julian Day, Julian and Gregorian dates of a complete
+                           Long Count date, optionally with a "correlation"
+    POST /calendar-round   The date with its Calendar Round and Glyph G filled
+                           in from a complete Long Count
+    POST /infer            All dates matching a partial date, as in
+                           Mayadate.infer_mayadates
+    GET  /stats            Per-endpoint request and latency counters
+
+Concurrent requests to the same endpoint are coalesced into batches, and
+inference batches are run in a pool of worker processes so that the event
+loop stays responsive.
+"""
+
+import asyncio
+import json
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from .batch import _decode_result, _encode_date, _format_error, _infer_encoded
+from .mayadate import from_dict
+from .parsing import parse_mayadate
+from .stream import _convert_record
+
+__all__ = ["MayacalServer", "serve", "ENDPOINTS"]
+
+ENDPOINTS = ("/convert", "/calendar-round", "/infer")
+
+# Largest accepted request body in bytes
+MAX_BODY_SIZE = 1 << 20
+
+_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+}
+
+
+class MayacalServer:
+    """Asyncio HTTP server for Maya date conversion and inference
+
+    Attributes:
+        host (str): The host name or address the server listens on
+        port (int): The port the server listens on. If created with port 0,
+            set to the port chosen by the operating system once started.
+
+    """
+
+    def __init__(
+        self,
+        host="127.0.0.1",
+        port=8000,
+        workers=None,
+        max_batch_size=64,
+        max_delay=0.002,
+        correlation=584283,
+    ):
+        """Creates a new MayacalServer object
+
+        The server does not listen for requests until started with start or
+        serve_forever.
+
+        Args:
+            host (str): The host name or address to listen on. Defaults to
+                127.0.0.1.
+            port (int): The port to listen on, or 0 to choose a free port.
+                Defaults to 8000.
+            workers (int or NoneType): Number of worker processes for
+                inference. Defaults to the number of CPUs. With 0 or 1,
+                inference runs in a thread of the server process.
+            max_batch_size (int): Maximum number of requests processed as one
+                batch. Defaults to 64.
+            max_delay (float): Time in seconds to wait for further requests
+                after the first request of a batch arrives. Defaults to 0.002.
+            correlation (int): The default correlation constant for /convert.
+                Defaults to 584283.
+
+        """
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be a positive integer")
+        if max_delay < 0:
+            raise ValueError("max_delay must be non-negative")
+
+        self.host = host
+        self.port = port
+        if workers is None:
+            workers = os.cpu_count() or 1
+        self.workers = workers
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self.correlation = correlation
+
+        self._server = None
+        self._executor = None
+        self._batchers = {}
+        self._stats = {endpoint: _EndpointStats() for endpoint in ENDPOINTS}
+
+    async def start(self):
+        """Starts listening for requests and returns once the server is ready"""
+
+        if self.workers > 1:
+            # Forking a process that runs an event loop can leave the workers
+            # unable to receive work, so they are started from a clean
+            # interpreter, and before the listening socket and batching tasks
+            # exist
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=_worker_context()
+            )
+            await asyncio.get_running_loop().run_in_executor(
+                self._executor, _infer_many, []
+            )
+
+        process_batch = {
+            "/convert": self._convert_batch,
+            "/calendar-round": self._calendar_round_batch,
+            "/infer": self._infer_batch,
+        }
+        self._batchers = {
+            endpoint: _Batcher(
+                process_batch[endpoint],
+                self._stats[endpoint],
+                self.max_batch_size,
+                self.max_delay,
+            )
+            for endpoint in ENDPOINTS
+        }
+
+        self._server = await asyncio.start_server(
+            self._handle_connection, self.host, self.port
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+
+        logging.info(f"mayacal server listening on http://{self.host}:{self.port}")
+
+    async def serve_forever(self):
+        """Starts the server if needed and handles requests until cancelled"""
+
+        if self._server is None:
+            await self.start()
+
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.close()
+
+    async def close(self):
+        """Stops the server, its batching tasks and its worker pool"""
+
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+        for batcher in self._batchers.values():
+            await batcher.close()
+        self._batchers = {}
+
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def stats(self):
+        """Returns the request and latency counters of each endpoint
+
+        Returns:
+            (dict): For each endpoint, the number of requests, of requests
+                rejected as invalid and of requests failed by the server, the
+                mean and maximum latency in milliseconds, and the number of
+                batches and mean batch size
+
+        """
+        return {endpoint: stats.to_dict() for endpoint, stats in self._stats.items()}
+
+    async def _handle_connection(self, reader, writer):
+        """Reads requests from one connection and writes the responses"""
+
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+
+                keep_alive = await self._handle_request(request_line, reader, writer)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def _handle_request(self, request_line, reader, writer):
+        """Handles one request, returns whether to keep the connection open"""
+
+        try:
+            method, target, version = request_line.decode("latin-1").split()
+        except ValueError:
+            _write_response(writer, 400, {"error": "Malformed request line"}, False)
+            return False
+
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        keep_alive = (
+            version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+        )
+
+        try:
+            length = int(headers.get("content-length", 0))
+        except ValueError:
+            length = -1
+        if not 0 <= length <= MAX_BODY_SIZE:
+            status = 400 if length < 0 else 413
+            _write_response(writer, status, {"error": "Invalid body size"}, False)
+            return False
+
+        body = await reader.readexactly(length) if length else b""
+
+        status, payload = await self._dispatch(method, target.split("?")[0], body)
+        _write_response(writer, status, payload, keep_alive)
+
+        return keep_alive
+
+    async def _dispatch(self, method, path, body):
+        """Routes a request, returns a (status, payload) tuple"""
+
+        if path == "/stats":
+            if method != "GET":
+                return 405, {"error": "Use GET for /stats"}
+            return 200, self.stats()
+
+        if path not in ENDPOINTS:
+            return 404, {"error": f"Unknown endpoint {path}"}
+        if method != "POST":
+            return 405, {"error": f"Use POST for {path}"}
+
+        stats = self._stats[path]
+        start = time.perf_counter()
+        try:
+            request = json.loads(body)
+            if not isinstance(request, dict) or "date" not in request:
+                raise ValueError('Request body must be a JSON object with a "date"')
+
+            status, payload = await self._batchers[path].submit(request)
+        except ValueError as e:
+            status, payload = 400, {"error": _format_error(e)}
+
+        stats.record(time.perf_counter() - start, status)
+
+        return status, payload
+
+    def _convert_batch(self, requests):
+        """Converts a batch of /convert requests"""
+
+        return [
+            _run_request(_convert_request, request, self.correlation)
+            for request in requests
+        ]
+
+    def _calendar_round_batch(self, requests):
+        """Fills in the Calendar Round of a batch of /calendar-round requests"""
+
+        return [_run_request(_calendar_round_record, r) for r in requests]
+
+    async def _infer_batch(self, requests):
+        """Infers a batch of /infer requests in the worker pool"""
+
+        dates = []
+        encoded = []
+        results = [None] * len(requests)
+        for i, request in enumerate(requests):
+            try:
+                date = _read_date(request["date"])
+            except Exception as e:
+                results[i] = (400, {"error": _format_error(e)})
+                continue
+
+            dates.append((i, date))
+            encoded.append(_encode_date(date))
+
+        if encoded:
+            loop = asyncio.get_running_loop()
+            raw_results = await loop.run_in_executor(
+                self._executor, _infer_many, encoded
+            )
+
+            for (i, date), raw_result in zip(dates, raw_results):
+                result = _decode_result(raw_result)
+                if result.error is not None:
+                    results[i] = (400, {"error": result.error})
+                else:
+                    results[i] = (
+                        200,
+                        {
+                            "input": date.to_dict(),
+                            "candidates": [
+                                lc.get_mayadate().to_dict() for lc in result.long_counts
+                            ],
+                        },
+                    )
+
+        return results
+
+
+class _Batcher:
+    """Coalesces concurrent requests to one endpoint into batches
+
+    Each batch is processed in its own task, so a slow batch, e.g. a long
+    inference, does not hold back the batches collected after it.
+    """
+
+    def __init__(self, process_batch, stats, max_batch_size, max_delay):
+        self._process_batch = process_batch
+        self._stats = stats
+        self._max_batch_size = max_batch_size
+        self._max_delay = max_delay
+        self._queue = asyncio.Queue()
+        self._batch_tasks = set()
+        self._task = asyncio.ensure_future(self._run())
+
+    async def submit(self, request):
+        """Queues a request and waits for its (status, payload) result"""
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((request, future))
+
+        return await future
+
+    async def close(self):
+        tasks = [self._task, *self._batch_tasks]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+
+            deadline = loop.time() + self._max_delay
+            while len(batch) < self._max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            task = asyncio.ensure_future(self._complete(batch))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+
+    async def _complete(self, batch):
+        """Processes one batch and resolves the futures of its requests"""
+
+        try:
+            results = self._process_batch([request for request, _ in batch])
+            if asyncio.iscoroutine(results):
+                results = await results
+        except Exception as e:
+            logging.exception("Failed to process a batch of requests")
+            results = [(500, {"error": _format_error(e)})] * len(batch)
+
+        self._stats.record_batch(len(batch))
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+
+class _EndpointStats:
+    """Request, latency and batch counters of one endpoint"""
+
+    __slots__ = (
+        "requests",
+        "errors",
+        "server_errors",
+        "total_seconds",
+        "max_seconds",
+        "batches",
+        "batched_requests",
+    )
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.server_errors = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.batches = 0
+        self.batched_requests = 0
+
+    def record(self, seconds, status):
+        self.requests += 1
+        self.errors += 400 <= status < 500
+        self.server_errors += status >= 500
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+    def record_batch(self, size):
+        self.batches += 1
+        self.batched_requests += size
+
+    def to_dict(self):
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "server_errors": self.server_errors,
+            "mean_latency_ms": 1000 * self.total_seconds / max(self.requests, 1),
+            "max_latency_ms": 1000 * self.max_seconds,
+            "batches": self.batches,
+            "mean_batch_size": self.batched_requests / max(self.batches, 1),
+        }
+
+
+def serve(host="127.0.0.1", port=8000, workers=None, max_batch_size=64):
+    """Runs a MayacalServer until interrupted
+
+    Args:
+        host (str): The host name or address to listen on. Defaults to
+            127.0.0.1.
+        port (int): The port to listen on. Defaults to 8000.
+        workers (int or NoneType): Number of worker processes for inference.
+            Defaults to the number of CPUs.
+        max_batch_size (int): Maximum number of requests processed as one
+            batch. Defaults to 64.
+
+    """
+    server = MayacalServer(host, port, workers, max_batch_size)
+
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+def _worker_context():
+    """Helper function returning a start method that does not fork the server"""
+
+    methods = multiprocessing.get_all_start_methods()
+
+    return multiprocessing.get_context(
+        "forkserver" if "forkserver" in methods else "spawn"
+    )
+
+
+def _infer_many(encoded):
+    """Worker function inferring a batch of encoded dates"""
+
+    return [_infer_encoded(e) for e in encoded]
+
+
+def _read_date(value):
+    """Helper function to build a Mayadate from a JSON dictionary or a string"""
+
+    if isinstance(value, str):
+        return parse_mayadate(value)
+    if isinstance(value, dict):
+        return from_dict(value)
+
+    raise ValueError("date must be a dictionary or a string")
+
+
+def _convert_request(request, default_correlation):
+    """Helper function converting the date of a /convert request"""
+
+    correlation = int(request.get("correlation", default_correlation))
+
+    return _convert_record(_read_date(request["date"]), correlation)
+
+
+def _calendar_round_record(request):
+    """Helper function returning a date with its Calendar Round filled in"""
+
+    date = _read_date(request["date"])
+    if date.long_count.has_missing():
+        raise ValueError("Calendar Round lookup requires a complete Long Count date")
+
+    return date.long_count.get_mayadate().to_dict()
+
+
+def _run_request(process, request, *args):
+    """Helper function to run one request, returning a (status, payload) tuple"""
+
+    try:
+        return 200, process(request, *args)
+    except Exception as e:
+        return 400, {"error": _format_error(e)}
+
+
+def _write_response(writer, status, payload, keep_alive):
+    """Helper function to write a JSON response"""
+
+    body = json.dumps(payload).encode("utf-8")
+    head = (
+        f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+        "\r\n"
+    )
+    writer.write(head.encode("latin-1") + body)
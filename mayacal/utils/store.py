@@ -0,0 +1,235 @@
+import struct
+
+try:
+    import numpy as np
+except ImportError:  # numpy is an optional dependency
+    np = None
+
+from .long_count_array import LongCountArray
+from .records import MAYADATE_COLUMNS, _mayadate_to_row, _row_to_mayadate
+from .utils import _require_numpy
+
+__all__ = ["MayadateStore", "write_store", "STORE_RECORD_DTYPE"]
+
+# File header: magic bytes, format version, record size in bytes, record count
+STORE_MAGIC = b"MAYA"
+STORE_VERSION = 1
+HEADER_FORMAT = "<4sHHQ"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+
+# Fixed-width record layout. total_kin and calendar_round_index are -1 where
+# the Long Count or Calendar Round is incomplete. Bit i of mask is set if field
+# MAYADATE_COLUMNS[i] is missing, in which case the stored value is 0.
+STORE_RECORD_DTYPE = (
+    None
+    if np is None
+    else np.dtype(
+        [("total_kin", "<i4"), ("calendar_round_index", "<i2"), ("mask", "<u2")]
+        + [(name, "u1") for name in MAYADATE_COLUMNS]
+    )
+)
+
+WRITE_CHUNK_SIZE = 65536
+
+
+def write_store(dates, path):
+    """Writes Maya dates to a fixed-width binary file
+
+    Each date is stored as an 18 byte record holding its total kin, Calendar
+    Round index, a missing value bitmask and the fields of Mayadate.to_dict,
+    with day and month names stored as indices. Partial dates are supported
+    and round-trip losslessly. Dates are written in chunks, so any iterable
+    can be streamed to disk. Requires numpy.
+
+    Args:
+        dates (iterable): Mayadate objects to write, may be partial dates
+        path (str): Path of the file to write
+
+    Returns:
+        (int): The number of records written
+
+    """
+    _require_numpy("write_store")
+
+    count = 0
+    with open(path, "wb") as fh:
+        fh.write(_pack_header(0))
+
+        chunk = []
+        for date in dates:
+            chunk.append(_encode_record(date))
+            if len(chunk) >= WRITE_CHUNK_SIZE:
+                fh.write(np.array(chunk, dtype=STORE_RECORD_DTYPE).tobytes())
+                count += len(chunk)
+                chunk = []
+
+        fh.write(np.array(chunk, dtype=STORE_RECORD_DTYPE).tobytes())
+        count += len(chunk)
+
+        fh.seek(0)
+        fh.write(_pack_header(count))
+
+    return count
+
+
+class MayadateStore:
+    """Read-only, memory-mapped access to a file written by write_store
+
+    Records are not loaded into memory. Columns are exposed as zero-copy numpy
+    views of the file, and Mayadate objects are only created when a single
+    record is accessed. Requires numpy.
+
+    Attributes:
+        records (numpy.memmap): Structured array of all records, with dtype
+            STORE_RECORD_DTYPE
+
+    """
+
+    def __init__(self, path):
+        """Opens a Maya date store
+
+        Args:
+            path (str): Path of a file written by write_store
+
+        """
+        _require_numpy("MayadateStore")
+
+        with open(path, "rb") as fh:
+            header = fh.read(HEADER_SIZE)
+
+        if len(header) < HEADER_SIZE:
+            raise ValueError("File is too short to be a Maya date store")
+
+        magic, version, record_size, count = struct.unpack(HEADER_FORMAT, header)
+        if magic != STORE_MAGIC:
+            raise ValueError("File is not a Maya date store")
+        if version != STORE_VERSION or record_size != STORE_RECORD_DTYPE.itemsize:
+            raise ValueError(
+                f"Unsupported Maya date store version {version} with record size {record_size}"
+            )
+
+        if count == 0:
+            self.records = np.zeros(0, dtype=STORE_RECORD_DTYPE)
+        else:
+            self.records = np.memmap(
+                path,
+                dtype=STORE_RECORD_DTYPE,
+                mode="r",
+                offset=HEADER_SIZE,
+                shape=(count,),
+            )
+
+    @property
+    def total_kin(self):
+        """(numpy.ndarray): Total kin since 0.0.0.0.0, -1 if the Long Count is incomplete"""
+
+        return self.records["total_kin"]
+
+    @property
+    def calendar_round_index(self):
+        """(numpy.ndarray): Calendar Round index, -1 if the Calendar Round is incomplete"""
+
+        return self.records["calendar_round_index"]
+
+    @property
+    def mask(self):
+        """(numpy.ndarray): Missing value bitmask, bit i for field MAYADATE_COLUMNS[i]"""
+
+        return self.records["mask"]
+
+    def column(self, name):
+        """Returns a zero-copy view of one field of the records
+
+        Args:
+            name (str): One of MAYADATE_COLUMNS, e.g. 'katun' or 'month_name'
+
+        Returns:
+            (numpy.ndarray): The field values, 0 where the value is missing
+
+        """
+        if name not in MAYADATE_COLUMNS:
+            raise ValueError(f"Unrecognized column {name}")
+
+        return self.records[name]
+
+    def is_missing(self, name):
+        """Checks which records are missing a field
+
+        Args:
+            name (str): One of MAYADATE_COLUMNS
+
+        Returns:
+            (numpy.ndarray): Boolean array, True where the field is missing
+
+        """
+        if name not in MAYADATE_COLUMNS:
+            raise ValueError(f"Unrecognized column {name}")
+
+        return (self.mask & (1 << MAYADATE_COLUMNS.index(name))) != 0
+
+    def to_long_count_array(self):
+        """Returns the Long Count dates of all records as a LongCountArray
+
+        Returns:
+            (LongCountArray): The Long Count dates. Raises a ValueError if any
+                record has an incomplete Long Count.
+
+        """
+        return LongCountArray.from_kin(self.total_kin)
+
+    def __len__(self):
+        return len(self.records)
+
+    def __getitem__(self, idx):
+        if not isinstance(idx, (int, np.integer)):
+            raise TypeError("MayadateStore indices must be integers")
+
+        return _decode_record(self.records[idx])
+
+    def __iter__(self):
+        for record in self.records:
+            yield _decode_record(record)
+
+
+def _pack_header(count):
+    """Helper function to build the file header for count records"""
+
+    return struct.pack(
+        HEADER_FORMAT, STORE_MAGIC, STORE_VERSION, STORE_RECORD_DTYPE.itemsize, count
+    )
+
+
+def _encode_record(date):
+    """Helper function to encode a Mayadate as a tuple matching STORE_RECORD_DTYPE"""
+
+    row = _mayadate_to_row(date)
+
+    mask = 0
+    for i, value in enumerate(row):
+        if value is None:
+            mask |= 1 << i
+            row[i] = 0
+
+    if date.long_count.has_missing():
+        total_kin = -1
+    else:
+        total_kin = date.long_count.get_total_kin()
+
+    calendar_round = date.calendar_round
+    cr_index = None if calendar_round.has_missing() else calendar_round.index
+    if cr_index is None:
+        cr_index = -1
+
+    return (total_kin, cr_index, mask, *row)
+
+
+def _decode_record(record):
+    """Helper function to build a Mayadate from a record of a Maya date store"""
+
+    mask = int(record["mask"])
+    row = [
+        None if mask & (1 << i) else int(record[name])
+        for i, name in enumerate(MAYADATE_COLUMNS)
+    ]
+
+    return _row_to_mayadate(*row, override_coef_check=True)
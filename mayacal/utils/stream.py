@@ -0,0 +1,217 @@
+import json
+import logging
+
+from .mayadate import from_dict
+
+__all__ = ["read_jsonl", "process_jsonl", "convert_jsonl", "STREAM_MODES"]
+
+STREAM_MODES = ("infer", "convert", "normalize")
+
+
+def read_jsonl(source, on_error=None):
+    """Lazily reads Mayadate objects from JSON Lines input
+
+    Each line must hold one JSON object in the format produced by
+    Mayadate.to_dict. Lines are read and parsed one at a time, so memory use
+    does not depend on the size of the input. Blank lines are skipped.
+
+    Malformed records do not stop the stream. They are passed to on_error, or
+    logged and skipped if no on_error function is given.
+
+    Args:
+        source (str or iterable): Path to a JSON Lines file, or an iterable of
+            lines such as an open file object
+        on_error (callable): Function called as on_error(line_number, line, error)
+            for every record that cannot be parsed. Defaults to None.
+
+    Yields:
+        A (line_number, Mayadate) tuple for every valid record
+
+    """
+    for line_number, line in _iter_lines(source):
+        try:
+            yield line_number, from_dict(json.loads(line))
+        except Exception as e:
+            _report_error(on_error, line_number, line, e)
+
+
+def process_jsonl(source, mode="infer", on_error=None, correlation=584283):
+    """Lazily reads JSON Lines input and infers or converts each record
+
+    Supported modes:
+        'infer': {"input": <record>, "candidates": [<record>, ...]} with all
+            Maya dates matching the (partial) input record
+        'convert': the completed record with "julian_day", "julian" and
+            "gregorian" fields added. Records with missing Long Count positions
+            are reported as errors.
+        'normalize': the record with its Calendar Round and Glyph G filled in
+            where they can be computed from the Long Count
+
+    Args:
+        source (str or iterable): Path to a JSON Lines file, or an iterable of
+            lines such as an open file object
+        mode (str): One of 'infer', 'convert' or 'normalize'. Defaults to 'infer'.
+        on_error (callable): Function called as on_error(line_number, line, error)
+            for every record that cannot be parsed or processed. Defaults to None.
+        correlation (int): The correlation constant to use in 'convert' mode.
+            Defaults to 584283.
+
+    Yields:
+        A (line_number, dict) tuple for every successfully processed record
+
+    """
+    _check_mode(mode)
+
+    return _process_lines(source, mode, on_error, correlation)
+
+
+def _process_lines(source, mode, on_error, correlation):
+    """Generator implementing process_jsonl"""
+
+    for line_number, line in _iter_lines(source):
+        try:
+            date = from_dict(json.loads(line))
+
+            if mode == "infer":
+                result = {
+                    "input": date.to_dict(),
+                    "candidates": [d.to_dict() for d in date.infer_mayadates()],
+                }
+            elif mode == "convert":
+                result = _convert_record(date, correlation)
+            else:
+                result = date.to_dict()
+        except Exception as e:
+            _report_error(on_error, line_number, line, e)
+            continue
+
+        yield line_number, result
+
+
+def convert_jsonl(
+    source,
+    destination,
+    mode="infer",
+    errors=None,
+    chunk_size=1000,
+    correlation=584283,
+):
+    """Streams JSON Lines input through process_jsonl and writes the results
+
+    Results are buffered and written in chunks of at most chunk_size lines, so
+    memory use stays constant regardless of the size of the input. Records
+    that cannot be parsed or processed are written to errors as JSON Lines in
+    the format {"line": <line number>, "error": <message>, "record": <input>}.
+
+    Args:
+        source (str or iterable): Path to a JSON Lines file, or an iterable of
+            lines such as an open file object
+        destination (str or file): Path or writable file object for the results
+        mode (str): One of 'infer', 'convert' or 'normalize'. Defaults to 'infer'.
+        errors (str or file): Path or writable file object for rejected
+            records. If None, rejected records are logged and skipped.
+        chunk_size (int): Maximum number of result lines buffered before
+            writing. Defaults to 1000.
+        correlation (int): The correlation constant to use in 'convert' mode.
+            Defaults to 584283.
+
+    Returns:
+        A (num_written, num_failed) tuple with the number of records written to
+            destination and the number of rejected records
+
+    """
+    _check_mode(mode)
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer")
+
+    if isinstance(destination, str):
+        with open(destination, "w") as fh:
+            return convert_jsonl(source, fh, mode, errors, chunk_size, correlation)
+
+    if isinstance(errors, str):
+        with open(errors, "w") as fh:
+            return convert_jsonl(source, destination, mode, fh, chunk_size, correlation)
+
+    num_failed = 0
+
+    def on_error(line_number, line, error):
+        nonlocal num_failed
+        num_failed += 1
+
+        if errors is None:
+            _report_error(None, line_number, line, error)
+        else:
+            rejected = {
+                "line": line_number,
+                "error": f"{type(error).__name__}: {error}",
+                "record": line.rstrip("\n"),
+            }
+            errors.write(json.dumps(rejected) + "\n")
+
+    num_written = 0
+    chunk = []
+    for _, result in process_jsonl(source, mode, on_error, correlation):
+        chunk.append(json.dumps(result) + "\n")
+        if len(chunk) >= chunk_size:
+            destination.writelines(chunk)
+            num_written += len(chunk)
+            chunk = []
+
+    destination.writelines(chunk)
+    num_written += len(chunk)
+
+    return num_written, num_failed
+
+
+def _check_mode(mode):
+    """Raises a ValueError for unsupported processing modes"""
+
+    if mode not in STREAM_MODES:
+        raise ValueError(
+            f"Unrecognized mode {mode} - supports {', '.join(STREAM_MODES)}"
+        )
+
+
+def _iter_lines(source):
+    """Helper function to lazily yield (line_number, line) for non-blank lines"""
+
+    if isinstance(source, str):
+        with open(source, "r") as fh:
+            yield from _iter_lines(fh)
+        return
+
+    for line_number, line in enumerate(source, start=1):
+        if line.strip():
+            yield line_number, line
+
+
+def _convert_record(date, correlation):
+    """Helper function to add Julian and Gregorian calendar dates to a record"""
+
+    if date.long_count.has_missing():
+        raise ValueError(
+            "Conversion not valid for incomplete Long Count dates, try inferring the missing portions"
+        )
+
+    julian = date.to_julian(correlation)
+    gregorian = date.to_gregorian(correlation)
+
+    result = date.to_dict()
+    result["julian_day"] = date.to_julian_day(correlation)
+    result["julian"] = {"day": julian.day, "month": julian.month, "year": julian.year}
+    result["gregorian"] = {
+        "day": gregorian.day,
+        "month": gregorian.month,
+        "year": gregorian.year,
+    }
+
+    return result
+
+
+def _report_error(on_error, line_number, line, error):
+    """Helper function to send a rejected record to the error side channel"""
+
+    if on_error is None:
+        logging.warning(f"Skipping record on line {line_number}: {error}")
+    else:
+        on_error(line_number, line, error)
@@ -0,0 +1,134 @@
+__all__ = [
+    "LORDS_OF_THE_NIGHT",
+    "STATION_819_DIRECTIONS",
+    "STATION_819_COLORS",
+    "SYNODIC_MONTH",
+    "REFERENCE_NEW_MOON_JD",
+    "MOON_AGE_TOLERANCE",
+    "lord_of_the_night",
+    "days_since_819_station",
+    "direction_819_index",
+    "moon_age",
+    "moon_age_matches",
+]
+
+# Glyph G of each of the nine Lords of the Night, indexed by (total kin - 1) % 9
+LORDS_OF_THE_NIGHT = tuple(f"G{i}" for i in range(1, 10))
+
+# The 819 day count has stations every 819 (7 * 9 * 13) days. The station
+# before 0.0.0.0.0 fell 3 days earlier, on 1 Kaban 5 Kumku, so stations are the
+# days where (total kin + 3) % 819 == 0, and always fall on a day numbered 1.
+STATION_819_LENGTH = 819
+STATION_819_OFFSET = 3
+
+# Directions of successive stations, starting with the station on 1 Kaban 5
+# Kumku. Each station falls one day name earlier than the previous one, and
+# takes the direction of its day name: Imix, Chikchan, Muluk, Ben and Kaban
+# are east, Ik, Kimi, Ok, Ix and Etznab north, Akbal, Manik, Chuwen, Men and
+# Kawak west, and K'an, Lamat, Eb, Kib and Ajaw south.
+STATION_819_DIRECTIONS = ("east", "south", "west", "north")
+
+STATION_819_COLORS = {
+    "east": "red",
+    "south": "yellow",
+    "west": "black",
+    "north": "white",
+}
+
+# Mean length of a lunation in days, and the Julian Day of the new moon of
+# 6 January 2000 used as the reference for the moon age
+SYNODIC_MONTH = 29.530588853
+REFERENCE_NEW_MOON_JD = 2451550.1
+
+# Largest difference in days between a recorded and a computed moon age that
+# is still treated as a match. The lunar series counted from first visibility
+# rather than from conjunction, and the mean lunation ignores the variation
+# in the length of real lunations.
+MOON_AGE_TOLERANCE = 2.0
+
+
+def lord_of_the_night(total_kin):
+    """Finds the Lord of the Night (Glyph G) number of a date
+
+    Works on integers and on numpy integer arrays.
+
+    Args:
+        total_kin (int or numpy.ndarray): The number of kin since 0.0.0.0.0
+
+    Returns:
+        (int or numpy.ndarray): The number of the Lord of the Night, from 1 to 9.
+            Use LORDS_OF_THE_NIGHT[number - 1] for the Glyph G.
+
+    """
+    return (total_kin - 1) % 9 + 1
+
+
+def days_since_819_station(total_kin):
+    """Finds the number of days since the last station of the 819 day count
+
+    Works on integers and on numpy integer arrays.
+
+    Args:
+        total_kin (int or numpy.ndarray): The number of kin since 0.0.0.0.0
+
+    Returns:
+        (int or numpy.ndarray): The number of days since the station, from 0 to
+            818
+
+    """
+    return (total_kin + STATION_819_OFFSET) % STATION_819_LENGTH
+
+
+def direction_819_index(total_kin):
+    """Finds the direction of the last station of the 819 day count
+
+    Works on integers and on numpy integer arrays.
+
+    Args:
+        total_kin (int or numpy.ndarray): The number of kin since 0.0.0.0.0
+
+    Returns:
+        (int or numpy.ndarray): The index of the direction in
+            STATION_819_DIRECTIONS
+
+    """
+    return (total_kin + STATION_819_OFFSET) // STATION_819_LENGTH % 4
+
+
+def moon_age(total_kin, correlation=584283):
+    """Approximates the age of the moon, in days since the last new moon
+
+    Uses the mean lunation, so the result can be off by about a day from the
+    true conjunction. Works on integers and on numpy integer arrays.
+
+    Args:
+        total_kin (int or numpy.ndarray): The number of kin since 0.0.0.0.0
+        correlation (int): The correlation constant to use. Defaults to 584283.
+
+    Returns:
+        (float or numpy.ndarray): The moon age in days, from 0 up to
+            SYNODIC_MONTH
+
+    """
+    return (total_kin + correlation - REFERENCE_NEW_MOON_JD) % SYNODIC_MONTH
+
+
+def moon_age_matches(total_kin, age, correlation=584283):
+    """Checks whether a recorded moon age is consistent with a date
+
+    Args:
+        total_kin (int or numpy.ndarray): The number of kin since 0.0.0.0.0
+        age (float): The recorded moon age in days, e.g. from Glyphs D and E
+        correlation (int): The correlation constant to use. Defaults to 584283.
+
+    Returns:
+        (bool or numpy.ndarray): True where the computed and recorded moon ages
+            differ by at most MOON_AGE_TOLERANCE days, allowing for the wrap
+            around at the new moon
+
+    """
+    difference = (moon_age(total_kin, correlation) - age) % SYNODIC_MONTH
+
+    return (difference <= MOON_AGE_TOLERANCE) | (
+        difference >= SYNODIC_MONTH - MOON_AGE_TOLERANCE
+    )
@@ -33,14 +33,12 @@ TZOLKIN_DAYS = [
 TZOLKIN_IDX_TO_DAY = {idx: day for idx, day in enumerate(TZOLKIN_DAYS)}
 TZOLKIN_DAY_TO_IDX = {day: idx for idx, day in TZOLKIN_IDX_TO_DAY.items()}
 
-TZOLKIN_NUM_TO_DAY = {}
-
-for _i in range(260):
-    _date = ((_i % 13) + 1, TZOLKIN_IDX_TO_DAY[(_i % 20)])
-    TZOLKIN_NUM_TO_DAY[_i] = _date
+TZOLKIN_NUM_TO_DAY = {i: ((i % 13) + 1, TZOLKIN_DAYS[i % 20]) for i in range(260)}
 
 TZOLKIN_DAY_TO_NUM = {date: num for num, date in TZOLKIN_NUM_TO_DAY.items()}
 
+TZOLKIN_DAY_NUMBERS = range(1, 14)
+
 
 class Tzolkin:
     """Represents a day number, day name combination in the 260 day count
@@ -52,6 +50,8 @@ class Tzolkin:
 
     """
 
+    __slots__ = ("day_number", "day_name", "tzolkin_num")
+
     def __init__(self, day_number=None, day_name=None, tzolkin_num=None):
         """Creates a new Tzolkin object
 
@@ -81,7 +81,7 @@ class Tzolkin:
                 raise ValueError(f"Invalid tzolkin day name {day_name}")
             self.day_name = day_name
 
-            if day_number not in list(range(1, 14)) and day_number is not None:
+            if day_number not in TZOLKIN_DAY_NUMBERS and day_number is not None:
                 raise ValueError(
                     "Invalid tzolkin day number - must be integer between 1 and 13"
                 )
@@ -89,12 +89,43 @@ class Tzolkin:
 
             if day_number is not None and day_name is not None:
                 self.tzolkin_num = TZOLKIN_DAY_TO_NUM[(day_number, day_name)]
+            else:
+                self.tzolkin_num = None
+
+    @classmethod
+    def of(cls, tzolkin_num):
+        """Returns the shared, immutable Tzolkin object for a position in the 260 day count
+
+        Each of the 260 possible Tzolkin dates is created on first use and
+        reused, so repeated calls with the same number return the identical
+        object. The returned object cannot be modified: setting an attribute,
+        reset_by_tzolkin_num and add_days with in_place=True raise AttributeError.
+        Calendar Rounds computed from Long Count dates, e.g. by
+        CalendarRound.from_index, are made of these objects.
+
+        Args:
+            tzolkin_num (int): Integer from 0-259 representing days since 1 Imix.
+
+        Returns:
+            (Tzolkin): The interned Tzolkin object
+
+        """
+        if not 0 <= tzolkin_num < 260:
+            raise ValueError("Invalid Tzolkin number, must be between 0 and 259")
+
+        tzolkin = _INTERNED_TZOLKINS[tzolkin_num]
+        if tzolkin is None:
+            tzolkin = _make_interned_tzolkin(tzolkin_num)
+            _INTERNED_TZOLKINS[tzolkin_num] = tzolkin
+
+        return tzolkin
 
     def reset_by_tzolkin_num(self, new_num):
         """Set the Tzolkin object to a new position by its 260 day count number
 
         Note:
-            1 Imix is used as the reference 'Day 0' of the cycle
+            1 Imix is used as the reference 'Day 0' of the cycle. Interned
+            objects from Tzolkin.of cannot be modified and raise AttributeError.
 
         Args:
             new_num (int): Integer from 0-259 representing new position in the
@@ -113,7 +144,9 @@ class Tzolkin:
         Args:
             num_days (int): Number of days to add to the Tzolkin object
             in_place (bool): Whether to modify the existing object or return a
-                new object. Defaults to False.
+                new object. Defaults to False. Interned objects from Tzolkin.of,
+                including those in Calendar Rounds computed from Long Count
+                dates, cannot be modified and raise AttributeError.
 
         Returns:
             A new Tzolkin object num_days ahead of the previous object
@@ -125,7 +158,7 @@ class Tzolkin:
             return self
 
         else:
-            return Tzolkin(tzolkin_num=new_num)
+            return Tzolkin.of(new_num)
 
     def has_missing(self):
         """Checks whether the day number or name is missing
@@ -182,6 +215,9 @@ class Tzolkin:
         return False
 
     def __eq__(self, date):
+        if self is date:
+            return True
+
         name_same = self.day_name == date.day_name
         num_same = self.day_number == date.day_number
 
@@ -196,3 +232,34 @@ class Tzolkin:
 
     def __repr__(self):
         return f"{self.day_number} {self.day_name}"
+
+
+class _InternedTzolkin(Tzolkin):
+    """Immutable Tzolkin object shared through Tzolkin.of"""
+
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        raise AttributeError(
+            "Interned Tzolkin objects, e.g. from Tzolkin.of or CalendarRound.from_index, "
+            "are immutable, use add_days without in_place and assign the result"
+        )
+
+    def __reduce__(self):
+        return (Tzolkin.of, (self.tzolkin_num,))
+
+
+def _make_interned_tzolkin(tzolkin_num):
+    """Helper function to build the interned Tzolkin object for a position"""
+
+    tzolkin = object.__new__(_InternedTzolkin)
+    day_number, day_name = TZOLKIN_NUM_TO_DAY[tzolkin_num]
+    object.__setattr__(tzolkin, "day_number", day_number)
+    object.__setattr__(tzolkin, "day_name", day_name)
+    object.__setattr__(tzolkin, "tzolkin_num", tzolkin_num)
+
+    return tzolkin
+
+
+# Interned objects by Tzolkin number, created on first use by Tzolkin.of
+_INTERNED_TZOLKINS = [None] * 260
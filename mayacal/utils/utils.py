@@ -6,6 +6,8 @@ __all__ = [
     "GregorianDate",
     "julian_day_to_julian",
     "julian_day_to_gregorian",
+    "julian_days_to_julian",
+    "julian_days_to_gregorian",
     "datetime_to_gregorian",
     "datetime_to_julian",
     "datetime_to_julian_day",
@@ -48,8 +50,30 @@ class JulianDate:
 
         self.__check_month_days()
 
-    def to_julian_day(self):
-        """Converts the Julian Calendar date to its corresponding Julian Day number
+    @classmethod
+    def from_jdn(cls, jdn):
+        """Creates a JulianDate object from an integer Julian Day number
+
+        Note that the algorithm is only valid for Julian Day numbers greater than or
+        equal to zero. Negative arguments for jdn will raise a ValueError.
+
+        Args:
+            jdn (int): The Julian Day number of the date, i.e. the Julian Day
+                starting at noon on that date
+
+        Returns:
+            (JulianDate): The Julian calendar date with the given Julian Day number
+
+        """
+        day, month, year = _convert_julian_day(jdn, mode="julian")
+
+        return cls(day, month, year)
+
+    def to_jdn(self):
+        """Converts the Julian Calendar date to its integer Julian Day number
+
+        The Julian Day number of a date is the Julian Day starting at noon on that
+        date, so it can be computed using integer arithmetic only.
 
         Note that the algorithm is only valid for Julian Day numbers greater than or
         equal to zero, i.e. Julian calendar years after -4712 (4713 BCE). Earlier
@@ -76,7 +100,24 @@ class JulianDate:
 
         D = self.day
 
-        return D + (153 * M - 457) // 5 + 365 * Y + math.floor(Y / 4) + 1721116.5
+        return D + (153 * M - 457) // 5 + 365 * Y + Y // 4 + 1721117
+
+    def to_julian_day(self):
+        """Converts the Julian Calendar date to its corresponding Julian Day
+
+        Returns the Julian Day at the start (midnight) of the date, i.e. the
+        integer Julian Day number from to_jdn minus one half.
+
+        Note that the algorithm is only valid for Julian Day numbers greater than or
+        equal to zero, i.e. Julian calendar years after -4712 (4713 BCE). Earlier
+        calendar years will raise a ValueError.
+
+        Returns:
+            (float): The Julian Day corresponding to the Julian Calendar date
+
+        """
+
+        return self.to_jdn() - 0.5
 
     def to_gregorian(self, as_datetime=False):
         """Converts the Julian calendar date to its Gregorian calendar equivalent
@@ -86,7 +127,7 @@ class JulianDate:
                 Julian calendar date.
 
         """
-        return julian_day_to_gregorian(math.ceil(self.to_julian_day()))
+        return GregorianDate.from_jdn(self.to_jdn())
 
     def to_mayadate(self, correlation=584283):
         """Converts the Julian calendar date to its Mayan calendar equivalent
@@ -97,11 +138,10 @@ class JulianDate:
 
         """
 
-        from .long_count import LongCount, kin_to_long_count
+        from .long_count import kin_to_long_count
         from .mayadate import Mayadate
 
-        num_kin = math.ceil(self.to_julian_day()) - correlation
-        long_count = kin_to_long_count(num_kin)
+        long_count = kin_to_long_count(self.to_jdn() - correlation)
 
         return Mayadate(long_count, None)
 
@@ -194,13 +234,36 @@ class GregorianDate:
 
         self.__check_month_days()
 
-    def to_julian_day(self):
-        """Converts the Gregorian calendar date to its Julian Day number equivalent
+    @classmethod
+    def from_jdn(cls, jdn):
+        """Creates a GregorianDate object from an integer Julian Day number
+
+        Note that the algorithm is only valid for Julian Day numbers greater than or
+        equal to zero. Negative arguments for jdn will raise a ValueError.
+
+        Args:
+            jdn (int): The Julian Day number of the date, i.e. the Julian Day
+                starting at noon on that date
+
+        Returns:
+            (GregorianDate): The Gregorian calendar date with the given Julian
+                Day number
+
+        """
+        day, month, year = _convert_julian_day(jdn, mode="gregorian")
+
+        return cls(day, month, year)
+
+    def to_jdn(self):
+        """Converts the Gregorian calendar date to its integer Julian Day number
+
+        The Julian Day number of a date is the Julian Day starting at noon on that
+        date, so it can be computed using integer arithmetic only.
 
         Adapted from: https://www.researchgate.net/publication/316558298_Date_Algorithms#pf5
 
         Returns:
-            (float): The Julian day number corresponding to the Gregorian calendar
+            (int): The Julian Day number corresponding to the Gregorian calendar
                 date.
 
         """
@@ -214,15 +277,22 @@ class GregorianDate:
         D = self.day
 
         return (
-            D
-            + (153 * M - 457) // 5
-            + 365 * Y
-            + math.floor(Y / 4)
-            - math.floor(Y / 100)
-            + math.floor(Y / 400)
-            + 1721118.5
+            D + (153 * M - 457) // 5 + 365 * Y + Y // 4 - Y // 100 + Y // 400 + 1721119
         )
 
+    def to_julian_day(self):
+        """Converts the Gregorian calendar date to its Julian Day equivalent
+
+        Returns the Julian Day at the start (midnight) of the date, i.e. the
+        integer Julian Day number from to_jdn minus one half.
+
+        Returns:
+            (float): The Julian day corresponding to the Gregorian calendar
+                date.
+
+        """
+        return self.to_jdn() - 0.5
+
     def to_julian(self):
         """Converts the Gregorian calendar date to its Julian calendar equivalent
 
@@ -231,7 +301,7 @@ class GregorianDate:
                 calendar date.
 
         """
-        return julian_day_to_julian(math.ceil(self.to_julian_day()))
+        return JulianDate.from_jdn(self.to_jdn())
 
     def to_mayadate(self, correlation=584283):
         """Converts the Gregorian calendar date to its Mayan calendar equivalent
@@ -241,11 +311,10 @@ class GregorianDate:
                 calendar date.
 
         """
-        from .long_count import LongCount, kin_to_long_count
+        from .long_count import kin_to_long_count
         from .mayadate import Mayadate
 
-        num_kin = math.ceil(self.to_julian_day()) - correlation
-        long_count = kin_to_long_count(num_kin)
+        long_count = kin_to_long_count(self.to_jdn() - correlation)
 
         return Mayadate(long_count, None)
 
@@ -343,8 +412,31 @@ def _convert_julian_day(julian_day, mode="julian"):
         raise ValueError(
             "Algorithm only valid for Julian Day greater than or equal to zero"
         )
-    julian_day = math.ceil(julian_day)
+    if type(julian_day) is not int:
+        julian_day = math.ceil(julian_day)
 
+    if mode == "julian":
+        return _richards_algorithm(julian_day, gregorian=False)
+    elif mode == "gregorian":
+        return _richards_algorithm(julian_day, gregorian=True)
+    else:
+        raise ValueError("Unrecognized mode - supports 'julian' or 'gregorian'")
+
+
+def _richards_algorithm(julian_day, gregorian):
+    """Shared arithmetic for Julian Day number to calendar date conversion
+
+    Only uses integer operations (//, %, +, *), so works both for python ints and
+    for numpy integer arrays, in which case the conversion runs elementwise.
+
+    Args:
+        julian_day (int or numpy.ndarray): Integer Julian Day number(s)
+        gregorian (bool): If True, converts to the Gregorian calendar, else to
+            the Julian calendar
+
+    Returns:
+        A (day, month, year) tuple in the target calendar
+    """
     # algorithm parameters
     y = 4716
     j = 1401
@@ -360,12 +452,9 @@ def _convert_julian_day(julian_day, mode="julian"):
     C = -38
 
     # intermediate calculations
-    if mode == "julian":
-        f = julian_day + j
-    elif mode == "gregorian":
-        f = julian_day + j + (((4 * julian_day + B) // 146097) * 3) // 4 + C
-    else:
-        raise ValueError("Unrecognized mode - supports 'julian' or 'gregorian'")
+    f = julian_day + j
+    if gregorian:
+        f = f + (((4 * julian_day + B) // 146097) * 3) // 4 + C
 
     e = r * f + v
     g = (e % p) // r
@@ -378,6 +467,24 @@ def _convert_julian_day(julian_day, mode="julian"):
     return day, month, year
 
 
+def _convert_julian_days(julian_days, gregorian):
+    """Helper function to run the date conversion over an array of Julian Days"""
+
+    np = _require_numpy("Batch Julian Day conversion")
+
+    julian_days = np.asarray(julian_days)
+    if julian_days.dtype.kind not in "iu":
+        julian_days = np.ceil(julian_days)
+    julian_days = julian_days.astype(np.int64)
+
+    if julian_days.size and julian_days.min() < 0:
+        raise ValueError(
+            "Algorithm only valid for Julian Day greater than or equal to zero"
+        )
+
+    return _richards_algorithm(julian_days, gregorian=gregorian)
+
+
 def julian_day_to_julian(julian_day):
     """Converts a Julian Day number to its (proleptic) Julian calendar equivalent
 
@@ -396,9 +503,7 @@ def julian_day_to_julian(julian_day):
 
     """
 
-    day, month, year = _convert_julian_day(julian_day, mode="julian")
-
-    return JulianDate(day, month, year)
+    return JulianDate.from_jdn(julian_day)
 
 
 def julian_day_to_gregorian(julian_day):
@@ -418,9 +523,49 @@ def julian_day_to_gregorian(julian_day):
             Gregorian calendar.
 
     """
-    day, month, year = _convert_julian_day(julian_day, mode="gregorian")
+    return GregorianDate.from_jdn(julian_day)
 
-    return GregorianDate(day, month, year)
+
+def julian_days_to_julian(julian_days):
+    """Converts an array of Julian Day numbers to (proleptic) Julian calendar dates
+
+    Vectorized equivalent of julian_day_to_julian, returning columns of integers
+    rather than JulianDate objects. Requires numpy.
+
+    Note that the algorithm is only valid for Julian Day numbers greater than or
+    equal to zero. Negative values will raise a ValueError.
+
+    Args:
+        julian_days (array_like): Julian Day numbers to convert, must be greater
+            than or equal to 0
+
+    Returns:
+        A (day, month, year) tuple of int64 numpy arrays representing the days,
+            months, and years in the Julian calendar.
+
+    """
+    return _convert_julian_days(julian_days, gregorian=False)
+
+
+def julian_days_to_gregorian(julian_days):
+    """Converts an array of Julian Day numbers to (proleptic) Gregorian calendar dates
+
+    Vectorized equivalent of julian_day_to_gregorian, returning columns of
+    integers rather than GregorianDate objects. Requires numpy.
+
+    Note that the algorithm is only valid for Julian Day numbers greater than or
+    equal to zero. Negative values will raise a ValueError.
+
+    Args:
+        julian_days (array_like): Julian Day numbers to convert, must be greater
+            than or equal to 0
+
+    Returns:
+        A (day, month, year) tuple of int64 numpy arrays representing the days,
+            months, and years in the Gregorian calendar.
+
+    """
+    return _convert_julian_days(julian_days, gregorian=True)
 
 
 def datetime_to_gregorian(date):
@@ -482,6 +627,70 @@ def datetime_to_mayadate(date):
     return g.to_mayadate()
 
 
+def _solve_congruences(a1, m1, a2, m2):
+    """Combines two congruences using the (generalized) Chinese Remainder Theorem
+
+    Finds all x such that x = a1 (mod m1) and x = a2 (mod m2). The moduli do not
+    need to be coprime.
+
+    Args:
+        a1 (int): Residue of the first congruence
+        m1 (int): Modulus of the first congruence
+        a2 (int): Residue of the second congruence
+        m2 (int): Modulus of the second congruence
+
+    Returns:
+        An (a, m) tuple such that the solutions are exactly x = a (mod m), with
+            m the least common multiple of m1 and m2. None if the congruences
+            have no common solution.
+
+    """
+    g, p = _extended_gcd(m1, m2)
+    if (a2 - a1) % g != 0:
+        return None
+
+    m = m1 // g * m2
+    t = ((a2 - a1) // g * p) % (m2 // g)
+
+    return (a1 + m1 * t) % m, m
+
+
+def _extended_gcd(a, b):
+    """Returns (g, p) with g = gcd(a, b) and p such that a * p = g (mod b)"""
+
+    old_r, r = a, b
+    old_p, p = 1, 0
+    while r != 0:
+        q = old_r // r
+        old_r, r = r, old_r - q * r
+        old_p, p = p, old_p - q * p
+
+    return old_r, old_p
+
+
+def _require_numpy(feature):
+    """Imports numpy, raising an informative ImportError if it is not installed
+
+    numpy is only imported when a feature needing it is first used, so that
+    importing mayacal stays fast for code that never uses arrays.
+
+    Args:
+        feature (str): Name of the feature requiring numpy, used in the message
+
+    Returns:
+        (module): The numpy module
+
+    """
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(
+            f"{feature} requires numpy - install it with 'pip install mayacal[numpy]'"
+        ) from None
+
+    return numpy
+
+
 def _num_to_month(num):
     """Helper function to convert month number to short name
 
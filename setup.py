@@ -16,10 +16,15 @@ setuptools.setup(
     url="https://github.com/jonbleiberg88/mayacal",
     keywords=["Maya", "Mayan", "Calendar", "Classical", "Ancient"],
     install_requires=[],
+    extras_require={
+        "numpy": ["numpy"],
+        "pandas": ["numpy", "pandas"],
+        "arrow": ["pyarrow"],
+    },
     classifiers=[
         "Development Status :: 3 - Alpha",
         "License :: OSI Approved :: MIT License",
         "Programming Language :: Python :: 3",
     ],
-    python_requires=">=3.5",
+    python_requires=">=3.7",
 )
@@ -0,0 +1,21 @@
+from benchmarks.bench_mayacal import run_benchmarks, compare_results
+
+
+class TestBenchmarks:
+    def test_run_benchmarks(self):
+        results = run_benchmarks(scale=0.001, repeat=1)
+
+        names = [r["name"] for r in results["results"]]
+        assert "kin_to_long_count" in names
+        assert "Mayadate.infer_long_count_dates[4_missing]" in names
+
+        for r in results["results"]:
+            assert r["best_s"] >= 0
+            assert r["peak_memory_bytes"] > 0
+
+    def test_compare_results(self):
+        baseline = {"results": [{"name": "a", "per_item_us": 1.0}]}
+        current = {"results": [{"name": "a", "per_item_us": 2.0}]}
+
+        assert compare_results(current, baseline, threshold=1.5) == [("a", 2.0)]
+        assert compare_results(current, baseline, threshold=3) == []
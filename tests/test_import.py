@@ -0,0 +1,66 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from benchmarks.bench_mayacal import IMPORT_BUDGETS_MS, measure_import_time
+
+
+class TestImport:
+    # wall clock times are too noisy for every run of the suite, the benchmarks
+    # enforce the budget through their exit status
+    @pytest.mark.skipif(
+        os.environ.get("MAYACAL_CHECK_IMPORT_TIME", "0") in ("", "0"),
+        reason="set MAYACAL_CHECK_IMPORT_TIME=1 to check the import time budget",
+    )
+    @pytest.mark.parametrize("statement", list(IMPORT_BUDGETS_MS))
+    def test_import_time_budget(self, statement):
+        assert measure_import_time(statement) <= IMPORT_BUDGETS_MS[statement]
+
+    @pytest.mark.parametrize(
+        "statement", ["import mayacal", "from mayacal import Mayadate, LongCount"]
+    )
+    def test_optional_dependencies_not_imported(self, statement):
+        code = (
+            f"{statement}\n"
+            "import sys\n"
+            "print(sorted({'numpy', 'pyarrow', 'pandas', 'logging'} & set(sys.modules)))"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+
+        assert output.strip() == "[]"
+
+    def test_lazy_names(self):
+        import mayacal
+
+        assert set(mayacal.__all__) <= set(dir(mayacal))
+        for name in mayacal.__all__:
+            assert getattr(mayacal, name) is not None
+
+        assert mayacal.Mayadate is mayacal.mayadate.Mayadate
+
+        with pytest.raises(AttributeError):
+            mayacal.not_a_name
+
+    @pytest.mark.parametrize(
+        "statement",
+        [
+            "import mayacal",
+            "from mayacal import Mayadate; import mayacal",
+            "import mayacal.utils.tzolkin, mayacal",
+            "from mayacal.utils.parsing import parse_mayadate; import mayacal",
+        ],
+    )
+    def test_utils_is_utils_module(self, statement):
+        code = (
+            f"{statement}\n"
+            "print(mayacal.utils.__name__, mayacal.utils.GregorianDate.__name__)"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+
+        assert output.split() == ["mayacal.utils.utils", "GregorianDate"]
@@ -0,0 +1,62 @@
+import pytest
+
+from mayacal import LongCount, Mayadate, CalendarRound, Tzolkin, Haab, batch_infer
+
+
+@pytest.fixture
+def example_dates():
+    return [
+        Mayadate(
+            LongCount(9, 4, None, 10, None),
+            CalendarRound(Tzolkin(4, "Ajaw"), Haab(8, "Kumku")),
+        ),
+        Mayadate(
+            LongCount(9, None, None, None, None),
+            CalendarRound(Tzolkin(4, "Ajaw"), Haab(8, "Kumku")),
+            glyph_g="G3",
+        ),
+        {"long_count": "not a dict"},
+        Mayadate(LongCount(10, None, 8, 10, None), CalendarRound(Tzolkin(4, "Ajaw"))),
+        LongCount(9, 0, 13, 2, 10).get_mayadate().to_dict(),
+    ]
+
+
+class TestBatchInfer:
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_matches_infer_long_count_dates(self, example_dates, workers):
+        results = batch_infer(example_dates, workers=workers, chunksize=2)
+
+        assert len(results) == len(example_dates)
+        for date, result in zip(example_dates, results):
+            if isinstance(date, dict):
+                continue
+            assert result.error is None
+            assert result.long_counts == date.infer_long_count_dates()
+
+        assert [str(lc) for lc in results[4].long_counts] == ["9.0.13.2.10"]
+
+    def test_reports_per_item_failures(self, example_dates):
+        results = batch_infer(example_dates, workers=1)
+
+        assert results[2].long_counts is None
+        assert results[2].error.startswith("ValueError")
+        assert results[3].error is None
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_supplementary_series_constraints(self, workers):
+        cr = CalendarRound(Tzolkin(6, "Etznab"), None)
+        dates = [
+            Mayadate(LongCount(9, None, None, 5, 18), cr, station_819=733),
+            Mayadate(LongCount(9, None, None, 5, 18), cr, direction_819="east"),
+            Mayadate(LongCount(9, None, None, 5, 18), cr, moon_age=28),
+        ]
+
+        results = batch_infer(dates, workers=workers)
+
+        for date, result in zip(dates, results):
+            expected = date.infer_long_count_dates()
+            assert result.long_counts == expected
+            assert LongCount(9, 12, 11, 5, 18) in expected
+            assert len(expected) < len(
+                Mayadate(date.long_count, cr).infer_long_count_dates()
+            )
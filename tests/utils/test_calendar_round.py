@@ -0,0 +1,85 @@
+import pytest
+
+from mayacal import CalendarRound, Tzolkin, Haab, LongCount, kin_to_long_count
+
+
+@pytest.fixture
+def example_calendar_round():
+    return CalendarRound(Tzolkin(6, "Ok"), Haab(18, "Sak"))
+
+
+class TestCalendarRound:
+    def test_get_kin_possibilities(self, example_calendar_round):
+        kin_range = example_calendar_round.get_kin_possibilities(0, 2000000)
+
+        assert kin_range.step == 18980
+        assert kin_range[0] < 18980
+        for k in kin_range:
+            assert kin_to_long_count(k).get_calendar_round() == example_calendar_round
+
+    @pytest.mark.parametrize("min_kin, max_kin", [(0, 18979), (1300000, 1450000)])
+    def test_get_kin_possibilities_matches_brute_force(
+        self, example_calendar_round, min_kin, max_kin
+    ):
+        kin_range = example_calendar_round.get_kin_possibilities(min_kin, max_kin)
+        first = next(
+            k
+            for k in range(min_kin, max_kin + 1)
+            if kin_to_long_count(k).get_calendar_round() == example_calendar_round
+        )
+
+        assert kin_range[0] == first
+        assert kin_range[-1] <= max_kin < kin_range[-1] + 18980
+
+    def test_get_long_count_possibilities_bounds_inclusive(
+        self, example_calendar_round
+    ):
+        min_lc = LongCount(9, 0, 13, 2, 10)
+        max_lc = LongCount(9, 3, 5, 15, 10)
+
+        assert example_calendar_round.get_long_count_possibilities(min_lc, max_lc) == [
+            min_lc,
+            max_lc,
+        ]
+
+    def test_impossible_calendar_round(self):
+        cr = CalendarRound(Tzolkin(4, "Ajaw"), Haab(9, "Kumku"), True)
+
+        assert (
+            cr.get_long_count_possibilities(
+                LongCount(0, 0, 0, 0, 0), LongCount(13, 0, 0, 0, 0)
+            )
+            == []
+        )
+
+    def test_incomplete_calendar_round(self):
+        cr = CalendarRound(Tzolkin(4, "Ajaw"), None)
+
+        with pytest.raises(ValueError):
+            cr.get_kin_possibilities(0, 100000)
+
+    def test_from_index_round_trip(self):
+        for index in range(0, 18980, 7):
+            assert CalendarRound.from_index(index).index == index
+
+    def test_from_index_matches_add_days(self):
+        epoch = CalendarRound(Tzolkin(4, "Ajaw"), Haab(8, "Kumku"))
+
+        for index in (0, 1, 259, 365, 9000, 18979):
+            assert CalendarRound.from_index(index) == epoch.add_days(index)
+
+    def test_index(self, example_calendar_round):
+        lc = LongCount(9, 0, 13, 2, 10)
+
+        assert example_calendar_round.index == lc.get_total_kin() % 18980
+
+    def test_invalid_index(self):
+        with pytest.raises(ValueError):
+            CalendarRound.from_index(18980)
+
+    def test_add_days_in_place_with_interned_components(self):
+        cr = CalendarRound.from_index(0)
+        cr.add_days(1, in_place=True)
+
+        assert str(cr) == "5 Imix 9 Kumku"
+        assert str(CalendarRound.from_index(0)) == "4 Ajaw 8 Kumku"
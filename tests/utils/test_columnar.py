@@ -0,0 +1,61 @@
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+
+from mayacal import LongCount, Mayadate, CalendarRound, Tzolkin, Haab
+from mayacal.utils.columnar import (
+    MAYADATE_COLUMNS,
+    to_arrow,
+    from_arrow,
+    write_parquet,
+    read_parquet,
+)
+
+
+@pytest.fixture
+def example_dates():
+    return [
+        LongCount(9, 12, 11, 5, 18).get_mayadate(),
+        Mayadate(
+            LongCount(9, 4, None, 10, None),
+            CalendarRound(Tzolkin(4, "Ajaw"), Haab(8, "Kumku")),
+        ),
+        Mayadate(LongCount(None, 12, 11, 5, 18), CalendarRound(Tzolkin(6, None))),
+        Mayadate(),
+    ]
+
+
+class TestColumnar:
+    def test_schema(self, example_dates):
+        table = to_arrow(example_dates)
+
+        assert table.schema.names == list(MAYADATE_COLUMNS)
+        assert all(field.type == pa.int8() for field in table.schema)
+        assert table.column("day_name").to_pylist() == [17, 19, None, None]
+        assert table.column("glyph_g").to_pylist() == [1, None, 1, None]
+
+    def test_round_trip_overridden_calendar_round(self):
+        cr = CalendarRound(Tzolkin(4, "Ajaw"), Haab(9, "Kumku"), True)
+        date = Mayadate(LongCount(9, None, None, None, None), cr)
+
+        (result,) = from_arrow(to_arrow([date]))
+
+        assert result.to_dict() == date.to_dict()
+        assert not result.calendar_round.valid
+
+    def test_round_trip(self, example_dates):
+        result = from_arrow(to_arrow(example_dates))
+
+        assert [d.to_dict() for d in result] == [d.to_dict() for d in example_dates]
+
+    def test_parquet_round_trip(self, example_dates, tmp_path):
+        path = str(tmp_path / "dates.parquet")
+        write_parquet(example_dates, path)
+
+        result = read_parquet(path)
+
+        assert [d.to_dict() for d in result] == [d.to_dict() for d in example_dates]
+
+    def test_missing_columns(self):
+        with pytest.raises(ValueError):
+            from_arrow(pa.table({"baktun": pa.array([9], type=pa.int8())}))
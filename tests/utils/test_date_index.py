@@ -0,0 +1,143 @@
+import random
+
+import pytest
+
+from mayacal import (
+    LongCount,
+    Mayadate,
+    MayadateIndex,
+    CalendarRound,
+    Tzolkin,
+    Haab,
+    kin_to_long_count,
+)
+
+
+def _blank_out(date, rng, p):
+    """Helper function to replace values of a date with None at random"""
+
+    tzolkin = date.calendar_round.tzolkin
+    haab = date.calendar_round.haab
+    long_count = LongCount(
+        *[None if rng.random() < p else v for v in date.long_count.to_list()]
+    )
+    tzolkin = Tzolkin(
+        None if rng.random() < p else tzolkin.day_number,
+        None if rng.random() < p else tzolkin.day_name,
+    )
+    # Haab(None, "Wayeb") is rejected, so Wayeb numbers are always kept
+    blank_month = haab.month_name != "Wayeb" and rng.random() < p
+    haab = Haab(None if blank_month else haab.month_number, haab.month_name)
+    glyph_g = None if rng.random() < p else date.glyph_g
+
+    return Mayadate(long_count, CalendarRound(tzolkin, haab), glyph_g)
+
+
+@pytest.fixture(scope="module")
+def corpus():
+    rng = random.Random(20)
+    start = LongCount(9, 0, 0, 0, 0).get_total_kin()
+
+    dates = []
+    for _ in range(400):
+        date = kin_to_long_count(start + rng.randrange(0, 600 * 360)).get_mayadate()
+        dates.append(_blank_out(date, rng, 0.2) if rng.random() < 0.5 else date)
+
+    return dates
+
+
+@pytest.fixture(scope="module")
+def corpus_index(corpus):
+    return MayadateIndex(corpus)
+
+
+class TestMayadateIndex:
+    def test_len_and_getitem(self, corpus, corpus_index):
+        assert len(corpus_index) == len(corpus)
+        assert corpus_index[3] is corpus[3]
+        assert list(corpus_index) == corpus
+
+    def test_add_returns_id(self):
+        index = MayadateIndex()
+        assert index.add(Mayadate()) == 0
+        assert index.add(LongCount(9, 12, 11, 5, 18).get_mayadate()) == 1
+        assert len(index) == 2
+
+    def test_match_equals_linear_scan(self, corpus, corpus_index):
+        rng = random.Random(21)
+
+        for date in rng.sample(corpus, 100):
+            query = _blank_out(date, rng, 0.5)
+            expected = [d for d in corpus if d.match(query)]
+
+            assert corpus_index.match(query) == expected
+            assert date in corpus_index.match(query)
+
+    def test_match_calendar_round_only(self, corpus, corpus_index):
+        query = Mayadate(None, corpus[0].calendar_round)
+        expected = [d for d in corpus if d.match(query)]
+
+        assert corpus_index.match(query) == expected
+        assert corpus[0] in expected
+
+    def test_match_empty_query(self, corpus, corpus_index):
+        assert corpus_index.match(Mayadate()) == corpus
+
+    def test_match_no_results(self, corpus_index):
+        query = LongCount(12, 0, 0, 0, 0).get_mayadate()
+
+        assert corpus_index.match_ids(query) == []
+
+    def test_match_with_range(self, corpus, corpus_index):
+        min_date = LongCount(9, 10, 0, 0, 0)
+        max_date = LongCount(9, 15, 0, 0, 0)
+        query = Mayadate(LongCount(None, None, None, None, 0))
+
+        expected = [
+            d
+            for d in corpus
+            if d.match(query)
+            and not d.long_count.has_missing()
+            and min_date <= d.long_count <= max_date
+        ]
+
+        assert corpus_index.match(query, min_date, max_date) == expected
+
+    def test_between(self, corpus, corpus_index):
+        min_date = LongCount(9, 5, 0, 0, 0)
+        max_date = LongCount(9, 7, 0, 0, 0)
+
+        expected = sorted(
+            (
+                d
+                for d in corpus
+                if not d.long_count.has_missing()
+                and min_date <= d.long_count <= max_date
+            ),
+            key=lambda d: d.long_count.get_total_kin(),
+        )
+
+        assert corpus_index.between(min_date, max_date) == expected
+        assert len(corpus_index.between()) == sum(
+            not d.long_count.has_missing() for d in corpus
+        )
+
+    def test_add_after_range_query(self):
+        index = MayadateIndex([LongCount(9, 12, 11, 5, 18).get_mayadate()])
+        assert len(index.between()) == 1
+
+        earlier = LongCount(9, 0, 0, 0, 0).get_mayadate()
+        index.add(earlier)
+
+        assert index.between()[0] is earlier
+
+    def test_between_includes_max_date_with_partial_dates(self):
+        partial = [Mayadate(LongCount(9, None, 0, 0, k)) for k in range(5)]
+        date = LongCount(9, 12, 11, 5, 18).get_mayadate()
+        index = MayadateIndex(partial + [date])
+
+        assert index.between(max_date=LongCount(9, 12, 11, 5, 18)) == [date]
+        assert index.between(min_date=date, max_date=date) == [date]
+        assert index.match_ids(Mayadate(), max_date=LongCount(9, 12, 11, 5, 18)) == [
+            len(partial)
+        ]
@@ -0,0 +1,61 @@
+import copy
+import pickle
+
+import pytest
+
+from mayacal import Haab, LongCount
+
+
+class TestHaab:
+    def test_of_returns_interned_instance(self):
+        assert Haab.of(348) is Haab.of(348)
+        assert Haab.of(348) == Haab(8, "Kumku")
+
+    def test_add_days_returns_interned_instance(self):
+        haab = Haab(8, "Kumku")
+
+        assert haab.add_days(365) is Haab.of(348)
+        assert haab.add_days(17) is Haab.of(0)
+
+    def test_interned_instance_is_immutable(self):
+        haab = Haab.of(0)
+
+        with pytest.raises(AttributeError):
+            haab.month_name = "Wo"
+
+        with pytest.raises(AttributeError):
+            haab.add_days(1, in_place=True)
+
+        assert str(haab) == "0 Pop"
+
+    def test_in_place_on_long_count_calendar_round_raises(self):
+        # Calendar Rounds computed from a Long Count share interned objects
+        haab = LongCount(9, 12, 11, 5, 18).get_calendar_round().haab
+
+        with pytest.raises(AttributeError, match="add_days without in_place"):
+            haab.add_days(1, in_place=True)
+        with pytest.raises(AttributeError):
+            haab.reset_by_haab_num(0)
+
+        assert str(haab) == "11 Yax"
+        assert str(LongCount(9, 12, 11, 5, 18).get_calendar_round().haab) == "11 Yax"
+        assert str(haab.add_days(1)) == "12 Yax"
+
+    def test_add_days_in_place(self):
+        haab = Haab(3, "Wayeb")
+        result = haab.add_days(2, in_place=True)
+
+        assert result is haab
+        assert str(haab) == "0 Pop"
+        assert haab.haab_num == 0
+
+    def test_interned_instance_round_trip(self):
+        haab = Haab.of(200)
+
+        assert pickle.loads(pickle.dumps(haab)) is haab
+        assert copy.deepcopy(haab) is haab
+
+    @pytest.mark.parametrize("num", [-1, 365])
+    def test_of_invalid(self, num):
+        with pytest.raises(ValueError):
+            Haab.of(num)
@@ -0,0 +1,117 @@
+import itertools
+
+import pytest
+
+from mayacal import LongCount, CalendarRound, Tzolkin, Haab, Mayadate, kin_to_long_count
+from mayacal.utils.inference import iter_kin_solutions
+
+
+def brute_force_kin(long_count, calendar_round, glyph_g):
+    """Reference implementation checking every combination of missing positions"""
+
+    ranges = [
+        [d] if d is not None else range(m)
+        for d, m in zip(long_count.to_list(), [14, 20, 20, 18, 20])
+    ]
+    solutions = []
+    for digits in itertools.product(*ranges):
+        lc = LongCount(*digits)
+        if not calendar_round.match(lc.get_calendar_round()):
+            continue
+        if glyph_g is not None and lc.get_glyph_g() != glyph_g:
+            continue
+        solutions.append(lc.get_total_kin())
+
+    return solutions
+
+
+class TestIterKinSolutions:
+    @pytest.mark.parametrize(
+        "long_count, calendar_round, glyph_g",
+        [
+            (
+                LongCount(9, 4, None, 10, None),
+                CalendarRound(Tzolkin(4, "Ajaw"), Haab(8, "Kumku")),
+                None,
+            ),
+            (LongCount(10, None, 8, 10, None), CalendarRound(Tzolkin(4, "Ajaw")), None),
+            (LongCount(9, None, 11, None, 18), CalendarRound(Tzolkin(6, None)), None),
+            (
+                LongCount(None, 12, None, 5, 18),
+                CalendarRound(None, Haab(None, "Yax")),
+                None,
+            ),
+            (LongCount(9, 12, None, None, None), CalendarRound(None, Haab(11)), "G4"),
+            (LongCount(None, None, 11, 5, 18), CalendarRound(), None),
+            (LongCount(9, 12, 11, None, None), CalendarRound(None, Haab(3)), None),
+            (
+                LongCount(9, 12, None, None, 4),
+                CalendarRound(None, Haab(None, "Kumku")),
+                None,
+            ),
+            (
+                LongCount(9, 12, None, None, 18),
+                CalendarRound(Tzolkin(7, "Etznab"), Haab(11, "Yax")),
+                None,
+            ),
+        ],
+    )
+    def test_matches_brute_force(self, long_count, calendar_round, glyph_g):
+        expected = brute_force_kin(long_count, calendar_round, glyph_g)
+
+        assert list(iter_kin_solutions(long_count, calendar_round, glyph_g)) == expected
+
+    def test_glyph_g_constraint(self):
+        lc = LongCount(9, None, None, None, None)
+        cr = CalendarRound(Tzolkin(4, "Ajaw"), Haab(8, "Kumku"))
+
+        assert list(iter_kin_solutions(lc, cr, "G3")) == [
+            LongCount(9, 1, 17, 15, 0).get_total_kin()
+        ]
+
+    def test_bounds(self):
+        lc = LongCount(9, None, None, None, None)
+        cr = CalendarRound(Tzolkin(4, "Ajaw"), Haab(8, "Kumku"))
+        all_kin = list(iter_kin_solutions(lc, cr))
+
+        bounded = list(
+            iter_kin_solutions(lc, cr, min_kin=all_kin[1], max_kin=all_kin[3])
+        )
+
+        assert bounded == all_kin[1:4]
+
+    def test_no_solution(self):
+        lc = LongCount(9, 0, 0, 0, None)
+        cr = CalendarRound(Tzolkin(4, "Ajaw"), Haab(9, "Kumku"), True)
+
+        assert list(iter_kin_solutions(lc, cr)) == []
+
+    def test_infer_long_count_dates_uses_constraints(self):
+        cr = CalendarRound(Tzolkin(6, "Etznab"), Haab(11, "Yax"))
+        date = Mayadate(LongCount(None, None, None, None, None), cr, "G6")
+
+        for lc in date.infer_long_count_dates():
+            assert lc.get_calendar_round() == cr
+            assert lc.get_glyph_g() == "G6"
+
+    @pytest.mark.parametrize(
+        "station_819, direction_819", [(733, None), (None, "east"), (733, "east")]
+    )
+    def test_819_constraints(self, station_819, direction_819):
+        lc = LongCount(9, None, None, None, None)
+        cr = CalendarRound(Tzolkin(6, "Etznab"), Haab(None, None))
+
+        expected = [
+            k
+            for k in iter_kin_solutions(lc, cr)
+            if station_819 in (None, kin_to_long_count(k).get_819_station())
+            and direction_819 in (None, kin_to_long_count(k).get_819_direction())
+        ]
+        solutions = list(
+            iter_kin_solutions(
+                lc, cr, station_819=station_819, direction_819=direction_819
+            )
+        )
+
+        assert solutions == expected
+        assert LongCount(9, 12, 11, 5, 18).get_total_kin() in solutions
@@ -0,0 +1,111 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import mayacal
+from mayacal import LongCount, Mayadate, CalendarRound, Tzolkin, Haab
+from mayacal.utils import instrumentation
+from mayacal.utils import long_count as long_count_module
+from mayacal.utils import mayadate as mayadate_module
+
+
+@pytest.fixture(autouse=True)
+def clean_instrumentation():
+    instrumentation.disable()
+    instrumentation.reset()
+    yield
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+class TestInstrumentation:
+    def test_disabled_by_default(self):
+        original = long_count_module.kin_to_long_count
+
+        mayacal.kin_to_long_count(100)
+
+        assert not instrumentation.is_enabled()
+        assert instrumentation.snapshot() == {}
+        assert mayacal.kin_to_long_count is original
+        assert mayadate_module.kin_to_long_count is original
+
+    def test_counts_calls_through_aliases(self):
+        with instrumentation.instrumented() as snapshot:
+            long_count_module.kin_to_long_count(100)
+            mayacal.kin_to_long_count(200)
+            # used by name inside the mayadate module
+            LongCount(9, 0, 0, 0, 0).get_mayadate().add_days(5)
+            LongCount(9, 0, 0, 0, 0).get_calendar_round().add_days(5)
+
+            stats = snapshot()
+
+        assert stats["kin_to_long_count"]["calls"] >= 3
+        assert stats["kin_to_long_count"]["total_seconds"] > 0
+        assert stats["LongCount.get_calendar_round"]["calls"] >= 1
+        assert stats["CalendarRound.add_days"]["calls"] >= 1
+
+    def test_restores_originals(self):
+        original = long_count_module.kin_to_long_count
+        original_method = LongCount.__dict__["get_calendar_round"]
+
+        with instrumentation.instrumented():
+            assert mayacal.kin_to_long_count is not original
+
+        assert long_count_module.kin_to_long_count is original
+        assert mayacal.kin_to_long_count is original
+        assert mayadate_module.kin_to_long_count is original
+        assert LongCount.__dict__["get_calendar_round"] is original_method
+
+    def test_inference_and_from_dict(self):
+        date = Mayadate(
+            LongCount(9, 4, None, 10, None),
+            CalendarRound(Tzolkin(4, "Ajaw"), Haab(8, "Kumku")),
+        )
+
+        with instrumentation.instrumented() as snapshot:
+            candidates = date.infer_mayadates()
+            mayacal.from_dict(date.to_dict())
+            stats = snapshot()
+
+        assert candidates == date.infer_mayadates()
+        assert stats["Mayadate.infer_mayadates"]["calls"] == 1
+        assert stats["iter_kin_solutions"]["calls"] == 1
+        assert stats["from_dict"]["calls"] == 1
+
+    def test_counters_kept_until_reset(self):
+        with instrumentation.instrumented():
+            mayacal.kin_to_long_count(100)
+
+        assert instrumentation.snapshot()["kin_to_long_count"]["calls"] == 1
+
+        with instrumentation.instrumented(reset_stats=False):
+            mayacal.kin_to_long_count(100)
+
+        assert instrumentation.snapshot()["kin_to_long_count"]["calls"] == 2
+
+        instrumentation.reset()
+        assert instrumentation.snapshot() == {}
+
+    def test_environment_switch(self):
+        code = (
+            "import mayacal\n"
+            "from mayacal.utils import instrumentation\n"
+            "mayacal.kin_to_long_count(100)\n"
+            "print(instrumentation.is_enabled(),"
+            " instrumentation.snapshot()['kin_to_long_count']['calls'])\n"
+        )
+        env = dict(os.environ, MAYACAL_INSTRUMENT="1")
+        root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            env=env,
+            cwd=root,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+
+        assert output.split() == ["True", "1"]
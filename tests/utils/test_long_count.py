@@ -1,6 +1,6 @@
 import pytest
 
-from mayacal import LongCount, DistanceNumber
+from mayacal import LongCount, DistanceNumber, kin_to_long_count
 from mayacal.utils.utils import GregorianDate
 
 
@@ -35,6 +35,34 @@ class TestLongCount:
             converted_date == gregorian_date
         ), "Incorrect conversion to Gregorian date"
 
+    def test_hash_and_equality(self, example_long_count):
+        same_day = kin_to_long_count(example_long_count.get_total_kin())
+
+        assert same_day == example_long_count
+        assert len({example_long_count, same_day, LongCount(9, 0, 0, 0, 4)}) == 2
+        assert example_long_count == example_long_count.get_mayadate()
+        assert example_long_count != None
+
+    def test_partial_hash_and_equality(self):
+        partial = LongCount(9, None, 0, 0, 3)
+
+        assert partial == LongCount(9, None, 0, 0, 3)
+        assert partial != LongCount(9, 0, 0, 0, 3)
+        assert len({partial, LongCount(9, None, 0, 0, 3)}) == 1
+
+        with pytest.raises(ValueError):
+            partial < LongCount(9, 0, 0, 0, 3)
+
+    def test_cached_total_kin_is_reset(self, example_long_count):
+        assert example_long_count.get_total_kin() == 1296003
+
+        example_long_count.katun = 1
+        assert example_long_count.get_total_kin() == 1296003 + 7200
+
+        example_long_count.kin = None
+        with pytest.raises(ValueError):
+            example_long_count.get_total_kin()
+
 
 class TestDistanceNumber:
     def test_add_distance_number_to_long_count(self, example_long_count):
@@ -0,0 +1,160 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from mayacal import (
+    LongCount,
+    LongCountArray,
+    DistanceNumber,
+    correlation_sweep,
+    kin_to_long_count,
+)
+
+
+@pytest.fixture
+def example_array():
+    return LongCountArray.from_kin([0, 1, 1366560, 1872000, 1395365])
+
+
+class TestLongCountArray:
+    def test_positions_match_kin_to_long_count(self, example_array):
+        positions = example_array.to_positions()
+
+        for row, kin in zip(positions, example_array.to_kin()):
+            assert list(row) == kin_to_long_count(int(kin)).to_list()
+
+    def test_position_views(self, example_array):
+        assert list(example_array.baktun) == [0, 0, 9, 13, 9]
+        assert list(example_array.winal) == [0, 0, 0, 0, 0]
+        assert list(example_array.kin) == [0, 1, 0, 0, 5]
+
+    def test_round_trip_from_positions(self, example_array):
+        round_trip = LongCountArray.from_positions(*example_array.to_positions().T)
+
+        assert np.array_equal(round_trip.to_kin(), example_array.to_kin())
+
+    def test_from_long_counts(self):
+        lcs = [LongCount(9, 0, 0, 0, 0), LongCount(13, 0, 9, 3, 7)]
+        arr = LongCountArray.from_long_counts(lcs)
+
+        assert list(arr.to_kin()) == [lc.get_total_kin() for lc in lcs]
+
+    def test_getitem_returns_long_count(self, example_array):
+        lc = example_array[2]
+
+        assert isinstance(lc, LongCount)
+        assert str(lc) == "9.9.16.0.0"
+
+        sliced = example_array[1:3]
+        assert isinstance(sliced, LongCountArray)
+        assert len(sliced) == 2
+
+    def test_arithmetic(self, example_array):
+        shifted = example_array + 20
+        assert isinstance(shifted, LongCountArray)
+        assert list(shifted.winal) == [1, 1, 1, 1, 1]
+
+        dist = DistanceNumber(LongCount(0, 0, 0, 1, 0), sign=-1)
+        assert np.array_equal((shifted + dist).to_kin(), example_array.to_kin())
+        assert np.array_equal((shifted - 20).to_kin(), example_array.to_kin())
+
+        diff = shifted - example_array
+        assert list(diff) == [20] * 5
+
+        diff = example_array - LongCount(0, 0, 0, 0, 1)
+        assert list(diff) == [-1, 0, 1366559, 1871999, 1395364]
+
+    def test_comparisons(self, example_array):
+        lc = LongCount(9, 0, 0, 0, 0)
+
+        assert list(example_array >= lc) == [False, False, True, True, True]
+        assert list(example_array == example_array) == [True] * 5
+        assert list(example_array < np.array([1, 1, 1, 1, 1])) == [True] + [False] * 4
+
+    def test_invalid_values(self):
+        with pytest.raises(ValueError):
+            LongCountArray.from_kin([-1, 5])
+
+        with pytest.raises(ValueError):
+            LongCountArray.from_positions([9], [0], [0], [18], [0])
+
+        with pytest.raises(ValueError):
+            LongCountArray.from_kin([0]) - 1
+
+    def test_to_gregorian(self):
+        lcs = [LongCount(13, 0, 9, 3, 7), LongCount(9, 0, 13, 2, 10)]
+        days, months, years = LongCountArray.from_long_counts(lcs).to_gregorian()
+
+        for lc, day, month, year in zip(lcs, days, months, years):
+            expected = lc.to_gregorian()
+            assert (day, month, year) == (expected.day, expected.month, expected.year)
+
+    def test_to_julian(self):
+        lcs = [LongCount(13, 0, 9, 3, 7), LongCount(9, 0, 13, 2, 10)]
+        days, months, years = LongCountArray.from_long_counts(lcs).to_julian(584285)
+
+        for lc, day, month, year in zip(lcs, days, months, years):
+            expected = lc.to_julian(584285)
+            assert (day, month, year) == (expected.day, expected.month, expected.year)
+
+
+class TestCorrelationSweep:
+    correlations = [584283, 584285, 584286, 622261]
+
+    @pytest.mark.parametrize("calendar", ["gregorian", "julian"])
+    def test_matches_scalar_conversions(self, calendar):
+        lcs = [LongCount(13, 0, 9, 3, 7), LongCount(9, 0, 13, 2, 10)]
+        days, months, years = correlation_sweep(lcs, self.correlations, calendar)
+
+        assert days.shape == (len(lcs), len(self.correlations))
+        for i, lc in enumerate(lcs):
+            for j, correlation in enumerate(self.correlations):
+                if calendar == "gregorian":
+                    expected = lc.to_gregorian(correlation)
+                else:
+                    expected = lc.to_julian(correlation)
+
+                assert (days[i, j], months[i, j], years[i, j]) == (
+                    expected.day,
+                    expected.month,
+                    expected.year,
+                )
+
+    def test_accepts_long_count_array(self, example_array):
+        julian_days = example_array.to_julian_day(self.correlations)
+
+        assert julian_days.shape == (len(example_array), len(self.correlations))
+        assert (julian_days[:, 1] == example_array.to_julian_day(584285)).all()
+
+        days, _, _ = correlation_sweep(example_array, self.correlations)
+        assert days.shape == julian_days.shape
+
+    def test_invalid_arguments(self, example_array):
+        with pytest.raises(ValueError):
+            correlation_sweep(example_array, [584283.5])
+        with pytest.raises(ValueError):
+            correlation_sweep(example_array, [[584283]])
+        with pytest.raises(ValueError):
+            correlation_sweep(example_array, [584283], calendar="mayan")
+
+
+class TestSupplementarySeries:
+    def test_matches_scalar_methods(self, example_array):
+        long_counts = example_array.to_list()
+
+        assert example_array.get_lords_of_the_night().tolist() == [
+            lc.get_lord_of_the_night() for lc in long_counts
+        ]
+        assert example_array.get_819_stations().tolist() == [
+            lc.get_819_station() for lc in long_counts
+        ]
+        assert example_array.get_819_directions().tolist() == [
+            lc.get_819_direction() for lc in long_counts
+        ]
+        assert example_array.get_819_colors().tolist() == [
+            lc.get_819_color() for lc in long_counts
+        ]
+        np.testing.assert_allclose(
+            example_array.get_moon_ages(584285),
+            [lc.get_moon_age(584285) for lc in long_counts],
+        )
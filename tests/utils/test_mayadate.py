@@ -0,0 +1,115 @@
+import pytest
+
+from mayacal import LongCount, DistanceNumber, Mayadate, CalendarRound, Tzolkin, Haab
+
+
+class TestMayadate:
+    def test_no_instance_dict(self):
+        date = LongCount(9, 12, 11, 5, 18).get_mayadate()
+        dist = DistanceNumber(LongCount(0, 0, 1, 0, 0))
+
+        for obj in (
+            date,
+            date.long_count,
+            date.calendar_round,
+            date.calendar_round.tzolkin,
+            date.calendar_round.haab,
+            dist,
+        ):
+            assert not hasattr(obj, "__dict__"), f"{type(obj)} has an instance dict"
+
+    def test_public_attributes(self):
+        date = LongCount(9, 12, 11, 5, 18).get_mayadate()
+
+        assert date.long_count.to_list() == [9, 12, 11, 5, 18]
+        assert date.calendar_round.tzolkin.day_name == "Etznab"
+        assert date.calendar_round.haab.month_name == "Yax"
+        assert date.glyph_g == "G1"
+
+    def test_calendar_round_and_glyph_g_are_lazy(self):
+        date = Mayadate(LongCount(9, 12, 11, 5, 18))
+
+        assert date._calendar_round is None
+        assert date._glyph_g is None
+
+        assert str(date.calendar_round) == "6 Etznab 11 Yax"
+        assert date.calendar_round is date.calendar_round
+        assert date.glyph_g == "G1"
+
+    def test_glyph_g_mismatch_raises(self):
+        with pytest.raises(ValueError):
+            Mayadate(LongCount(9, 12, 11, 5, 18), glyph_g="G2")
+
+    def test_partial_dates(self):
+        date = Mayadate(LongCount(9, 12, None, 5, 18))
+        assert date.calendar_round.has_missing()
+        assert date.glyph_g == "G1"
+
+        assert Mayadate().calendar_round.has_missing()
+
+    def test_add_days(self):
+        date = Mayadate(LongCount(9, 12, 11, 5, 18))
+
+        assert str(date.add_days(2)) == "9.12.11.6.0  8 Ajaw 13 Yax"
+
+        date.calendar_round
+        date.add_days(2, in_place=True)
+        assert str(date) == "9.12.11.6.0  8 Ajaw 13 Yax"
+        assert date.glyph_g == "G3"
+
+    def test_hash_and_equality(self):
+        date = LongCount(9, 12, 11, 5, 18).get_mayadate()
+        partial = Mayadate(LongCount(9, 12, None, 5, 18), glyph_g="G1")
+
+        assert date == Mayadate(LongCount(9, 12, 11, 5, 18))
+        assert len({date, Mayadate(LongCount(9, 12, 11, 5, 18)), partial}) == 2
+        assert {date: 1}[LongCount(9, 12, 11, 5, 18)] == 1
+
+        assert partial == Mayadate(LongCount(9, 12, None, 5, 18), glyph_g="G1")
+        assert partial != Mayadate(
+            LongCount(9, 12, None, 5, 18), CalendarRound(Tzolkin(6, "Etznab"))
+        )
+        assert partial != partial.long_count
+
+
+class TestIterLongCountDates:
+    @pytest.fixture
+    def partial_date(self):
+        return Mayadate(
+            LongCount(9, None, None, None, None),
+            CalendarRound(Tzolkin(4, "Ajaw"), Haab(8, "Kumku")),
+        )
+
+    def test_matches_infer_long_count_dates(self, partial_date):
+        assert (
+            list(partial_date.iter_long_count_dates())
+            == partial_date.infer_long_count_dates()
+        )
+
+    def test_limit(self, partial_date):
+        all_dates = partial_date.infer_long_count_dates()
+
+        assert list(partial_date.iter_long_count_dates(limit=2)) == all_dates[:2]
+        assert list(partial_date.iter_long_count_dates(limit=0)) == []
+
+    def test_bounds(self, partial_date):
+        all_dates = partial_date.infer_long_count_dates()
+
+        bounded = partial_date.iter_long_count_dates(
+            min_date=all_dates[1], max_date=all_dates[3].get_mayadate()
+        )
+
+        assert list(bounded) == all_dates[1:4]
+
+    def test_is_lazy(self):
+        # Every Long Count matches, so a non-lazy search would build millions
+        dates = Mayadate(LongCount(None, None, None, None, None)).iter_mayadates()
+
+        assert str(next(dates)) == "0.0.0.0.0  4 Ajaw 8 Kumku"
+        assert str(next(dates)) == "0.0.0.0.1  5 Imix 9 Kumku"
+
+    def test_complete_date(self):
+        date = Mayadate(LongCount(9, 12, 11, 5, 18))
+
+        assert list(date.iter_long_count_dates()) == [date.long_count]
+        assert list(date.iter_long_count_dates(max_date=LongCount(9, 0, 0, 0, 0))) == []
@@ -0,0 +1,110 @@
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from mayacal import LongCount, Mayadate, kin_to_long_count
+from mayacal.utils.pandas_ext import MayaDateArray, MayaDateDtype
+
+
+@pytest.fixture
+def example_series():
+    return pd.Series(
+        [
+            LongCount(9, 12, 11, 5, 18).get_mayadate(),
+            None,
+            LongCount(9, 0, 13, 2, 10),
+            LongCount(13, 0, 0, 0, 0).get_mayadate(),
+        ],
+        dtype="mayadate",
+    )
+
+
+class TestMayaDateArray:
+    def test_construction(self, example_series):
+        assert isinstance(example_series.dtype, MayaDateDtype)
+        assert isinstance(example_series.array, MayaDateArray)
+        assert example_series.isna().tolist() == [False, True, False, False]
+
+        assert str(example_series[0]) == "9.12.11.5.18  6 Etznab 11 Yax"
+        assert example_series[1] is pd.NA
+
+    def test_sort_values(self, example_series):
+        result = example_series.sort_values()
+
+        assert result.index.tolist() == [2, 0, 3, 1]
+
+    def test_comparisons(self, example_series):
+        result = example_series > LongCount(9, 5, 0, 0, 0)
+
+        assert result.dtype == "boolean"
+        assert result.tolist() == [True, pd.NA, False, True]
+        assert (example_series == example_series)[0]
+
+    def test_groupby(self):
+        dates = [kin_to_long_count(k) for k in (1000, 2000, 1000, 1000)]
+        df = pd.DataFrame(
+            {"date": pd.array(dates, dtype="mayadate"), "count": [1, 2, 3, 4]}
+        )
+
+        result = df.groupby("date")["count"].sum()
+
+        assert result.tolist() == [8, 2]
+        assert result.index[0].long_count == kin_to_long_count(1000)
+
+    def test_min_max(self, example_series):
+        assert str(example_series.min().long_count) == "9.0.13.2.10"
+        assert str(example_series.max().long_count) == "13.0.0.0.0"
+
+    def test_take_and_concat(self, example_series):
+        result = pd.concat([example_series, example_series.iloc[[2]]])
+
+        assert len(result) == 5
+        assert result.iloc[-1] == example_series[2]
+
+    def test_rejects_partial_dates(self):
+        with pytest.raises(ValueError):
+            pd.array([Mayadate(LongCount(9, None, 0, 0, 0))], dtype="mayadate")
+
+
+class TestMayaAccessor:
+    def test_long_count(self, example_series):
+        result = example_series.maya.long_count
+
+        assert result.columns.tolist() == ["baktun", "katun", "tun", "winal", "kin"]
+        assert result.iloc[0].tolist() == [9, 12, 11, 5, 18]
+        assert result.iloc[1].isna().all()
+
+    def test_calendar_round(self, example_series):
+        tzolkin = example_series.maya.tzolkin
+        haab = example_series.maya.haab
+
+        for i in (0, 2, 3):
+            cr = example_series[i].calendar_round
+            assert tzolkin.iloc[i].tolist() == [
+                cr.tzolkin.day_number,
+                cr.tzolkin.day_name,
+            ]
+            assert haab.iloc[i].tolist() == [cr.haab.month_number, cr.haab.month_name]
+
+        assert tzolkin.iloc[1].isna().all()
+
+    def test_glyph_g(self, example_series):
+        result = example_series.maya.glyph_g
+
+        for i in (0, 2, 3):
+            assert result[i] == example_series[i].glyph_g
+        assert pd.isna(result[1])
+
+    def test_to_gregorian(self, example_series):
+        result = example_series.maya.to_gregorian()
+
+        assert result.iloc[2].tolist() == [20, 11, 448]
+        assert result.iloc[1].isna().all()
+        assert (
+            example_series.maya.total_kin[2]
+            == LongCount(9, 0, 13, 2, 10).get_total_kin()
+        )
+
+    def test_requires_mayadate_dtype(self):
+        with pytest.raises(AttributeError):
+            pd.Series([1, 2]).maya
@@ -0,0 +1,150 @@
+import random
+
+import pytest
+
+from mayacal import (
+    LongCount,
+    Mayadate,
+    CalendarRound,
+    Tzolkin,
+    Haab,
+    kin_to_long_count,
+    parse_mayadate,
+    parse_mayadates,
+)
+from mayacal.utils.parsing import iter_parse
+from mayacal.utils.records import _mayadate_to_row
+
+
+@pytest.fixture
+def example_lines():
+    return [
+        "9.12.11.5.18 6 Etznab 11 Yax\n",
+        "9.?.?.5.18  6 ? G1 11 Yax\n",
+        "\n",
+        "not a date\n",
+        "4 Ahau 8 Cumku\n",
+    ]
+
+
+class TestParseMayadate:
+    def test_parse_repr(self):
+        date = LongCount(9, 12, 11, 5, 18).get_mayadate()
+
+        assert parse_mayadate(repr(date)) == date
+
+    def test_parse_partial_repr(self):
+        date = Mayadate(
+            LongCount(10, None, 8, 10, None),
+            CalendarRound(Tzolkin(4, "Ajaw"), Haab(None, None)),
+        )
+
+        parsed = parse_mayadate(repr(date))
+        assert parsed.to_dict() == date.to_dict()
+
+    def test_round_trip_random(self):
+        rng = random.Random(0)
+        for _ in range(200):
+            date = kin_to_long_count(rng.randrange(0, 14 * 144000)).get_mayadate()
+            assert parse_mayadate(repr(date)) == date
+
+    @pytest.mark.parametrize("marker", ["?", "x", "X", "*", "None"])
+    def test_missing_markers(self, marker):
+        date = parse_mayadate(f"9.{marker}.{marker}.5.18 6 {marker} 11 Yax")
+
+        assert date.long_count.to_list() == [9, None, None, 5, 18]
+        assert date.calendar_round.tzolkin.day_number == 6
+        assert date.calendar_round.tzolkin.day_name is None
+
+    def test_names_normalized(self):
+        date = parse_mayadate("13 K'AN 2 ch’en")
+
+        assert date.calendar_round.tzolkin.day_name == "Kan"
+        assert date.calendar_round.haab.month_name == "Chen"
+
+    def test_old_spellings(self):
+        date = parse_mayadate("4 Ahau 8 Cumku")
+
+        assert date.calendar_round == CalendarRound(
+            Tzolkin(4, "Ajaw"), Haab(8, "Kumku")
+        )
+
+    def test_names_interned(self):
+        date = parse_mayadate("6 etz'nab 11 YAX")
+
+        assert date.calendar_round.tzolkin.day_name is Tzolkin(6, "Etznab").day_name
+        assert date.calendar_round.haab.month_name is Haab(11, "Yax").month_name
+
+    def test_single_haab(self):
+        date = parse_mayadate("9.12.11.5.? 11 Yax")
+
+        assert date.calendar_round.tzolkin.day_name is None
+        assert date.calendar_round.haab.month_name == "Yax"
+
+    def test_glyph_g(self):
+        assert parse_mayadate("9.?.11.5.? G3").glyph_g == "G3"
+        assert parse_mayadate("4 Ajaw G? 8 Kumku").glyph_g is None
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "9.12.11.5.18 6 Etznab 11",
+            "9.12.11.18.1",
+            "9.12.11.5",
+            "14 Ajaw 8 Kumku",
+            "4 Ajaw 5 Wayeb",
+            "4 Foo 8 Kumku",
+            "9.12.11.5.18 6 Etznab G3 11 Yax",
+            "1 Imix 1 Imix 1 Pop",
+        ],
+    )
+    def test_invalid(self, text):
+        with pytest.raises(ValueError):
+            parse_mayadate(text)
+
+
+class TestParseMayadates:
+    def test_parse_mayadates(self, example_lines):
+        rejected = []
+        dates = parse_mayadates(
+            example_lines, on_error=lambda *args: rejected.append(args[0])
+        )
+
+        assert [repr(d) for d in dates] == [
+            "9.12.11.5.18  6 Etznab 11 Yax",
+            "9.None.None.5.18  6 None 11 Yax",
+            "None.None.None.None.None  4 Ajaw 8 Kumku",
+        ]
+        assert rejected == [4]
+
+    def test_iter_parse_line_numbers(self, example_lines):
+        line_numbers = [n for n, _ in iter_parse(example_lines, lambda *args: None)]
+
+        assert line_numbers == [1, 2, 5]
+
+    def test_parse_file(self, example_lines, tmp_path):
+        path = tmp_path / "dates.txt"
+        path.write_text("".join(example_lines), encoding="utf-8")
+
+        assert parse_mayadates(str(path), on_error=lambda *args: None) == (
+            parse_mayadates(example_lines, on_error=lambda *args: None)
+        )
+
+    def test_columnar(self, example_lines):
+        pytest.importorskip("numpy")
+
+        columns = parse_mayadates(
+            example_lines, columnar=True, on_error=lambda *args: None
+        )
+        dates = parse_mayadates(example_lines, on_error=lambda *args: None)
+
+        assert list(columns["line_number"]) == [1, 2, 5]
+        assert columns["glyph_g"].tolist() == [None, 1, None]
+
+        # apart from the values computed from complete Long Counts, the columns
+        # hold the same values as the Mayadate objects
+        for i, date in enumerate(dates[1:], start=1):
+            row = [
+                columns[name].tolist()[i] for name in columns if name != "line_number"
+            ]
+            assert row == _mayadate_to_row(date)
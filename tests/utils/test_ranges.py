@@ -0,0 +1,98 @@
+import pytest
+
+from mayacal import LongCount, Mayadate, date_range, kin_to_long_count
+
+
+class TestDateRange:
+    def test_long_counts(self):
+        dates = list(
+            date_range(LongCount(9, 12, 11, 5, 18), LongCount(9, 12, 11, 6, 2))
+        )
+
+        assert [str(d) for d in dates] == [
+            "9.12.11.5.18",
+            "9.12.11.5.19",
+            "9.12.11.6.0",
+            "9.12.11.6.1",
+        ]
+
+    @pytest.mark.parametrize("step", [1, 7, 361, 7201, -1, -400])
+    def test_matches_add_days(self, step):
+        start = LongCount(9, 19, 19, 17, 10)
+        stop = start.add_days(60 * step)
+
+        expected = [
+            kin_to_long_count(start.get_total_kin() + i * step) for i in range(60)
+        ]
+
+        assert list(date_range(start, stop, step)) == expected
+
+    def test_mayadates(self):
+        start = LongCount(9, 12, 11, 5, 18).get_mayadate()
+        stop = LongCount(9, 13, 0, 0, 0).get_mayadate()
+
+        for date in date_range(start, stop, 13):
+            expected = date.long_count.get_mayadate()
+            assert str(date) == str(expected)
+            assert date.glyph_g == expected.glyph_g
+
+    def test_tuples(self):
+        start = LongCount(9, 12, 11, 5, 18)
+
+        assert list(date_range(start, start.add_days(2), as_tuples=True)) == [
+            (9, 12, 11, 5, 18),
+            (9, 12, 11, 5, 19),
+        ]
+        assert next(
+            date_range(start.get_mayadate(), start.add_days(1), as_tuples=True)
+        ) == (
+            9,
+            12,
+            11,
+            5,
+            18,
+            6,
+            "Etznab",
+            11,
+            "Yax",
+            "G1",
+        )
+
+    def test_empty_range(self):
+        start = LongCount(9, 12, 11, 5, 18)
+
+        assert list(date_range(start, start)) == []
+        assert list(date_range(start, start.add_days(5), -1)) == []
+
+    def test_invalid_step(self):
+        start = LongCount(9, 12, 11, 5, 18)
+
+        with pytest.raises(ValueError):
+            date_range(start, start.add_days(5), 0)
+
+    def test_partial_date_raises(self):
+        with pytest.raises(ValueError):
+            date_range(
+                Mayadate(LongCount(9, 12, None, 5, 18)), LongCount(10, 0, 0, 0, 0)
+            )
+
+    @pytest.mark.parametrize("as_mayadate", [False, True])
+    def test_crosses_end_of_long_count(self, as_mayadate):
+        start = LongCount(19, 19, 19, 17, 18)
+        stop = start.add_days(3)
+        if as_mayadate:
+            start, stop = start.get_mayadate(), stop.get_mayadate()
+
+        dates = list(date_range(start, stop))
+        expected = [kin_to_long_count(start.get_total_kin() + i) for i in range(3)]
+
+        if as_mayadate:
+            assert [d.long_count.to_list() for d in dates] == [
+                lc.to_list() for lc in expected
+            ]
+            dates = [d.long_count for d in dates]
+        else:
+            assert [d.to_list() for d in dates] == [lc.to_list() for lc in expected]
+
+        assert dates[-1].to_list() == [20, 0, 0, 0, 0]
+        assert [d._total_kin for d in dates] == [lc.get_total_kin() for lc in expected]
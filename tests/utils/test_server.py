@@ -0,0 +1,220 @@
+import asyncio
+import json
+
+import pytest
+
+from mayacal import LongCount, Mayadate, CalendarRound, Tzolkin, Haab
+from mayacal.utils.server import MayacalServer
+
+
+async def _request(port, method, path, payload=None):
+    """Sends one HTTP request to the local server, returns (status, payload)"""
+
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+
+    body = b"" if payload is None else json.dumps(payload).encode("utf-8")
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\n"
+        "Host: localhost\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        "Connection: close\r\n\r\n".encode("latin-1") + body
+    )
+    await writer.drain()
+
+    response = await reader.read()
+    writer.close()
+
+    head, _, body = response.partition(b"\r\n\r\n")
+    status = int(head.split()[1])
+
+    return status, json.loads(body)
+
+
+def _run_with_server(scenario, **kwargs):
+    """Runs scenario(server) against a server listening on a free port"""
+
+    async def main():
+        server = MayacalServer(port=0, **kwargs)
+        await server.start()
+        try:
+            # fail rather than hang if a request never completes
+            return await asyncio.wait_for(scenario(server), 30)
+        finally:
+            await server.close()
+
+    return asyncio.run(main())
+
+
+class TestMayacalServer:
+    def test_convert(self):
+        date = LongCount(9, 12, 11, 5, 18).get_mayadate()
+
+        async def scenario(server):
+            return await _request(
+                server.port, "POST", "/convert", {"date": date.to_dict()}
+            )
+
+        status, payload = _run_with_server(scenario, workers=1)
+
+        assert status == 200
+        assert payload["julian_day"] == date.to_julian_day()
+        gregorian = date.to_gregorian()
+        assert payload["gregorian"] == {
+            "day": gregorian.day,
+            "month": gregorian.month,
+            "year": gregorian.year,
+        }
+
+    def test_calendar_round_from_string(self):
+        async def scenario(server):
+            return await _request(
+                server.port, "POST", "/calendar-round", {"date": "9.12.11.5.18"}
+            )
+
+        status, payload = _run_with_server(scenario, workers=1)
+
+        assert status == 200
+        assert payload == LongCount(9, 12, 11, 5, 18).get_mayadate().to_dict()
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_infer(self, workers):
+        date = Mayadate(
+            LongCount(9, 4, None, 10, None),
+            CalendarRound(Tzolkin(4, "Ajaw"), Haab(8, "Kumku")),
+        )
+
+        async def scenario(server):
+            return await _request(
+                server.port, "POST", "/infer", {"date": date.to_dict()}
+            )
+
+        status, payload = _run_with_server(scenario, workers=workers)
+
+        assert status == 200
+        assert payload["input"] == date.to_dict()
+        assert payload["candidates"] == [d.to_dict() for d in date.infer_mayadates()]
+
+    def test_errors(self):
+        async def scenario(server):
+            return await asyncio.gather(
+                _request(server.port, "POST", "/convert", {"date": "9.?.11.5.18"}),
+                _request(server.port, "POST", "/infer", {"no_date": 1}),
+                _request(server.port, "GET", "/infer"),
+                _request(server.port, "POST", "/unknown", {"date": "9.12.11.5.18"}),
+            )
+
+        results = _run_with_server(scenario, workers=1)
+
+        assert [status for status, _ in results] == [400, 400, 405, 404]
+        assert all("error" in payload for _, payload in results)
+
+    def test_batches_concurrent_requests(self):
+        dates = [LongCount(9, 12, 11, 5, kin).get_mayadate() for kin in range(20)]
+
+        async def scenario(server):
+            results = await asyncio.gather(
+                *[
+                    _request(server.port, "POST", "/convert", {"date": d.to_dict()})
+                    for d in dates
+                ]
+            )
+            _, stats = await _request(server.port, "GET", "/stats")
+
+            return results, stats
+
+        results, stats = _run_with_server(scenario, workers=1, max_delay=0.05)
+
+        assert [payload["julian_day"] for _, payload in results] == [
+            d.to_julian_day() for d in dates
+        ]
+
+        convert_stats = stats["/convert"]
+        assert convert_stats["requests"] == 20
+        assert convert_stats["errors"] == 0
+        assert convert_stats["batches"] < 20
+        assert convert_stats["mean_batch_size"] > 1
+        assert convert_stats["max_latency_ms"] >= convert_stats["mean_latency_ms"] > 0
+        assert stats["/infer"]["requests"] == 0
+
+    def test_keep_alive(self):
+        async def scenario(server):
+            reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+
+            statuses = []
+            for _ in range(3):
+                writer.write(b"GET /stats HTTP/1.1\r\nHost: localhost\r\n\r\n")
+                await writer.drain()
+
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = int(
+                    [
+                        line.split(b":")[1]
+                        for line in head.split(b"\r\n")
+                        if line.lower().startswith(b"content-length")
+                    ][0]
+                )
+                await reader.readexactly(length)
+                statuses.append(int(head.split()[1]))
+
+            writer.close()
+            return statuses
+
+        assert _run_with_server(scenario, workers=1) == [200, 200, 200]
+
+    def test_invalid_batch_size(self):
+        with pytest.raises(ValueError):
+            MayacalServer(max_batch_size=0)
+
+    def test_internal_error(self):
+        async def scenario(server):
+            def fail(requests):
+                raise RuntimeError("broken")
+
+            server._batchers["/calendar-round"]._process_batch = fail
+            status, payload = await _request(
+                server.port, "POST", "/calendar-round", {"date": "9.12.11.5.18"}
+            )
+            _, stats = await _request(server.port, "GET", "/stats")
+
+            return status, payload, stats
+
+        status, payload, stats = _run_with_server(scenario, workers=1)
+
+        assert status == 500
+        assert "RuntimeError" in payload["error"]
+        assert stats["/calendar-round"]["errors"] == 0
+        assert stats["/calendar-round"]["server_errors"] == 1
+
+    def test_slow_batch_does_not_block(self):
+        async def scenario(server):
+            release = asyncio.Event()
+
+            async def slow(requests):
+                await release.wait()
+                return [(200, {"slow": True})] * len(requests)
+
+            batcher = server._batchers["/infer"]
+            fast = batcher._process_batch
+            batcher._process_batch = slow
+            slow_request = asyncio.ensure_future(
+                _request(server.port, "POST", "/infer", {"date": "9.12.11.5.18"})
+            )
+            await asyncio.sleep(0.1)
+
+            batcher._process_batch = fast
+            result = await _request(
+                server.port, "POST", "/infer", {"date": "9.12.11.5.18"}
+            )
+            release.set()
+
+            return result, await slow_request
+
+        (status, payload), (slow_status, slow_payload) = _run_with_server(
+            scenario, workers=1
+        )
+
+        assert status == 200
+        assert [c["long_count"] for c in payload["candidates"]] == [
+            LongCount(9, 12, 11, 5, 18).to_dict()
+        ]
+        assert slow_payload == {"slow": True}
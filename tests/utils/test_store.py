@@ -0,0 +1,97 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from mayacal import LongCount, Mayadate, CalendarRound, Tzolkin, Haab, kin_to_long_count
+from mayacal.utils.store import MayadateStore, write_store, STORE_RECORD_DTYPE
+
+
+@pytest.fixture
+def example_dates():
+    return [
+        LongCount(9, 12, 11, 5, 18).get_mayadate(),
+        Mayadate(
+            LongCount(9, 4, None, 10, None),
+            CalendarRound(Tzolkin(4, "Ajaw"), Haab(8, "Kumku")),
+        ),
+        Mayadate(LongCount(None, 12, 11, 5, 18), CalendarRound(Tzolkin(6, None))),
+        Mayadate(),
+        Mayadate(LongCount(9, 12, 11, 5, None), glyph_g="G3"),
+    ]
+
+
+@pytest.fixture
+def example_store(example_dates, tmp_path):
+    path = str(tmp_path / "dates.maya")
+    write_store(example_dates, path)
+
+    return MayadateStore(path)
+
+
+class TestMayadateStore:
+    def test_record_size(self):
+        assert STORE_RECORD_DTYPE.itemsize == 18
+
+    def test_round_trip_overridden_calendar_round(self, tmp_path):
+        cr = CalendarRound(Tzolkin(4, "Ajaw"), Haab(9, "Kumku"), True)
+        date = Mayadate(LongCount(9, None, None, None, None), cr)
+
+        path = str(tmp_path / "dates.maya")
+        write_store([date], path)
+        stored = MayadateStore(path)[0]
+
+        assert stored.to_dict() == date.to_dict()
+        assert not stored.calendar_round.valid
+
+    def test_round_trip(self, example_dates, example_store):
+        assert len(example_store) == len(example_dates)
+
+        for date, stored in zip(example_dates, example_store):
+            assert stored.to_dict() == date.to_dict()
+
+        assert example_store[-1].to_dict() == example_dates[-1].to_dict()
+
+    def test_column_views(self, example_dates, example_store):
+        assert isinstance(example_store.records, np.memmap)
+        assert example_store.total_kin.tolist() == [
+            LongCount(9, 12, 11, 5, 18).get_total_kin(),
+            -1,
+            -1,
+            -1,
+            -1,
+        ]
+        assert example_store.column("katun").tolist() == [12, 4, 12, 0, 12]
+        assert example_store.is_missing("katun").tolist() == [
+            False,
+            False,
+            False,
+            True,
+            False,
+        ]
+        assert example_store.calendar_round_index[:2].tolist() == [
+            example_dates[0].calendar_round.index,
+            example_dates[1].calendar_round.index,
+        ]
+
+        with pytest.raises(ValueError):
+            example_store.total_kin[0] = 0
+
+    def test_to_long_count_array(self, tmp_path):
+        path = str(tmp_path / "complete.maya")
+        kins = [0, 1000, 1366560]
+        write_store((kin_to_long_count(k).get_mayadate() for k in kins), path)
+
+        assert MayadateStore(path).to_long_count_array().to_kin().tolist() == kins
+
+    def test_empty_store(self, tmp_path):
+        path = str(tmp_path / "empty.maya")
+
+        assert write_store([], path) == 0
+        assert len(MayadateStore(path)) == 0
+
+    def test_invalid_file(self, tmp_path):
+        path = tmp_path / "invalid.maya"
+        path.write_bytes(b"not a maya date store")
+
+        with pytest.raises(ValueError):
+            MayadateStore(str(path))
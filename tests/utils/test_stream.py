@@ -0,0 +1,124 @@
+import io
+import json
+
+import pytest
+
+from mayacal import LongCount, Mayadate, CalendarRound, Tzolkin, Haab
+from mayacal.__main__ import main
+from mayacal.utils.stream import read_jsonl, process_jsonl, convert_jsonl
+
+
+@pytest.fixture
+def example_lines():
+    partial = Mayadate(
+        LongCount(9, 4, None, 10, None),
+        CalendarRound(Tzolkin(4, "Ajaw"), Haab(8, "Kumku")),
+    )
+    complete = LongCount(9, 0, 13, 2, 10).get_mayadate()
+
+    return [
+        json.dumps(partial.to_dict()) + "\n",
+        "{not json\n",
+        "\n",
+        json.dumps(complete.to_dict()) + "\n",
+        json.dumps({"long_count": [9, 0, 0, 0, 0]}) + "\n",
+    ]
+
+
+class TestStream:
+    def test_read_jsonl(self, example_lines):
+        rejected = []
+        dates = list(
+            read_jsonl(example_lines, on_error=lambda *args: rejected.append(args))
+        )
+
+        assert [line_number for line_number, _ in dates] == [1, 4]
+        assert str(dates[1][1]) == "9.0.13.2.10  6 Ok 18 Sak"
+        assert [line_number for line_number, _, _ in rejected] == [2, 5]
+
+    def test_read_jsonl_is_lazy(self):
+        def lines():
+            yield json.dumps(LongCount(9, 0, 0, 0, 0).get_mayadate().to_dict())
+            raise AssertionError("Read past the first record")
+
+        line_number, date = next(read_jsonl(lines()))
+        assert line_number == 1
+
+    def test_process_jsonl_infer(self, example_lines):
+        results = list(process_jsonl(example_lines, mode="infer", on_error=print))
+
+        assert len(results) == 2
+        candidates = [c["long_count"] for c in results[0][1]["candidates"]]
+        assert candidates == [LongCount(9, 4, 10, 10, 0).to_dict()]
+
+    def test_process_jsonl_convert_rejects_partial_dates(self, example_lines):
+        rejected = []
+        results = list(
+            process_jsonl(
+                example_lines,
+                mode="convert",
+                on_error=lambda *args: rejected.append(args[0]),
+            )
+        )
+
+        assert [line_number for line_number, _ in results] == [4]
+        assert results[0][1]["gregorian"] == {"day": 20, "month": 11, "year": 448}
+        assert rejected == [1, 2, 5]
+
+    def test_process_jsonl_invalid_mode(self, example_lines):
+        with pytest.raises(ValueError):
+            process_jsonl(example_lines, mode="unknown")
+
+    def test_convert_jsonl_writes_in_chunks(self, example_lines):
+        class CountingWriter(io.StringIO):
+            writes = 0
+
+            def writelines(self, lines):
+                self.writes += 1
+                super().writelines(lines)
+
+        lines = [example_lines[3]] * 5
+        destination, errors = CountingWriter(), io.StringIO()
+
+        num_written, num_failed = convert_jsonl(
+            lines, destination, mode="normalize", errors=errors, chunk_size=2
+        )
+
+        assert (num_written, num_failed) == (5, 0)
+        assert destination.writes == 3
+        assert len(destination.getvalue().splitlines()) == 5
+
+    def test_convert_jsonl_error_side_channel(self, example_lines):
+        destination, errors = io.StringIO(), io.StringIO()
+
+        num_written, num_failed = convert_jsonl(
+            example_lines, destination, mode="infer", errors=errors
+        )
+
+        assert (num_written, num_failed) == (2, 2)
+        rejected = [json.loads(line) for line in errors.getvalue().splitlines()]
+        assert [r["line"] for r in rejected] == [2, 5]
+        assert rejected[0]["record"] == "{not json"
+
+    def test_command_line(self, example_lines, tmp_path):
+        input_path = tmp_path / "input.jsonl"
+        input_path.write_text("".join(example_lines))
+        output_path = tmp_path / "output.jsonl"
+        errors_path = tmp_path / "errors.jsonl"
+
+        exit_code = main(
+            [
+                "convert",
+                str(input_path),
+                "-o",
+                str(output_path),
+                "-m",
+                "convert",
+                "-e",
+                str(errors_path),
+            ]
+        )
+
+        assert exit_code == 1
+        assert len(output_path.read_text().splitlines()) == 1
+        assert len(errors_path.read_text().splitlines()) == 3
@@ -0,0 +1,152 @@
+import pytest
+
+from mayacal import LongCount, Mayadate, CalendarRound, Tzolkin, Haab, kin_to_long_count
+from mayacal.utils.supplementary import (
+    LORDS_OF_THE_NIGHT,
+    STATION_819_COLORS,
+    SYNODIC_MONTH,
+    days_since_819_station,
+    direction_819_index,
+    lord_of_the_night,
+    moon_age,
+    moon_age_matches,
+)
+
+
+class TestSupplementarySeries:
+    def test_lord_of_the_night_matches_glyph_g(self):
+        for k in range(0, 3000, 7):
+            lc = kin_to_long_count(k)
+            assert LORDS_OF_THE_NIGHT[lord_of_the_night(k) - 1] == lc.get_glyph_g()
+            assert lc.get_lord_of_the_night() == lord_of_the_night(k)
+
+    def test_819_stations(self):
+        # the station before the zero date
+        assert days_since_819_station(0) == 3
+        assert days_since_819_station(816) == 0
+
+        # stations always fall on a day numbered 1 and move back one day name
+        directions = []
+        for n in range(8):
+            lc = kin_to_long_count(819 * n + 816)
+            assert lc.get_calendar_round().tzolkin.day_number == 1
+            directions.append(lc.get_819_direction())
+
+        assert directions == ["south", "west", "north", "east"] * 2
+        assert kin_to_long_count(816).get_819_color() == "yellow"
+        assert set(STATION_819_COLORS) == {"east", "south", "west", "north"}
+
+    def test_direction_follows_station_day_name(self):
+        east = {"Imix", "Chikchan", "Muluk", "Ben", "Kaban"}
+        for n in range(20):
+            lc = kin_to_long_count(819 * n + 816)
+            is_east = lc.get_calendar_round().tzolkin.day_name in east
+            assert is_east == (lc.get_819_direction() == "east")
+
+    def test_moon_age(self):
+        # new moon of 6 January 2000 at Julian Day 2451550.1
+        lc = kin_to_long_count(2451550 - 584283)
+
+        assert lc.get_moon_age() == pytest.approx(SYNODIC_MONTH - 0.1)
+        assert lc.get_moon_age(584285) == pytest.approx(1.9)
+        assert moon_age(lc.get_total_kin() + 30) == pytest.approx(0.369411147)
+
+    def test_moon_age_matches_wraps_around(self):
+        k = 2451550 - 584283
+
+        assert moon_age_matches(k, 0)
+        assert moon_age_matches(k, 29)
+        assert not moon_age_matches(k, 15)
+
+    def test_partial_long_count(self):
+        lc = LongCount(9, None, None, 5, 18)
+
+        assert lc.get_lord_of_the_night() == 1
+        with pytest.raises(ValueError):
+            lc.get_819_station()
+
+
+class TestSupplementaryConstraints:
+    @pytest.fixture
+    def date(self):
+        return LongCount(9, 12, 11, 5, 18).get_mayadate()
+
+    def test_constructor_checks_complete_dates(self, date):
+        lc = date.long_count
+
+        Mayadate(
+            lc,
+            lord_of_the_night=1,
+            station_819=date.get_819_station(),
+            direction_819=date.get_819_direction(),
+            moon_age=round(date.get_moon_age()),
+        )
+
+        with pytest.raises(ValueError):
+            Mayadate(lc, lord_of_the_night=2)
+        with pytest.raises(ValueError):
+            Mayadate(lc, glyph_g="G1", lord_of_the_night=2)
+        with pytest.raises(ValueError):
+            Mayadate(lc, station_819=(date.get_819_station() + 1) % 819)
+        with pytest.raises(ValueError):
+            Mayadate(lc, direction_819="north")
+        with pytest.raises(ValueError):
+            Mayadate(lc, moon_age=(date.get_moon_age() + 10) % SYNODIC_MONTH)
+
+    def test_invalid_values(self):
+        with pytest.raises(ValueError):
+            Mayadate(lord_of_the_night=0)
+        with pytest.raises(ValueError):
+            Mayadate(station_819=819)
+        with pytest.raises(ValueError):
+            Mayadate(direction_819="up")
+
+    def test_properties(self, date):
+        partial = Mayadate(LongCount(9, 12, None, 5, 18), station_819=10, moon_age=3)
+
+        assert partial.station_819 == 10
+        assert partial.direction_819 is None
+        assert partial.moon_age == 3
+        assert partial.glyph_g == "G1"
+
+        assert date.station_819 == date.get_819_station()
+        assert date.direction_819 == date.get_819_direction()
+        assert date.moon_age is None
+
+    def test_constraints_narrow_inference(self, date):
+        cr = date.calendar_round
+        partial = Mayadate(LongCount(None, None, None, None, None), cr)
+        candidates = partial.infer_long_count_dates()
+
+        constrained = Mayadate(
+            LongCount(None, None, None, None, None),
+            cr,
+            station_819=date.get_819_station(),
+            direction_819=date.get_819_direction(),
+        )
+        assert constrained.infer_long_count_dates() == [
+            lc
+            for lc in candidates
+            if lc.get_819_station() == date.get_819_station()
+            and lc.get_819_direction() == date.get_819_direction()
+        ]
+        assert date.long_count in constrained.infer_long_count_dates()
+
+        for kwargs in (
+            {"station_819": date.get_819_station()},
+            {"direction_819": date.get_819_direction()},
+            {"moon_age": date.get_moon_age()},
+        ):
+            results = Mayadate(
+                LongCount(None, None, None, None, None), cr, **kwargs
+            ).infer_long_count_dates()
+            assert date.long_count in results
+            assert len(results) < len(candidates)
+
+    def test_hash_includes_constraints(self):
+        lc = LongCount(9, 12, None, 5, 18)
+        cr = CalendarRound(Tzolkin(6, "Etznab"), Haab(11, "Yax"))
+
+        assert Mayadate(lc, cr, station_819=1) == Mayadate(lc, cr, station_819=1)
+        assert Mayadate(lc, cr, station_819=1) != Mayadate(lc, cr, station_819=2)
+        assert Mayadate(lc, cr, station_819=1) != Mayadate(lc, cr)
@@ -0,0 +1,62 @@
+import copy
+import pickle
+
+import pytest
+
+from mayacal import Tzolkin, LongCount
+
+
+class TestTzolkin:
+    def test_of_returns_interned_instance(self):
+        assert Tzolkin.of(159) is Tzolkin.of(159)
+        assert Tzolkin.of(159) == Tzolkin(4, "Ajaw")
+
+    def test_add_days_returns_interned_instance(self):
+        tzolkin = Tzolkin(4, "Ajaw")
+
+        assert tzolkin.add_days(260) is Tzolkin.of(159)
+        assert tzolkin.add_days(1) is Tzolkin.of(160)
+
+    def test_interned_instance_is_immutable(self):
+        tzolkin = Tzolkin.of(0)
+
+        with pytest.raises(AttributeError):
+            tzolkin.day_number = 5
+
+        with pytest.raises(AttributeError):
+            tzolkin.add_days(1, in_place=True)
+
+        assert str(tzolkin) == "1 Imix"
+
+    def test_in_place_on_long_count_calendar_round_raises(self):
+        # Calendar Rounds computed from a Long Count share interned objects
+        tzolkin = LongCount(9, 12, 11, 5, 18).get_calendar_round().tzolkin
+
+        with pytest.raises(AttributeError, match="add_days without in_place"):
+            tzolkin.add_days(1, in_place=True)
+        with pytest.raises(AttributeError):
+            tzolkin.reset_by_tzolkin_num(0)
+
+        assert str(tzolkin) == "6 Etznab"
+        assert (
+            str(LongCount(9, 12, 11, 5, 18).get_calendar_round().tzolkin) == "6 Etznab"
+        )
+        assert str(tzolkin.add_days(1)) == "7 Kawak"
+
+    def test_add_days_in_place(self):
+        tzolkin = Tzolkin(1, "Imix")
+        result = tzolkin.add_days(21, in_place=True)
+
+        assert result is tzolkin
+        assert str(tzolkin) == "9 Ik"
+
+    def test_interned_instance_round_trip(self):
+        tzolkin = Tzolkin.of(42)
+
+        assert pickle.loads(pickle.dumps(tzolkin)) is tzolkin
+        assert copy.deepcopy(tzolkin) is tzolkin
+
+    @pytest.mark.parametrize("num", [-1, 260])
+    def test_of_invalid(self, num):
+        with pytest.raises(ValueError):
+            Tzolkin.of(num)
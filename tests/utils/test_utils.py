@@ -59,6 +59,23 @@ class TestGregorianDate:
         result = gregorian_date.to_julian()
         assert result == expected_julian_date
 
+    @pytest.mark.parametrize(
+        "gregorian_date, expected_jdn",
+        [
+            (GregorianDate(10, 1, 2022), 2459590),
+            (GregorianDate(22, 3, 683), 1970601),
+            (GregorianDate(1, 3, 0), 1721120),
+            (GregorianDate(28, 2, 0), 1721118),
+            (GregorianDate(24, 11, -4713), 0),
+        ],
+    )
+    def test_jdn_round_trip(self, gregorian_date, expected_jdn):
+        jdn = gregorian_date.to_jdn()
+
+        assert type(jdn) is int
+        assert jdn == expected_jdn
+        assert GregorianDate.from_jdn(jdn) == gregorian_date
+
 
 class TestJulianDate:
     @pytest.mark.parametrize(
@@ -110,6 +127,25 @@ class TestJulianDate:
         result = julian_date.to_gregorian()
         assert result == expected_gregorian_date
 
+    @pytest.mark.parametrize(
+        "julian_date, expected_jdn",
+        [
+            (JulianDate(19, 3, 427), 1877097),
+            (JulianDate(29, 2, 0), 1721117),
+            (JulianDate(1, 1, -4712), 0),
+        ],
+    )
+    def test_jdn_round_trip(self, julian_date, expected_jdn):
+        jdn = julian_date.to_jdn()
+
+        assert type(jdn) is int
+        assert jdn == expected_jdn
+        assert JulianDate.from_jdn(jdn) == julian_date
+
+    def test_from_jdn_negative_raises(self):
+        with pytest.raises(ValueError):
+            JulianDate.from_jdn(-1)
+
 
 @pytest.mark.parametrize(
     "julian_day, gregorian_date",
@@ -161,3 +197,38 @@ def test_convert_julian_day(
     assert month == expected_month
 
     assert year == expected_year
+
+
+class TestBatchConversion:
+    @pytest.mark.parametrize("mode", ["julian", "gregorian"])
+    def test_matches_scalar_conversion(self, mode):
+        np = pytest.importorskip("numpy")
+        from mayacal.utils.utils import julian_days_to_julian, julian_days_to_gregorian
+
+        convert = {
+            "julian": julian_days_to_julian,
+            "gregorian": julian_days_to_gregorian,
+        }[mode]
+
+        julian_days = np.arange(0, 3000000, 997)
+        days, months, years = convert(julian_days)
+
+        for jd, day, month, year in zip(julian_days, days, months, years):
+            assert (day, month, year) == _convert_julian_day(int(jd), mode=mode)
+
+    def test_fractional_julian_days(self):
+        pytest.importorskip("numpy")
+        from mayacal.utils.utils import julian_days_to_gregorian
+
+        days, months, years = julian_days_to_gregorian([2459589.5, 1970601])
+
+        assert list(days) == [10, 22]
+        assert list(months) == [1, 3]
+        assert list(years) == [2022, 683]
+
+    def test_negative_julian_day(self):
+        pytest.importorskip("numpy")
+        from mayacal.utils.utils import julian_days_to_julian
+
+        with pytest.raises(ValueError):
+            julian_days_to_julian([10, -1])